@@ -0,0 +1,77 @@
+"""
+
+animated_lights.py
+
+Compares animated Light files with constant channels only, with shared curves, and with keyframe reduction:
+file size, Export and Import time, and number of keys set in Houdini.
+
+Usage:
+    python benchmarks/animated_lights.py [number of lights] [number of frames]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene, animate_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic
+
+
+def quiet(function, *args, **kwargs):
+    """
+    Run a function without its messages.
+    """
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return function(*args, **kwargs)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 96
+    build_maya_scene(cmds, count)
+    animate_maya_scene(cmds, count)
+    sys.stdout.write("{0} lights, {1} frames\n".format(count, frames))
+
+    folder = tempfile.mkdtemp()
+    keyed = None
+    for label, deduplicate, tolerance in [("constant channels", False, None), ("shared curves", True, None),
+                                          ("reduced 1e-3", True, 1e-3)]:
+        path = os.path.join(folder, "{0}.json".format(label.replace(" ", "_")))
+        start = time.time()
+        quiet(maya_logic.export_animation_file, path, 1, frames, 1, deduplicate, tolerance)
+        export_time = time.time() - start
+
+        hou.reset()
+        start = time.time()
+        houdini_logic.import_json_file(path, 0.1, True, True)
+        import_time = time.time() - start
+
+        keys = 0
+        curves = {}
+        for node in hou.node("/obj").children():
+            for parm, parm_keys in node.keyframeValues().items():
+                keys += len(parm_keys)
+                curves[(node.name(), parm)] = parm_keys
+
+        sys.stdout.write("  {0:<18} {1:>10} bytes  export {2:.3f}s  import {3:.3f}s  {4:>7} keys "
+                         "({5} with a key on every frame)\n"
+                         .format(label, os.path.getsize(path), export_time, import_time, keys, len(curves) * frames))
+
+        # Sharing curves doesn't change the imported keys
+        if deduplicate and tolerance is None and curves != keyed:
+            raise RuntimeError("Shared curves give different keys")
+        keyed = curves
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+
+color_temperature.py
+
+Counts the cmds.arnoldTemperatureToColor calls made by maya_logic.export_json_file on a synthetic scene,
+once per Light with a Color Temperature against once per unique Color Temperature, and checks that Lights exported
+in Kelvin import with the same Colors as Lights exported in RGB.
+
+Usage:
+    python benchmarks/color_temperature.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic, color_temperature
+
+
+def uncached_temperature_color(kelvin, converter=None):
+    """
+    Previous behaviour: one Arnold conversion per Light.
+    """
+    return converter(kelvin)
+
+
+def run_export(path, label, kelvin=False):
+    color_temperature.clear_temperature_samples()
+    cmds.calls["arnoldTemperatureToColor"] = 0
+    start = time.time()
+    maya_logic.export_json_file(path, use_cache=False, kelvin=kelvin)
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<10} {1:>6} arnoldTemperatureToColor  {2:.3f}s\n".format(
+        label, cmds.calls["arnoldTemperatureToColor"], elapsed))
+
+
+def run_import(path):
+    # New Houdini session, the Color Temperatures are resolved from the file only
+    hou.reset()
+    color_temperature.clear_temperature_samples()
+    houdini_logic.import_json_file(path, 0.1, True, True)
+    return dict((node.path(), node.parmValues()) for node in hou.root.allSubChildren())
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    build_maya_scene(cmds, count)
+    sys.stdout.write("{0} lights\n".format(count))
+
+    directory = tempfile.mkdtemp()
+    rgb_path = os.path.join(directory, "rgb.json")
+    kelvin_path = os.path.join(directory, "kelvin.json")
+
+    temperature_color = maya_logic.temperature_color
+    maya_logic.temperature_color = uncached_temperature_color
+    try:
+        run_export(rgb_path, "per Light")
+    finally:
+        maya_logic.temperature_color = temperature_color
+    run_export(rgb_path, "cached")
+    run_export(kelvin_path, "Kelvin", True)
+
+    if run_import(rgb_path) != run_import(kelvin_path):
+        raise RuntimeError("Lights exported in Kelvin import with different Colors")
+
+
+if __name__ == "__main__":
+    main()
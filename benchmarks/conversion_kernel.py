@@ -0,0 +1,108 @@
+"""
+
+conversion_kernel.py
+
+Times the scalar conversion (resolve_light on every Light) against the batched conversion kernel (resolve_lights)
+on synthetic exported Lights, and checks that both give bit-identical values.
+
+Usage:
+    python benchmarks/conversion_kernel.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import maya.cmds as cmds
+from logic import maya_logic, conversion_kernel
+from logic.batch_convert import batch_size
+from logic.light_conversion import resolve_light
+from logic.light_file import load_light_file, world_matrix_key
+
+# Number of distinct Lights exported from the synthetic scene, repeated up to the number of Lights
+scene_lights = 5000
+
+
+def moved_light(light_json, offset):
+    """
+    Copy of an exported Light with its World Matrix translated, so every repeated Light has its own World Matrix.
+    :param light_json: Exported Light data
+    :param offset: Translation along X
+    :return: Exported Light data
+    """
+    moved = dict(light_json)
+    for renderer, renderer_parms in light_json.items():
+        if isinstance(renderer_parms, dict) and world_matrix_key in renderer_parms:
+            matrix = list(renderer_parms[world_matrix_key])
+            matrix[12] += offset
+            moved[renderer] = dict(renderer_parms)
+            moved[renderer][world_matrix_key] = matrix
+
+    return moved
+
+
+def exported_lights(count):
+    """
+    Exported Lights of a synthetic scene, repeated under new names and moved up to count Lights.
+    :param count: Number of Lights
+    :return: List of (Light name, Exported Light data)
+    """
+    build_maya_scene(cmds, min(count, scene_lights))
+    path = os.path.join(tempfile.mkdtemp(), "lights.json")
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        maya_logic.export_json_file(path, use_cache=False)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    scene = list(load_light_file(path).items())
+    return [("{0}_{1}".format(scene[index % len(scene)][0], index),
+             moved_light(scene[index % len(scene)][1], float(index // len(scene))))
+            for index in range(count)]
+
+
+def timed(label, function):
+    start = time.time()
+    result = function()
+    sys.stdout.write("  {0:<24} {1:.3f}s\n".format(label, time.time() - start))
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    renderers = ["Mantra", "Arnold"]
+    lights = exported_lights(count)
+    sys.stdout.write("{0} lights, Mantra and Arnold, NumPy {1}\n"
+                     .format(count, "installed" if conversion_kernel.numpy else "not installed"))
+
+    scalar = timed("scalar", lambda: [resolve_light(light, light_json, 0.1, renderers)
+                                      for light, light_json in lights])
+    batched = timed("kernel", lambda: conversion_kernel.resolve_lights(lights, 0.1, renderers))
+
+    # Batches of the Batch Conversion
+    timed("kernel in batches", lambda: [conversion_kernel.resolve_lights(lights[index:index + batch_size], 0.1,
+                                                                         renderers)
+                                        for index in range(0, count, batch_size)])
+
+    # Plain Python columns when NumPy is installed too
+    if conversion_kernel.numpy:
+        numpy = conversion_kernel.numpy
+        conversion_kernel.numpy = None
+        try:
+            timed("kernel without NumPy", lambda: conversion_kernel.resolve_lights(lights, 0.1, renderers))
+        finally:
+            conversion_kernel.numpy = numpy
+
+    # repr keeps the value types and the float digits
+    if repr(scalar) != repr(batched):
+        raise RuntimeError("Conversion kernel gives different values")
+
+
+if __name__ == "__main__":
+    main()
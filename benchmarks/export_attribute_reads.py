@@ -0,0 +1,40 @@
+"""
+
+export_attribute_reads.py
+
+Counts the maya.cmds and maya.api.OpenMaya calls made by maya_logic.export_json_file on a synthetic scene.
+
+Usage:
+    python benchmarks/export_attribute_reads.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+from logic import maya_logic
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    build_maya_scene(cmds, count)
+    om.reset()
+
+    path = os.path.join(tempfile.mkdtemp(), "lights.json")
+    start = time.time()
+    maya_logic.export_json_file(path)
+    elapsed = time.time() - start
+
+    sys.stdout.write("{0} lights exported in {1:.3f}s\n".format(count, elapsed))
+    for command, number in sorted(list(cmds.calls.items()) + list(om.calls.items())):
+        sys.stdout.write("  {0}: {1} ({2:.1f} per light)\n".format(command, number, float(number) / count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+
+import_notifications.py
+
+Counts Houdini parameter notifications made by houdini_logic.import_json_file on synthetic Lights,
+setting every Parameter on its own against setting them in bulk with setParms.
+
+Usage:
+    python benchmarks/import_notifications.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic
+
+
+def apply_parms_one_by_one(light_obj, parms, ordered_parms=()):
+    """
+    Previous behaviour: one Parm.set() per Parameter.
+    """
+    for parm, value in parms.items():
+        light_obj.parm(parm).set(value)
+
+
+def run_import(path, label):
+    hou.reset()
+    start = time.time()
+    houdini_logic.import_json_file(path, 0.1, True, True)
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<12} {1:>8} notifications  {2:.3f}s\n".format(label, hou.calls["notifications"], elapsed))
+    return dict((node.path(), node.parmValues()) for node in hou.root.allSubChildren())
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    build_maya_scene(cmds, count)
+
+    path = os.path.join(tempfile.mkdtemp(), "lights.json")
+    maya_logic.export_json_file(path)
+    sys.stdout.write("{0} lights, Mantra and Arnold\n".format(count))
+
+    apply_parms = houdini_logic.apply_parms
+    houdini_logic.apply_parms = apply_parms_one_by_one
+    try:
+        one_by_one = run_import(path, "Parm.set")
+    finally:
+        houdini_logic.apply_parms = apply_parms
+    bulk = run_import(path, "setParms")
+
+    if one_by_one != bulk:
+        raise RuntimeError("Bulk setParms gives different parameter values")
+
+
+if __name__ == "__main__":
+    main()
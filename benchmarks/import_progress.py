@@ -0,0 +1,95 @@
+"""
+
+import_progress.py
+
+Times every phase of houdini_logic.import_json_file on a synthetic scene, with Lights read and converted on a worker
+thread while Nodes are created, checks that a cancelled Import keeps only fully imported Lights, and that an updating
+Import after it gives the same Lights as an uncancelled Import, also for Lights with fewer Light Contributions in
+Houdini than in the file.
+
+Usage:
+    python benchmarks/import_progress.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic
+from logic.progress import new_timings, timings_message, progress_message
+
+
+def scene_parms():
+    return dict((node.path(), node.parmValues()) for node in hou.root.allSubChildren())
+
+
+def evaluated_parms(scene):
+    # Parameters of the Nodes of a Scene evaluated on the current Scene, unset multiparm instances have their default
+    return dict((path, dict((name, hou.node(path).parm(name).eval() if hou.node(path).parm(name) else None)
+                            for name in parms))
+                for path, parms in scene.items() if hou.node(path) is not None)
+
+
+def run_import(path, label, update=False, cancel_at=None):
+    """
+    Import the Lights, cancelled after cancel_at Lights if given.
+    """
+    timings = new_timings()
+    progress = {"count": 0, "message": ""}
+    started = time.time()
+
+    def import_progress(light_count, file_progress):
+        progress["count"] = light_count
+        progress["message"] = progress_message("Importing Lights", light_count, file_progress, started)
+        return cancel_at is not None and light_count >= cancel_at
+
+    registry = houdini_logic.import_json_file(path, 0.1, True, True, import_progress, update, timings=timings)
+    sys.stdout.write("  {0:<10} {1:>6} Lights  {2:.3f}s  {3}\n".format(label, progress["count"], time.time() - started,
+                                                                       timings_message(timings)))
+    sys.stdout.write("  {0:<10} {1}\n".format("", progress["message"]))
+    return registry
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    build_maya_scene(cmds, count)
+    sys.stdout.write("{0} lights\n".format(count))
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "lights.jsonl")
+    maya_logic.export_json_file(path)
+
+    # Uncancelled Import
+    hou.reset()
+    run_import(path, "full")
+    expected = scene_parms()
+
+    # Cancelled Import, then the rest of the Lights
+    hou.reset()
+    if run_import(path, "cancelled", cancel_at=count // 2) is not None:
+        raise RuntimeError("Cancelled Import should return None")
+    lights = len(houdini_logic.obj.children())
+    if lights != 2 * (count // 2):
+        raise RuntimeError("Cancelled Import left {0} Light Nodes".format(lights))
+    if threading.active_count() != 1:
+        raise RuntimeError("Cancelled Import left its worker thread running")
+
+    # Light Contributions removed in Houdini, their multiparm instances don't exist until the update adds them back
+    for light_obj in houdini_logic.obj.children():
+        if light_obj.parm("light_contrib") is not None and light_obj.parm("light_contrib").eval() > 1:
+            light_obj.parm("light_contrib").set(1)
+    run_import(path, "update", update=True)
+
+    if set(scene_parms()) != set(expected) or evaluated_parms(expected) != expected:
+        raise RuntimeError("Cancelled and updated Import differs from a full Import")
+
+
+if __name__ == "__main__":
+    main()
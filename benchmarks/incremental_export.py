@@ -0,0 +1,68 @@
+"""
+
+incremental_export.py
+
+Times maya_logic.export_json_file on a synthetic scene when every Light is sampled,
+when nothing changed since the previous Export, and when one Light was tweaked, moved or driven by a connection.
+
+Usage:
+    python benchmarks/incremental_export.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import maya.cmds as cmds
+from logic import maya_logic
+
+
+def run_export(path, label, count, use_cache=True):
+    cmds.calls.clear()
+
+    # Keep the Export message out of the output
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        start = time.time()
+        maya_logic.export_json_file(path, use_cache=use_cache)
+        elapsed = time.time() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    sys.stdout.write("  {0:<20} {1:.3f}s  {2:>7} getAttr calls ({3:.2f} per light)\n"
+                     .format(label, elapsed, cmds.calls["getAttr"], float(cmds.calls["getAttr"]) / count))
+    with open(path, "r") as json_file:
+        return json_file.read()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    build_maya_scene(cmds, count)
+
+    # Intensity of one Light driven by another node, it only gets dirty when the driver is set
+    cmds.add_node("|driver", "transform", {"intensity": cmds.getAttr("|lights|light12.intensity")})
+    cmds.connectAttr("|driver.intensity", "|lights|light12.intensity")
+    sys.stdout.write("{0} lights\n".format(count))
+
+    path = os.path.join(tempfile.mkdtemp(), "lights.json")
+    cached = None
+    for label, plug in [("full", None), ("unchanged", None), ("one light tweaked", "|lights|light5.intensity"),
+                        ("one light moved", "|lights|light9.translateX"),
+                        ("one light driven", "|driver.intensity")]:
+        if plug:
+            cmds.setAttr(plug, cmds.getAttr(plug) + 1.0)
+        cached = run_export(path, label, count, use_cache=label != "full")
+
+    # The cached Export has to match a fresh one
+    if run_export(path, "fresh check", count, use_cache=False) != cached:
+        raise RuntimeError("Cached Export differs from a fresh Export")
+
+
+if __name__ == "__main__":
+    main()
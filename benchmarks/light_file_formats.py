@@ -0,0 +1,61 @@
+"""
+
+light_file_formats.py
+
+Compares size and load time of the Json, Json Lines and Binary Light Rig formats on synthetic Lights,
+and checks that every format round-trips to the same data.
+
+Usage:
+    python benchmarks/light_file_formats.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import maya.cmds as cmds
+from logic import maya_logic
+from logic.light_file import load_light_file, convert_light_file
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    build_maya_scene(cmds, count)
+
+    folder = tempfile.mkdtemp()
+    json_path = os.path.join(folder, "lights.json")
+    maya_logic.export_json_file(json_path)
+    reference = load_light_file(json_path)
+
+    paths = [("Json", json_path),
+             ("Json Lines", os.path.join(folder, "lights.jsonl")),
+             ("Binary", os.path.join(folder, "lights_raw.mhl")),
+             ("Binary zlib", os.path.join(folder, "lights.mhl"))]
+
+    convert_light_file(json_path, paths[1][1])
+    convert_light_file(json_path, paths[2][1], compress=False)
+    convert_light_file(json_path, paths[3][1])
+
+    json_size = os.path.getsize(json_path)
+    json_time = None
+    sys.stdout.write("{0} lights\n".format(count))
+    for name, path in paths:
+        start = time.time()
+        lights = load_light_file(path)
+        elapsed = time.time() - start
+        json_time = json_time or elapsed
+
+        if lights != reference:
+            raise RuntimeError("{0} does not round-trip".format(name))
+
+        size = os.path.getsize(path)
+        sys.stdout.write("  {0:<12} {1:>10} bytes ({2:5.1f}x smaller)  load {3:.3f}s ({4:4.1f}x faster)\n".format(
+            name, size, float(json_size) / size, elapsed, json_time / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+
+light_naming.py
+
+Counts the Lights lost to name collisions by the previous naming, where "|" was converted to "_",
+against the unique names of maya_logic.lights_list, and the Houdini Node lookups made by
+houdini_logic.import_json_file on a first Import and on an updating second Import.
+
+Usage:
+    python benchmarks/light_naming.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic
+
+
+def collide_paths(count):
+    """
+    Move every other Light so its path gives the same previous name as its neighbour: "|set3|key_a" and "|set3_key|a".
+    :param count: Number of Lights
+    :return: None
+    """
+    moved = {}
+    for index in range(count):
+        old = "|lights|light{0}".format(index)
+        new = "|set{0}|key_a".format(index // 2) if index % 2 == 0 else "|set{0}_key|a".format(index // 2)
+        moved[old] = new
+        transform = cmds.scene.pop(old)
+        cmds.add_node(new, transform["nodeType"], transform["attributes"], None)
+        cmds.scene[new]["connections"] = transform.get("connections", {})
+        for child in cmds.children.pop(old, []):
+            shape = cmds.scene.pop(child)
+            cmds.add_node("{0}|{1}".format(new, child.split("|")[-1]), shape["nodeType"], shape["attributes"], new)
+    cmds.selection[:] = [moved[light] for light in cmds.selection]
+    cmds.calls.clear()
+
+
+def run_import(path, label, update):
+    hou.calls.clear()
+    start = time.time()
+    houdini_logic.import_json_file(path, 0.1, True, True, update=update)
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<14} {1:>6} Nodes  {2:>6} Node.node  {3:>3} Node.children  {4:.3f}s\n".format(
+        label, len(houdini_logic.obj.children()), hou.calls["Node.node"], hou.calls["Node.children"] - 1, elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    build_maya_scene(cmds, count)
+    collide_paths(count)
+
+    lights = maya_logic.lights_list()
+    previous_names = set(transform.replace("|", "_")[1:] for transform in lights["transforms"])
+    sys.stdout.write("{0} lights, {1} previous names, {2} unique names\n".format(count, len(previous_names),
+                                                                                len(set(lights["names"]))))
+
+    path = os.path.join(tempfile.mkdtemp(), "lights.json")
+    maya_logic.export_json_file(path)
+
+    hou.reset()
+    run_import(path, "first Import", False)
+    run_import(path, "update Import", True)
+    if len(houdini_logic.obj.children()) != count * 2:
+        raise RuntimeError("Lights were lost to name collisions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+
+light_schema.py
+
+Times loading the Light data from the previous Json file against importing the compiled logic/light_schema.py,
+and checks that the compiled schema is up to date with maya_to_houdini_light_parms_py3.py.
+
+Usage:
+    python benchmarks/light_schema.py [number of loads]
+
+"""
+
+import os
+import sys
+import json
+import time
+import marshal
+import tempfile
+import subprocess
+
+from synthetic_lights import package_path
+
+from logic import light_schema
+from logic.light_conversion import light_data, schema_light_data
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    directory = tempfile.mkdtemp()
+
+    # Generate the schema module again, it must match the shipped one
+    generator = os.path.join(package_path, "logic", "maya_to_houdini_light_parms_py3.py")
+    schema_path = os.path.join(directory, "light_schema.py")
+    subprocess.check_call([sys.executable, generator, "--output", schema_path], stdout=subprocess.PIPE)
+    with open(schema_path, "r") as schema_file:
+        source = schema_file.read()
+    with open(light_schema.__file__.replace(".pyc", ".py"), "r") as schema_file:
+        if schema_file.read() != source:
+            raise RuntimeError("logic/light_schema.py is out of date, run {0}".format(generator))
+
+    json_text = json.dumps(light_data, indent=4)
+    code = marshal.dumps(compile(source, schema_path, "exec"))
+    sys.stdout.write("{0} loads, schema {1}\n".format(count, light_schema.schema_version))
+
+    start = time.time()
+    for index in range(count):
+        json.loads(json_text)
+    sys.stdout.write("  {0:<16} {1:.3f} ms\n".format("Json", (time.time() - start) * 1000.0 / count))
+
+    start = time.time()
+    for index in range(count):
+        exec(marshal.loads(code), {})
+        schema_light_data()
+    sys.stdout.write("  {0:<16} {1:.3f} ms\n".format("compiled schema", (time.time() - start) * 1000.0 / count))
+
+    if schema_light_data() != json.loads(json_text):
+        raise RuntimeError("Compiled schema differs from the Light data")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+
+light_selection.py
+
+Times maya_logic.lights_list on a large synthetic hierarchy of Lights, props and volume Lights, against the previous
+maya.cmds implementation which also read the Node Type of every Light again while sampling.
+Selected Lights are listed through batched maya.cmds calls, the default, and through the Maya API iterators,
+selected groups are searched recursively, and Transforms with two Light Shapes keep both.
+
+Usage:
+    python benchmarks/light_selection.py [number of lights] [props per light]
+
+"""
+
+import sys
+import time
+
+from synthetic_lights import build_maya_scene
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+from logic import maya_logic
+
+
+def previous_lights_list():
+    """
+    Previous behaviour: listRelatives, one nodeType per Light, listRelatives again for the Transforms,
+    and one nodeType per Light again while sampling.
+    """
+    selection = cmds.ls(selection=True, long=True)
+    lights = cmds.listRelatives(selection, fullPath=True,
+                                type=["directionalLight", "pointLight", "spotLight", "areaLight", "aiAreaLight",
+                                      "aiSkyDomeLight"])
+    all_lights = [light for light in lights or [] if cmds.nodeType(light) != "volumeLight"]
+    lights_transform = cmds.listRelatives(all_lights, parent=True, fullPath=True)
+    names = [light.replace("|", "_")[1:] for light in lights_transform]
+
+    types = []
+    for light in all_lights:
+        node_type = cmds.nodeType(light)
+        if node_type == "aiAreaLight":
+            node_type = cmds.getAttr("{0}.aiTranslator".format(light))
+        types.append(node_type)
+
+    return {"transforms": lights_transform, "shapes": all_lights, "names": names, "types": types}
+
+
+def add_props(count, props):
+    """
+    Group the synthetic Lights and add nested prop groups, meshes and volume Lights around them.
+    :param count: Number of Lights
+    :param props: Props per Light
+    :return: Number of DAG nodes
+    """
+    cmds.add_node("|lights", "transform")
+    for index in range(count):
+        group = cmds.add_node("|lights|props{0}".format(index), "transform", parent="|lights")
+        for prop in range(props):
+            group = cmds.add_node("{0}|prop{1}".format(group, prop), "transform", parent=group)
+            cmds.add_node("{0}|prop{1}Shape".format(group, prop), "mesh", parent=group)
+
+        # volumeLight inherits from pointLight and is not exported
+        if index % 10 == 0:
+            fog = cmds.add_node("|lights|fog{0}".format(index), "transform", parent="|lights")
+            cmds.add_node("{0}|fog{1}Shape".format(fog, index), "volumeLight", parent=fog)
+            cmds.selection.append(fog)
+
+    return len(cmds.scene)
+
+
+def run_list(label, function, *args):
+    cmds.calls.clear()
+    om.calls.clear()
+    start = time.time()
+    lights = function(*args)
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<24} {1:>6} lights  {2:>6} cmds calls  {3:>6} API calls  {4:.3f}s\n".format(
+        label, len(lights["names"]), sum(cmds.calls.values()), sum(om.calls.values()), elapsed))
+    return lights
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    props = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    build_maya_scene(cmds, count)
+    nodes = add_props(count, props)
+    sys.stdout.write("{0} lights, {1} DAG nodes\n".format(count, nodes))
+
+    # Light Transforms and volume Lights selected
+    previous = run_list("previous cmds", previous_lights_list)
+    batched = run_list("batched cmds", maya_logic.lights_list)
+    api = run_list("API iterators", maya_logic.lights_list, False, True)
+    if not previous == api == batched:
+        raise RuntimeError("Selected Lights are listed differently")
+
+    # Top group selected, Lights found anywhere below it
+    del cmds.selection[:]
+    cmds.selection.append("|lights")
+    batched_recursive = run_list("batched cmds, groups", maya_logic.lights_list, True)
+    api_recursive = run_list("API iterators, groups", maya_logic.lights_list, True, True)
+    for lights in [api_recursive, batched_recursive]:
+        if sorted(zip(*[lights[column] for column in sorted(lights)])) != \
+                sorted(zip(*[api[column] for column in sorted(api)])):
+            raise RuntimeError("Lights under the selected group are listed differently")
+
+    # Second Light Shape under the first Light Transform, listed with the same Transform
+    transform = api["transforms"][0]
+    cmds.add_node("{0}|secondShape".format(transform), "pointLight", parent=transform)
+    for recursive in [False, True]:
+        del cmds.selection[:]
+        cmds.selection.extend([transform, "|lights"] if recursive else [transform, api["transforms"][1]])
+        for use_api in [False, True]:
+            lights = maya_logic.lights_list(recursive, use_api)
+            pairs = zip(lights["shapes"], lights["transforms"])
+            if any(not shape.startswith(light_transform + "|") for shape, light_transform in pairs):
+                raise RuntimeError("Light Shapes are listed with the wrong Transforms")
+            if len(lights["shapes"]) != (len(api["shapes"]) + 1 if recursive else 3):
+                raise RuntimeError("Light Shapes of one Transform are missing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+
+live_link.py
+
+Runs the Maya publisher and the Houdini subscriber of the Live Link in one process, with stand-in maya and hou modules,
+and times the first full snapshot and the latency of single Light edits, from the edit in Maya to the updated
+Houdini Nodes, against exporting a Light file and importing it again with Update Existing.
+A Spot Light changes its Mantra Light Type, which removes Parameters from its record.
+Checks that the Houdini Lights match an Import of the edited Maya Scene.
+
+Usage:
+    python benchmarks/live_link.py [number of lights] [number of edits]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+import maya.utils
+from logic import maya_logic, houdini_logic, maya_live_link, houdini_live_link
+
+# Seconds to wait for the subscriber before failing
+timeout = 10.0
+
+
+def scene_parms():
+    return dict((node.path(), node.parmValues()) for node in hou.root.allSubChildren())
+
+
+def pump(done):
+    """
+    Run the Maya idle queue and the Houdini event loop until done() is True.
+    :return: Seconds waited
+    """
+    start = time.time()
+    while not done():
+        maya.utils.process_idle_events()
+        for callback in hou.ui.eventLoopCallbacks():
+            callback()
+        if time.time() - start > timeout:
+            raise RuntimeError("Live Link timed out")
+        time.sleep(0)
+    return time.time() - start
+
+
+def edit(plug):
+    """
+    Edit one Light in Maya, and wait until its Houdini Nodes are updated.
+    :return: Seconds from the edit to the updated Nodes
+    """
+    applied = houdini_live_link.subscriber_state["applied"]
+    start = time.time()
+    cmds.setAttr(plug, cmds.getAttr(plug) + 1.0)
+    pump(lambda: houdini_live_link.subscriber_state["applied"] > applied)
+    return time.time() - start
+
+
+def quiet(function, *args, **kwargs):
+    # Keep the Export and Import messages out of the output
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return function(*args, **kwargs)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def milliseconds(label, seconds):
+    seconds = sorted(seconds)
+    sys.stdout.write("  {0:<20} median {1:>8.3f} ms  max {2:>8.3f} ms\n".format(
+        label, seconds[len(seconds) // 2] * 1000.0, seconds[-1] * 1000.0))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    build_maya_scene(cmds, count)
+    hou.reset()
+    sys.stdout.write("{0} lights, {1} edits\n".format(count, edits))
+
+    # First snapshot of every Light
+    start = time.time()
+    port = quiet(maya_live_link.start_publisher, 0)
+    quiet(houdini_live_link.start_subscriber, 0.1, True, True, port)
+    pump(lambda: houdini_live_link.subscriber_state["applied"] >= count)
+    sys.stdout.write("  {0:<20} {1:.3f}s  {2} Nodes\n".format("snapshot", time.time() - start,
+                                                              len(houdini_logic.obj.children())))
+
+    # Single Light edits, one at a time
+    lights = sorted(maya_live_link.publisher_state["lights"])
+    for attribute in ["intensity", "translateX"]:
+        bytes_sent = maya_live_link.publisher_state["bytes_sent"]
+        latencies = [edit("{0}.{1}".format(lights[index * 97 % count], attribute)) for index in range(edits)]
+        milliseconds("live " + attribute, latencies)
+        sys.stdout.write("  {0:<20} {1:.0f} bytes per edit\n".format(
+            "", (maya_live_link.publisher_state["bytes_sent"] - bytes_sent) / float(edits)))
+
+    # Several Lights edited in one event loop tick are sent at once
+    applied = houdini_live_link.subscriber_state["applied"]
+    start = time.time()
+    for light in lights[:100]:
+        cmds.setAttr(light + ".intensity", cmds.getAttr(light + ".intensity") + 1.0)
+    pump(lambda: houdini_live_link.subscriber_state["applied"] >= applied + 100)
+    sys.stdout.write("  {0:<20} {1:.3f} ms\n".format("live 100 lights", (time.time() - start) * 1000.0))
+
+    # A Spot Light whose Radius goes to 0 turns from spotLightS to spotLightP, its record loses Parameters
+    spot_light, spot_light_name = [(light_shape, light_name) for light_shape, light_type, light_name
+                                   in sorted(maya_live_link.publisher_state["lights"].values())
+                                   if light_type == "spotLight" and cmds.getAttr(light_shape + ".aiRadius")][0]
+    applied = houdini_live_link.subscriber_state["applied"]
+    cmds.setAttr(spot_light + ".aiRadius", 0)
+    pump(lambda: houdini_live_link.subscriber_state["applied"] > applied)
+    live_parms = scene_parms()
+
+    # Previous workflow: export a Light file and import it again, after every edit
+    path = os.path.join(tempfile.mkdtemp(), "lights.jsonl")
+    quiet(maya_logic.export_json_file, path)
+    round_trips = []
+    plugs = ["{0}.intensity".format(light) for light in lights[:min(edits, 5)]]
+    values = [cmds.getAttr(plug) for plug in plugs]
+    for plug in plugs:
+        start = time.time()
+        cmds.setAttr(plug, cmds.getAttr(plug) + 1.0)
+        quiet(maya_logic.export_json_file, path)
+        quiet(houdini_logic.import_json_file, path, 0.1, True, True, update=True)
+        round_trips.append(time.time() - start)
+    milliseconds("file round trip", round_trips)
+
+    quiet(maya_live_link.stop_publisher)
+    houdini_live_link.stop_subscriber()
+
+    # The Live Link gives the Lights of an Import of the edited Maya Scene
+    for plug, value in zip(plugs, values):
+        cmds.setAttr(plug, value)
+    quiet(maya_logic.export_json_file, path)
+    hou.reset()
+    quiet(houdini_logic.import_json_file, path, 0.1, True, True)
+    import_parms = scene_parms()
+
+    # Parameters the new Light Type of the Spot Light doesn't use keep their last value, like Update Existing
+    for path in live_parms:
+        if path.endswith("_" + spot_light_name):
+            live_parms[path] = dict((parm, live_parms[path].get(parm)) for parm in import_parms.get(path, {}))
+    if import_parms != live_parms:
+        raise RuntimeError("Live Link Lights differ from an Import of the Maya Scene")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+
+renderer_backends.py
+
+Times the conversion and the Houdini Import per Light with only Mantra and Arnold registered, against many more
+registered Renderer backends which are not selected, and the Import of the Karma plugin example in /stage.
+Checks that registered but unselected backends change neither the converted values nor the imported Nodes.
+
+Usage:
+    python benchmarks/renderer_backends.py [number of lights] [number of registered backends]
+
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic, conversion_kernel
+from logic.light_conversion import light_data, resolve_light, arnold_converters, arnold_node_type
+from logic.light_file import load_light_file
+from logic.renderer_backends import renderer_backends, register_backend, load_plugins
+
+
+def scene_parms():
+    return dict((node.path(), node.parmValues()) for node in hou.root.allSubChildren())
+
+
+def quiet(function, *args, **kwargs):
+    # Keep the Export and Import messages out of the output
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        return function(*args, **kwargs)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+
+def per_light(label, count, function):
+    start = time.time()
+    result = function()
+    seconds = time.time() - start
+    sys.stdout.write("  {0:<36} {1:.3f}s  {2:>7.2f} us per Light\n".format(label, seconds,
+                                                                          seconds * 1000000.0 / count))
+    return result
+
+
+def run(label, count, path, lights, renderers):
+    """
+    Convert every Light with resolve_light and the conversion kernel, then Import them in a new Houdini Scene.
+    :return: (Converted Lights repr, Houdini Scene Parameters)
+    """
+    scalar = per_light(label + " resolve_light", count,
+                       lambda: [resolve_light(light, light_json, 0.1, renderers) for light, light_json in lights])
+    batched = per_light(label + " kernel", count, lambda: conversion_kernel.resolve_lights(lights, 0.1, renderers))
+    if repr(scalar) != repr(batched):
+        raise RuntimeError("Conversion kernel gives different values")
+
+    hou.reset()
+    per_light(label + " Import", count,
+              lambda: quiet(houdini_logic.import_json_file, path, 0.1, True, True, renderers=renderers))
+    return repr(scalar), scene_parms()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    backends = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    build_maya_scene(cmds, count)
+    path = os.path.join(tempfile.mkdtemp(), "lights.jsonl")
+    quiet(maya_logic.export_json_file, path)
+    lights = list(load_light_file(path).items())
+    sys.stdout.write("{0} lights\n".format(count))
+
+    # Only Mantra and Arnold registered
+    renderers = ["Mantra", "Arnold"]
+    converted, parms = run("2 backends", count, path, lights, renderers)
+
+    # Many more registered backends, not selected
+    for index in range(backends):
+        register_backend("Unused{0}".format(index), "Arnold", light_data["Arnold"], arnold_converters,
+                         arnold_node_type, "unused{0}_".format(index))
+    try:
+        many = run("{0} backends".format(len(renderer_backends)), count, path, lights, renderers)
+    finally:
+        for index in range(backends):
+            renderer_backends.pop("Unused{0}".format(index))
+    if many != (converted, parms):
+        raise RuntimeError("Unselected backends change the imported Lights")
+
+    # Karma plugin example, USD Lights chained in /stage
+    load_plugins(["logic.karma_backend"])
+    run("Mantra, Arnold and Karma", count, path, lights, renderers + ["Karma"])
+    stage = hou.node("/stage")
+
+    # Walk the Node chain up from the displayed Node
+    chain = 0
+    light_obj = stage.displayNode()
+    while light_obj is not None:
+        chain += 1
+        light_obj = light_obj.inputs()[0] if light_obj.inputs() else None
+    sys.stdout.write("  {0:<36} {1} Nodes in /stage, {2} chained\n".format("Karma", len(stage.children()), chain))
+    if chain != count or len(stage.children()) != count:
+        raise RuntimeError("Karma Lights are not one chain of Nodes in /stage")
+
+
+if __name__ == "__main__":
+    main()
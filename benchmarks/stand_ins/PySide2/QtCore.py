@@ -0,0 +1,11 @@
+"""
+
+QtCore.py
+
+Stand-in for PySide2.QtCore.
+
+"""
+
+from PySide2 import stand_in_classes
+
+stand_in_classes(["Qt", "QObject", "QTimer", "QSocketNotifier"], globals())
@@ -0,0 +1,11 @@
+"""
+
+QtGui.py
+
+Stand-in for PySide2.QtGui.
+
+"""
+
+from PySide2 import stand_in_classes
+
+stand_in_classes(["QFont"], globals())
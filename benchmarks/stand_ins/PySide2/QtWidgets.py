@@ -0,0 +1,13 @@
+"""
+
+QtWidgets.py
+
+Stand-in for PySide2.QtWidgets.
+
+"""
+
+from PySide2 import stand_in_classes
+
+stand_in_classes(["QWidget", "QLabel", "QLineEdit", "QPushButton", "QCheckBox", "QDoubleSpinBox", "QAbstractSpinBox",
+                  "QSpacerItem", "QSizePolicy", "QGridLayout", "QHBoxLayout", "QVBoxLayout", "QFileDialog",
+                  "QProgressDialog", "QApplication"], globals())
@@ -0,0 +1,64 @@
+"""
+
+PySide2
+
+Stand-in for the PySide2 package, used by the benchmarks outside of Maya and Houdini.
+Every Qt class accepts any arguments, and every attribute, method call or enum value is another stand-in.
+
+"""
+
+from collections import Counter
+
+# Number of Qt objects created per Qt class, methods and values are not counted
+created = Counter()
+
+
+class StandInType(type):
+    """
+    Qt class, enum values like Qt.AlignRight are stand-ins.
+    """
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return StandIn()
+
+
+class StandIn(StandInType("StandInBase", (object,), {})):
+    """
+    Qt object, method or value.
+    """
+    def __init__(self, *args, **kwargs):
+        if type(self) is not StandIn:
+            created[type(self).__name__] += 1
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return StandIn()
+
+    def __call__(self, *args, **kwargs):
+        return StandIn()
+
+    def __or__(self, other):
+        return self
+
+    __xor__ = __and__ = __ror__ = __rxor__ = __rand__ = __or__
+
+    def __int__(self):
+        return 0
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+
+def stand_in_classes(names, namespace):
+    """
+    Add stand-in Qt classes to a module.
+    :param names: Qt class names
+    :param namespace: Module globals
+    :return: None
+    """
+    for name in names:
+        namespace[name] = type(name, (StandIn,), {})
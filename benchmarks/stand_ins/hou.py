@@ -0,0 +1,427 @@
+"""
+
+hou.py
+
+Stand-in for the Houdini hou module, holds a fake node tree in memory and counts parameter notifications.
+Every Parm.set() is one notification, every Node.setParms() call is one notification.
+Multiparm instances only exist up to the count of their multiparm, like in Houdini.
+
+"""
+
+from collections import Counter
+
+# Number of calls per operation
+calls = Counter()
+
+# Multiparm count Parameters and the name prefixes of their instance Parameters
+multiparms = {"light_contrib": ["light_contribname", "light_contribenable"]}
+
+
+def multiparm_instance(name):
+    """
+    Multiparm count Parameter and instance number of a Parameter name.
+    :param name: Parameter name
+    :return: (Multiparm count Parameter, Instance number), or None
+    """
+    for count_parm, prefixes in multiparms.items():
+        for prefix in prefixes:
+            if name.startswith(prefix) and name[len(prefix):].isdigit():
+                return count_parm, int(name[len(prefix):])
+    return None
+
+
+class Parm(object):
+    def __init__(self, node, name):
+        self._node = node
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def node(self):
+        return self._node
+
+    def set(self, value):
+        calls["Parm.set"] += 1
+        calls["notifications"] += 1
+        self._node._set_value(self._name, value)
+
+    def eval(self):
+        calls["Parm.eval"] += 1
+        return self._node._values.get(self._name, 0)
+
+    def setKeyframes(self, keyframes):
+        calls["Parm.setKeyframes"] += 1
+        calls["notifications"] += 1
+        self._node._keyframes[self._name] = list(keyframes)
+
+    def deleteAllKeyframes(self):
+        calls["Parm.deleteAllKeyframes"] += 1
+        self._node._keyframes.pop(self._name, None)
+
+    def keyframes(self):
+        return list(self._node._keyframes.get(self._name, []))
+
+
+class Node(object):
+    def __init__(self, parent, node_type, name):
+        self._parent = parent
+        self._type = node_type
+        self._name = name
+        self._children = {}
+        self._values = {}
+        self._keyframes = {}
+        self._user_data = {}
+        self._selected = False
+        self._inputs = []
+        self._display = False
+
+    def name(self):
+        return self._name
+
+    def path(self):
+        if self._parent is None:
+            return "/" + self._name if self._name else "/"
+        return self._parent.path().rstrip("/") + "/" + self._name
+
+    def type(self):
+        return NodeType(self._type)
+
+    def parent(self):
+        return self._parent
+
+    def node(self, name):
+        calls["Node.node"] += 1
+        node = self
+        for part in name.strip("/").split("/"):
+            node = node._children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def children(self):
+        calls["Node.children"] += 1
+        return tuple(self._children.values())
+
+    def _unique_name(self, name):
+        # Houdini numbers names which are already taken
+        base = name.rstrip("0123456789")
+        number = 1
+        while name in self._children:
+            name = "{0}{1}".format(base, number)
+            number += 1
+        return name
+
+    def createNode(self, node_type, name=None):
+        calls["Node.createNode"] += 1
+        name = self._unique_name(name or node_type.split(":")[0])
+        node = Node(self, node_type, name)
+        self._children[name] = node
+        return node
+
+    def setName(self, name, unique_name=False):
+        calls["Node.setName"] += 1
+        if name == self._name:
+            return
+        if name in self._parent._children:
+            if not unique_name:
+                raise OperationFailed("Node name {0} is already taken".format(name))
+            name = self._parent._unique_name(name)
+        del self._parent._children[self._name]
+        self._name = name
+        self._parent._children[name] = self
+
+    def destroy(self):
+        calls["Node.destroy"] += 1
+        del self._parent._children[self._name]
+
+    def _has_parm(self, name):
+        instance = multiparm_instance(name)
+        return instance is None or instance[1] <= self._values.get(instance[0], 0)
+
+    def _set_value(self, name, value):
+        if not self._has_parm(name):
+            raise OperationFailed("Parameter {0} doesn't exist on {1}".format(name, self.path()))
+        self._values[name] = value
+
+        # Instances above a lowered multiparm count are removed
+        if name in multiparms:
+            for parm in list(self._values):
+                instance = multiparm_instance(parm)
+                if instance is not None and instance[0] == name and instance[1] > value:
+                    del self._values[parm]
+
+    def parm(self, name):
+        calls["Node.parm"] += 1
+        if not self._has_parm(name):
+            return None
+        return Parm(self, name)
+
+    def evalParm(self, name):
+        calls["Node.evalParm"] += 1
+        return self._values.get(name, 0)
+
+    def parmValues(self):
+        return dict(self._values)
+
+    def keyframeValues(self):
+        return dict((name, [(key.frame(), key.value()) for key in keys]) for name, keys in self._keyframes.items())
+
+    def setParms(self, parms):
+        calls["Node.setParms"] += 1
+        calls["notifications"] += 1
+        for name, value in parms.items():
+            self._set_value(name, value)
+
+    def setSelected(self, on, clear_all_selected=False):
+        calls["Node.setSelected"] += 1
+        if clear_all_selected:
+            for node in root.allSubChildren():
+                node._selected = False
+        self._selected = on
+
+    def isSelected(self):
+        return self._selected
+
+    def layoutChildren(self, items=()):
+        calls["Node.layoutChildren"] += 1
+
+    def setInput(self, input_index, item_to_become_input):
+        calls["Node.setInput"] += 1
+        self._inputs[input_index:input_index + 1] = [item_to_become_input]
+
+    def inputs(self):
+        return tuple(self._inputs)
+
+    def setDisplayFlag(self, on):
+        calls["Node.setDisplayFlag"] += 1
+        if on:
+            for child in self._parent._children.values():
+                child._display = False
+        self._display = on
+
+    def displayNode(self):
+        for child in self._children.values():
+            if child._display:
+                return child
+        return None
+
+    def setUserData(self, name, value):
+        self._user_data[name] = value
+
+    def userData(self, name):
+        return self._user_data.get(name)
+
+    def allSubChildren(self):
+        nodes = []
+        for child in self._children.values():
+            nodes.append(child)
+            nodes.extend(child.allSubChildren())
+        return nodes
+
+
+class OperationFailed(Exception):
+    pass
+
+
+class ObjectWasDeleted(Exception):
+    pass
+
+
+class NodeType(object):
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class Keyframe(object):
+    def __init__(self, value=0.0, time=None):
+        self._value = value
+        self._frame = time
+
+    def setFrame(self, frame):
+        self._frame = frame
+
+    def frame(self):
+        return self._frame
+
+    def setValue(self, value):
+        self._value = value
+
+    def value(self):
+        return self._value
+
+    def setExpression(self, expression, language=None):
+        self._expression = expression
+
+    def expression(self):
+        return getattr(self, "_expression", None)
+
+
+class exprLanguage(object):
+    Hscript = "Hscript"
+    Python = "Python"
+
+
+class _UndoGroup(object):
+    def __init__(self, label):
+        self.label = label
+
+    def __enter__(self):
+        calls["undos.group"] += 1
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _UndoDisabler(object):
+    def __enter__(self):
+        calls["undos.disabler"] += 1
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class undos(object):
+    @staticmethod
+    def group(label):
+        return _UndoGroup(label)
+
+    @staticmethod
+    def disabler():
+        return _UndoDisabler()
+
+
+class updateMode(object):
+    AutoUpdate = "AutoUpdate"
+    OnMouseUp = "OnMouseUp"
+    Manual = "Manual"
+
+
+_update_mode = [updateMode.AutoUpdate]
+
+
+def updateModeSetting():
+    return _update_mode[0]
+
+
+def setUpdateMode(mode):
+    calls["setUpdateMode"] += 1
+    _update_mode[0] = mode
+
+
+class severityType(object):
+    Message = 0
+    ImportantMessage = 1
+    Warning = 2
+    Error = 3
+
+
+class ui(object):
+    status = []
+    messages = []
+
+    # Functions called by the Houdini event loop
+    event_loop_callbacks = []
+
+    # Button chosen by displayMessage()
+    choice = [0]
+
+    @staticmethod
+    def setStatusMessage(message, severity=None):
+        ui.status.append(message)
+
+    @staticmethod
+    def displayMessage(text, buttons=("OK",), severity=None, default_choice=0, close_choice=None, help=None,
+                       title=None, details=None, **kwargs):
+        calls["ui.displayMessage"] += 1
+        ui.messages.append((text, details))
+        return ui.choice[0]
+
+
+    @staticmethod
+    def addEventLoopCallback(callback):
+        ui.event_loop_callbacks.append(callback)
+
+    @staticmethod
+    def removeEventLoopCallback(callback):
+        ui.event_loop_callbacks.remove(callback)
+
+    @staticmethod
+    def eventLoopCallbacks():
+        return tuple(ui.event_loop_callbacks)
+
+
+def isUIAvailable():
+    return True
+
+
+class qt(object):
+    @staticmethod
+    def mainWindow():
+        return None
+
+
+class hipFile(object):
+    path = [None]
+
+    @staticmethod
+    def load(path, suppress_save_prompt=False, ignore_load_warnings=False):
+        calls["hipFile.load"] += 1
+        reset()
+        hipFile.path[0] = path
+
+    @staticmethod
+    def clear(suppress_save_prompt=False):
+        calls["hipFile.clear"] += 1
+        reset()
+
+    @staticmethod
+    def save(file_name=None):
+        calls["hipFile.save"] += 1
+        hipFile.path[0] = file_name or hipFile.path[0]
+        with open(hipFile.path[0], "w") as hip:
+            for node in root.allSubChildren():
+                hip.write("{0} {1} {2!r}\n".format(node.path(), node._type, sorted(node._values.items())))
+
+
+def node(path):
+    calls["node"] += 1
+    if path.strip("/") == "":
+        return root
+    return root.node(path)
+
+
+def homeHoudiniDirectory():
+    return "."
+
+
+def reset():
+    """
+    Start a new empty scene with /obj, /mat and /stage.
+    :return: None
+    """
+    global root
+    root = Node(None, "root", "")
+    # Keep the same Node objects for modules holding hou.node("obj") from import time
+    root._children["obj"] = _obj
+    root._children["mat"] = _mat
+    root._children["stage"] = _stage
+    _obj._parent = root
+    _mat._parent = root
+    _stage._parent = root
+    _obj._children.clear()
+    _mat._children.clear()
+    _stage._children.clear()
+    calls.clear()
+
+
+root = Node(None, "root", "")
+_obj = Node(root, "obj", "obj")
+_mat = Node(root, "mat", "mat")
+_stage = Node(root, "stage", "stage")
+reset()
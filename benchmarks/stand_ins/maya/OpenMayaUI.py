@@ -0,0 +1,13 @@
+"""
+
+OpenMayaUI.py
+
+Stand-in for maya.OpenMayaUI, used by the benchmarks outside of Maya.
+
+"""
+
+
+class MQtUtil(object):
+    @staticmethod
+    def mainWindow():
+        return 1
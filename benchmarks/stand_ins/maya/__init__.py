@@ -0,0 +1,7 @@
+"""
+
+maya
+
+Stand-in for the Maya Python package, used by the benchmarks outside of Maya.
+
+"""
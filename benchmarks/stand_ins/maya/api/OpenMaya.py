@@ -0,0 +1,315 @@
+"""
+
+OpenMaya.py
+
+Stand-in for maya.api.OpenMaya, only the messages, DAG paths and iterators used by the package.
+Callbacks are fired by the stand-in maya.cmds when Attributes are set, and on the Attributes connected to them.
+
+"""
+
+from collections import Counter
+
+# Number of calls per function
+calls = Counter()
+
+# Registered callbacks, id: (kind, node or None, function, client data)
+callbacks = {}
+
+# Next callback id
+_next_id = [1]
+
+
+class MObject(object):
+    """
+    Maya Node handle, holds the Node full path.
+    """
+    def __init__(self, path=None):
+        self.path = path
+
+
+class MFn(object):
+    """
+    Function set types, only the filters used by the package.
+    """
+    kInvalid = 0
+    kDagNode = 1
+    kTransform = 2
+    kShape = 3
+
+
+def _has_fn(path, fn_type):
+    from maya import cmds
+    if fn_type == MFn.kTransform:
+        return cmds.scene[path]["nodeType"] == "transform"
+    if fn_type == MFn.kShape:
+        return cmds.scene[path]["nodeType"] != "transform"
+    return True
+
+
+class MDagPath(MObject):
+    """
+    Maya DAG path, holds the Node full path.
+    """
+    def __init__(self, path=None):
+        if isinstance(path, MDagPath):
+            path = path.path
+        MObject.__init__(self, path)
+
+    def fullPathName(self):
+        return self.path
+
+    def inclusiveMatrix(self):
+        from maya import cmds
+        calls["inclusiveMatrix"] += 1
+        return cmds.world_matrix(self.path)
+
+    def node(self):
+        return MObject(self.path)
+
+    def childCount(self):
+        from maya import cmds
+        return len(cmds.children.get(self.path, []))
+
+    def child(self, index):
+        from maya import cmds
+        return MObject(cmds.children[self.path][index])
+
+    def push(self, child):
+        self.path = child.path
+        return self
+
+    def pop(self, number=1):
+        from maya import cmds
+        for index in range(number):
+            self.path = cmds.scene[self.path]["parent"]
+        return self
+
+
+class MPlug(object):
+    """
+    Attribute of a Node.
+    """
+    def __init__(self, path, attribute):
+        self.path = path
+        self.attribute = attribute
+
+    def asString(self):
+        from maya import cmds
+        calls["MPlug.asString"] += 1
+        return str(cmds._value(self.path, self.attribute))
+
+
+class MFnDependencyNode(object):
+    """
+    Function set of any Node.
+    """
+    def __init__(self, node):
+        self.path = node.path
+
+    @property
+    def typeName(self):
+        from maya import cmds
+        calls["typeName"] += 1
+        return cmds.scene[self.path]["nodeType"]
+
+    def findPlug(self, attribute, want_networked):
+        from maya import cmds
+        if attribute not in cmds.scene[self.path]["attributes"]:
+            raise RuntimeError("(kInvalidParameter): No element at given index")
+        return MPlug(self.path, attribute)
+
+
+class MFnDagNode(MFnDependencyNode):
+    """
+    Function set of DAG Nodes.
+    """
+    pass
+
+
+class MGlobal(object):
+    @staticmethod
+    def getActiveSelectionList():
+        from maya import cmds
+        calls["getActiveSelectionList"] += 1
+        selection = MSelectionList()
+        selection.paths = list(cmds.selection)
+        return selection
+
+
+class MItSelectionList(object):
+    """
+    Iterator over the DAG Nodes of a selection list.
+    """
+    def __init__(self, selection, fn_type=MFn.kInvalid):
+        self.paths = [path for path in selection.paths if _has_fn(path, fn_type)]
+        self.index = 0
+
+    def isDone(self):
+        return self.index >= len(self.paths)
+
+    def next(self):
+        self.index += 1
+
+    def getDagPath(self):
+        return MDagPath(self.paths[self.index])
+
+
+class MItDag(object):
+    """
+    Depth first iterator over a DAG hierarchy, the root included.
+    """
+    kDepthFirst = 0
+
+    def __init__(self, traversal_type=kDepthFirst, fn_type=MFn.kInvalid):
+        self.paths = []
+        self.index = 0
+
+    def reset(self, root, traversal_type=kDepthFirst, fn_type=MFn.kInvalid):
+        from maya import cmds
+        calls["MItDag.reset"] += 1
+        self.paths = []
+        self.index = 0
+        pending = [root.path]
+        while pending:
+            path = pending.pop()
+            if _has_fn(path, fn_type):
+                self.paths.append(path)
+            pending.extend(reversed(cmds.children.get(path, [])))
+
+    def isDone(self):
+        return self.index >= len(self.paths)
+
+    def next(self):
+        self.index += 1
+
+    def getPath(self):
+        calls["MItDag.getPath"] += 1
+        return MDagPath(self.paths[self.index])
+
+
+class MSelectionList(object):
+    """
+    List of Nodes added by name.
+    """
+    def __init__(self):
+        self.paths = []
+
+    def add(self, path):
+        from maya import cmds
+        if path not in cmds.scene:
+            raise RuntimeError("(kInvalidParameter): Object does not exist")
+        self.paths.append(path)
+        return self
+
+    def getDependNode(self, index):
+        return MObject(self.paths[index])
+
+    def getDagPath(self, index):
+        return MDagPath(self.paths[index])
+
+
+def _add(kind, node, function, client_data):
+    callback_id = _next_id[0]
+    _next_id[0] += 1
+    callbacks[callback_id] = (kind, node, function, client_data)
+    calls[kind] += 1
+    return callback_id
+
+
+class MMessage(object):
+    @staticmethod
+    def removeCallbacks(callback_ids):
+        for callback_id in callback_ids:
+            callbacks.pop(callback_id, None)
+
+
+class MNodeMessage(object):
+    kConnectionMade = 0x01
+    kConnectionBroken = 0x02
+    kAttributeEval = 0x04
+    kAttributeSet = 0x08
+
+    @staticmethod
+    def addAttributeChangedCallback(node, function, client_data=None):
+        return _add("attributeChanged", node.path, function, client_data)
+
+    @staticmethod
+    def addNameChangedCallback(node, function, client_data=None):
+        return _add("nameChanged", node.path, function, client_data)
+
+    @staticmethod
+    def addNodeDirtyPlugCallback(node, function, client_data=None):
+        return _add("nodeDirtyPlug", node.path, function, client_data)
+
+
+class MDagMessage(object):
+    @staticmethod
+    def addWorldMatrixModifiedCallback(dag_path, function, client_data=None):
+        return _add("worldMatrixModified", dag_path.path, function, client_data)
+
+
+class MDGMessage(object):
+    @staticmethod
+    def addTimeChangeCallback(function, client_data=None):
+        return _add("timeChange", None, function, client_data)
+
+
+class MSceneMessage(object):
+    kBeforeNew = 1
+    kBeforeOpen = 2
+
+    @staticmethod
+    def addCallback(message, function, client_data=None):
+        return _add("scene{0}".format(message), None, function, client_data)
+
+
+def _fire(kind, node, *args):
+    for callback_kind, callback_node, function, client_data in list(callbacks.values()):
+        if callback_kind == kind and callback_node == node:
+            function(*(args + (client_data,)))
+
+
+def attribute_set(node, attribute):
+    """
+    Fire the callbacks of an Attribute set by the stand-in maya.cmds.
+    :param node: Node full path
+    :param attribute: Attribute name
+    :return: None
+    """
+    if not callbacks:
+        return
+
+    from maya import cmds
+    _fire("attributeChanged", node, MNodeMessage.kAttributeSet, attribute, None)
+
+    # Connected Attributes get dirty, they are never set
+    for destination_node, destination_attribute in cmds.destinations(node, attribute):
+        _fire("nodeDirtyPlug", destination_node, MObject(destination_node), MPlug(destination_node,
+                                                                                  destination_attribute))
+
+    # Transform Attributes move the whole hierarchy below the Node
+    if attribute.startswith(("translate", "rotate", "scale")):
+        pending = [node]
+        while pending:
+            path = pending.pop()
+            _fire("worldMatrixModified", path, MObject(path), 0)
+            pending.extend(cmds.children.get(path, []))
+
+
+def time_changed():
+    """
+    Fire the time change callbacks, called by the stand-in maya.cmds.currentTime.
+    :return: None
+    """
+    for callback_kind, callback_node, function, client_data in list(callbacks.values()):
+        if callback_kind == "timeChange":
+            function(None, client_data)
+
+
+def reset():
+    """
+    Remove every callback and clear the call counters.
+    :return: None
+    """
+    calls.clear()
+    callbacks.clear()
@@ -0,0 +1,7 @@
+"""
+
+api
+
+Stand-in for the Maya Python API 2.0 package, used by the benchmarks outside of Maya.
+
+"""
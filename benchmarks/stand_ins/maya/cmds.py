@@ -0,0 +1,257 @@
+"""
+
+cmds.py
+
+Stand-in for maya.cmds, holds a fake scene in memory and counts every command call.
+
+"""
+
+import math
+from collections import Counter, deque
+
+# Number of calls per command
+calls = Counter()
+
+# Fake scene, node full path: {"nodeType": type, "attributes": {name: value}, "parent": full path}
+scene = {}
+
+# Children full paths per parent full path
+children = {}
+
+# Current selection
+selection = []
+
+# Current frame and playback range
+timeline = {"current": 1.0, "min": 1.0, "max": 24.0}
+
+
+def reset():
+    """
+    Clear the fake scene, the selection and the call counters.
+    :return: None
+    """
+    calls.clear()
+    scene.clear()
+    children.clear()
+    del selection[:]
+    timeline.update({"current": 1.0, "min": 1.0, "max": 24.0})
+
+
+def add_node(path, node_type, attributes=None, parent=None):
+    """
+    Add a Node to the fake scene.
+    :param path: Node full path
+    :param node_type: Node Type
+    :param attributes: Attribute values
+    :param parent: Parent full path
+    :return: Node full path
+    """
+    scene[path] = {"nodeType": node_type, "attributes": dict(attributes or {}), "parent": parent}
+    children.setdefault(parent, []).append(path)
+    return path
+
+
+def _children(path):
+    return list(children.get(path, []))
+
+
+def _value(node, attribute):
+    # Connected Attributes take the value of their source
+    source = scene[node].get("inputs", {}).get(attribute)
+    if source is not None:
+        return _find_attribute(*source)
+
+    # Animated Attributes are functions of the current frame
+    animation = scene[node].get("animation", {})
+    if attribute in animation:
+        return animation[attribute](timeline["current"])
+    return scene[node]["attributes"][attribute]
+
+
+def _find_attribute(node, attribute):
+    if attribute in scene[node]["attributes"]:
+        return _value(node, attribute)
+
+    # Transforms forward Attribute lookups to their Shape, like Maya does
+    for child in _children(node):
+        if attribute in scene[child]["attributes"]:
+            return _value(child, attribute)
+
+    raise ValueError("No object matches name: {0}.{1}".format(node, attribute))
+
+
+def _unique(nodes):
+    # Maya lists every Node once
+    listed = set()
+    return [node for node in nodes if not (node in listed or listed.add(node))]
+
+
+def ls(*nodes, **kwargs):
+    calls["ls"] += 1
+    if kwargs.get("selection"):
+        return list(globals()["selection"])
+
+    # Flat list of Node, Node Type pairs
+    nodes = _unique(nodes[0] if nodes and isinstance(nodes[0], list) else list(nodes))
+    if kwargs.get("showType"):
+        return [value for node in nodes for value in [node, scene[node]["nodeType"]]]
+    return list(nodes)
+
+
+def listRelatives(nodes, fullPath=False, type=None, parent=False, allDescendents=False, **kwargs):
+    calls["listRelatives"] += 1
+    if isinstance(nodes, str):
+        nodes = [nodes]
+
+    result = []
+    for node in nodes or []:
+        if parent:
+            result.append(scene[node]["parent"])
+            continue
+
+        pending = deque(_children(node))
+        while pending:
+            child = pending.popleft()
+            if type is None or scene[child]["nodeType"] in type:
+                result.append(child)
+            if allDescendents:
+                pending.extend(_children(child))
+
+    return _unique(result) or None
+
+
+def objExists(node):
+    calls["objExists"] += 1
+    return node in scene
+
+
+def nodeType(node, **kwargs):
+    calls["nodeType"] += 1
+    return scene[node]["nodeType"]
+
+
+def getAttr(plug, **kwargs):
+    calls["getAttr"] += 1
+    node, attribute = plug.split(".", 1)
+    return _find_attribute(node, attribute)
+
+
+def _attribute_node(node, attribute):
+    # Node the Attribute lives on, Transforms forward to their Shape
+    if attribute not in scene[node]["attributes"]:
+        for child in _children(node):
+            if attribute in scene[child]["attributes"]:
+                return child
+    return node
+
+
+def destinations(node, attribute):
+    """
+    Attributes connected to an Attribute, and the Attributes connected to them.
+    :param node: Node full path
+    :param attribute: Attribute name
+    :return: List of (Node full path, Attribute name)
+    """
+    driven = []
+    pending = [(node, attribute)]
+    while pending:
+        source = pending.pop()
+        for path, data in scene.items():
+            for destination_attribute, input_plug in data.get("inputs", {}).items():
+                if tuple(input_plug) == source:
+                    driven.append((path, destination_attribute))
+                    pending.append((path, destination_attribute))
+    return driven
+
+
+def connectAttr(source, destination, **kwargs):
+    calls["connectAttr"] += 1
+    source_node, source_attribute = source.split(".", 1)
+    node, attribute = destination.split(".", 1)
+    node = _attribute_node(node, attribute)
+    scene[node].setdefault("inputs", {})[attribute] = (_attribute_node(source_node, source_attribute),
+                                                       source_attribute)
+
+
+def setAttr(plug, value, **kwargs):
+    calls["setAttr"] += 1
+    node, attribute = plug.split(".", 1)
+    node = _attribute_node(node, attribute)
+    scene[node]["attributes"][attribute] = value
+
+    from maya.api import OpenMaya
+    OpenMaya.attribute_set(node, attribute)
+
+
+def _local_matrix(node):
+    # Scale * Rotate X * Rotate Y * Rotate Z * Translate, row vectors like Maya
+    values = [_value(node, attribute) for attribute in ["translateX", "translateY", "translateZ", "rotateX",
+                                                         "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ"]]
+    cx, cy, cz = [math.cos(math.radians(angle)) for angle in values[3:6]]
+    sx, sy, sz = [math.sin(math.radians(angle)) for angle in values[3:6]]
+    rows = [[cy * cz, cy * sz, -sy],
+            [sx * sy * cz - cx * sz, sx * sy * sz + cx * cz, sx * cy],
+            [cx * sy * cz + sx * sz, cx * sy * sz - sx * cz, cx * cy]]
+    matrix = []
+    for row, scale in zip(rows, values[6:9]):
+        matrix.extend([value * scale for value in row] + [0.0])
+    return matrix + values[0:3] + [1.0]
+
+
+def _multiply(a, b):
+    return [sum(a[row * 4 + index] * b[index * 4 + column] for index in range(4))
+            for row in range(4) for column in range(4)]
+
+
+def world_matrix(node):
+    """
+    World Matrix of a Transform, 16 floats, parents outside the fake scene are identity.
+    :param node: Node full path
+    :return: World Matrix
+    """
+    matrix = _local_matrix(node)
+    parent = scene[node]["parent"]
+    while parent in scene and "translateX" in scene[parent]["attributes"]:
+        matrix = _multiply(matrix, _local_matrix(parent))
+        parent = scene[parent]["parent"]
+    return matrix
+
+
+def xform(node, q=False, translation=False, matrix=False, worldSpace=False, **kwargs):
+    calls["xform"] += 1
+    if matrix:
+        return world_matrix(node)
+    return world_matrix(node)[12:15]
+
+
+def connectionInfo(plug, sourceFromDestination=False, **kwargs):
+    calls["connectionInfo"] += 1
+    node, attribute = plug.split(".", 1)
+    return scene[node].get("connections", {}).get(attribute, "")
+
+
+def arnoldTemperatureToColor(kelvin, **kwargs):
+    calls["arnoldTemperatureToColor"] += 1
+    return [1.0, kelvin / 10000.0, kelvin / 20000.0]
+
+
+def currentTime(frame=None, query=False, update=True, **kwargs):
+    calls["currentTime"] += 1
+    if query or frame is None:
+        return timeline["current"]
+    timeline["current"] = float(frame)
+
+    from maya.api import OpenMaya
+    OpenMaya.time_changed()
+    return timeline["current"]
+
+
+def playbackOptions(query=False, minTime=False, maxTime=False, **kwargs):
+    calls["playbackOptions"] += 1
+    if minTime:
+        return timeline["min"]
+    return timeline["max"]
+
+
+def refresh(suspend=None, **kwargs):
+    calls["refresh"] += 1
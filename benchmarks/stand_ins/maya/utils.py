@@ -0,0 +1,27 @@
+"""
+
+utils.py
+
+Stand-in for maya.utils, deferred functions wait in a queue until the benchmark runs them as Maya would when idle.
+
+"""
+
+# Functions waiting for Maya to be idle
+deferred = []
+
+
+def executeDeferred(function, *args):
+    deferred.append((function, args))
+
+
+def process_idle_events():
+    """
+    Run the deferred functions, including the ones they defer.
+    :return: Number of functions run
+    """
+    count = 0
+    while deferred:
+        function, args = deferred.pop(0)
+        function(*args)
+        count += 1
+    return count
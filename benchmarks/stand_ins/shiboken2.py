@@ -0,0 +1,15 @@
+"""
+
+shiboken2.py
+
+Stand-in for shiboken2, used by the benchmarks outside of Maya.
+
+"""
+
+
+def wrapInstance(pointer, cls):
+    return cls()
+
+
+def isValid(qt_object):
+    return True
@@ -0,0 +1,134 @@
+"""
+
+synthetic_lights.py
+
+Builds synthetic Maya scenes and exported Json data for the benchmarks.
+
+"""
+
+import os
+import sys
+import random
+
+# Benchmarks folder and package folder
+benchmarks_path = os.path.dirname(os.path.realpath(__file__))
+package_path = os.path.dirname(benchmarks_path)
+
+# Stand-in DCC modules and the package itself
+for import_path in [os.path.join(benchmarks_path, "stand_ins"), package_path]:
+    if import_path not in sys.path:
+        sys.path.insert(0, import_path)
+
+from logic.light_conversion import light_data
+
+# Maya Light Node Type, aiTranslator
+maya_light_types = [("pointLight", None), ("directionalLight", None), ("spotLight", None), ("areaLight", None),
+                    ("aiAreaLight", "quad"), ("aiAreaLight", "disk"), ("aiAreaLight", "cylinder"),
+                    ("aiSkyDomeLight", None)]
+
+
+def attribute_value(attribute, rng):
+    """
+    Plausible value for a Maya Light Attribute.
+    :param attribute: Attribute name
+    :param rng: random.Random instance
+    :return: Attribute value
+    """
+    if attribute == "aiAov":
+        return rng.choice(["default", "key"])
+    if attribute in ["visibility", "aiCastShadows", "aiCastVolumetricShadows", "aiNormalize", "normalize",
+                     "aiUseColorTemperature"]:
+        return rng.random() > 0.3
+    if attribute in ["aiSamples", "aiVolumeSamples", "aiMaxBounces", "resolution", "format"]:
+        return rng.randint(1, 8)
+    if attribute.startswith("rotate"):
+        return rng.uniform(-180, 180)
+    if attribute == "coneAngle":
+        return rng.uniform(0, 120)
+    if attribute == "penumbraAngle":
+        return rng.uniform(-10, 100)
+    if attribute == "dropoff":
+        return rng.choice([0, 1, rng.random(), rng.uniform(1, 20)])
+    if attribute in ["aiRadius", "aiAngle"]:
+        return rng.choice([0, rng.uniform(0.1, 10)])
+    if attribute in ["aiSpread", "aiSoftEdge", "aiRoundness"] or attribute.startswith("color"):
+        return rng.choice([0, rng.random(), 1])
+    return rng.uniform(0.1, 10)
+
+
+def build_maya_scene(cmds, count, seed=0):
+    """
+    Fill the stand-in maya.cmds scene with Lights of every type and select them.
+    :param cmds: Stand-in maya.cmds module
+    :param count: Number of Lights
+    :param seed: Random seed
+    :return: None
+    """
+    rng = random.Random(seed)
+    cmds.reset()
+
+    # Every Attribute used by any Renderer
+    attributes = set(["aiColorTemperature", "aiUseColorTemperature"])
+    for renderer in ["Mantra", "Arnold"]:
+        for renderer_light_type in light_data[renderer]:
+            attributes.update(light_data[renderer][renderer_light_type]["light_parms"])
+
+    for index in range(count):
+        node_type, translator = maya_light_types[index % len(maya_light_types)]
+        values = dict((attribute, attribute_value(attribute, rng)) for attribute in sorted(attributes))
+        values["aiUseColorTemperature"] = index % 5 == 0
+        if index % 3 == 0:
+            values["scaleX"] = values["scaleZ"] = 0
+        values["aiColorTemperature"] = rng.choice([2700, 3200, 4300, 5600, 6500])
+        if translator:
+            values["aiTranslator"] = translator
+
+        # Transform Attributes live on the transform, everything else on the Shape
+        transform_values = dict((attribute, values.pop(attribute)) for attribute in list(values)
+                                if attribute.startswith(("translate", "rotate", "scale")) or attribute == "visibility")
+
+        transform = cmds.add_node("|lights|light{0}".format(index), "transform", transform_values, "|lights")
+        cmds.add_node("{0}|light{1}Shape".format(transform, index), node_type, values, transform)
+        cmds.selection.append(transform)
+
+        # Some Lights share a few gobo textures
+        if index % 7 == 0:
+            cmds.scene[transform]["connections"] = {"color": "gobo{0}.outColor".format(index % 3)}
+
+    # Gobo texture file nodes
+    for index in range(3):
+        cmds.add_node("gobo{0}".format(index), "file", {"fileTextureName": "/textures/gobo{0}.exr".format(index),
+                                                        "colorSpace": "Raw"})
+
+    cmds.calls.clear()
+
+
+def animate_maya_scene(cmds, count, seed=0):
+    """
+    Animate some Lights of a synthetic scene: flickering intensity, moving practicals and shared pulses.
+    :param cmds: Stand-in maya.cmds module
+    :param count: Number of Lights in the scene
+    :param seed: Random seed
+    :return: None
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        transform = "|lights|light{0}".format(index)
+        shape = "{0}|light{1}Shape".format(transform, index)
+
+        # Flicker
+        if index % 4 == 0:
+            base, speed = rng.uniform(0.5, 5), rng.uniform(0.5, 3)
+            cmds.scene[shape].setdefault("animation", {})["intensity"] = \
+                lambda frame, base=base, speed=speed: base * (1 + 0.2 * ((frame * speed) % 1))
+
+        # Moving practical
+        if index % 6 == 0:
+            start = cmds.scene[transform]["attributes"]["translateX"]
+            cmds.scene[transform].setdefault("animation", {})["translateX"] = \
+                lambda frame, start=start: start + frame * 0.5
+
+        # Shared pulse, identical curve on many Lights
+        if index % 5 == 0:
+            cmds.scene[shape].setdefault("animation", {})["aiExposure"] = \
+                lambda frame: float(int(frame) % 12 < 6)
@@ -0,0 +1,141 @@
+"""
+
+texture_check.py
+
+Times the texture pre-flight check of logic/texture_check.py on synthetic textures: EXR, PNG and JPEG headers,
+UDIM tiles and missing files, referenced many times by an exported Light file. The second check uses the cache.
+
+Usage:
+    python benchmarks/texture_check.py [number of textures] [references per texture]
+
+"""
+
+import os
+import sys
+import json
+import time
+import struct
+import tempfile
+
+# Script folder, the textures are checked without Maya or Houdini stand-ins
+package_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if package_path not in sys.path:
+    sys.path.insert(0, package_path)
+
+from logic import texture_check
+
+
+def exr_attribute(name, attribute_type, value):
+    return name.encode("latin-1") + b"\x00" + attribute_type.encode("latin-1") + b"\x00" + \
+        struct.pack("<i", len(value)) + value
+
+
+def write_exr(path, width, height, metadata_size=0):
+    """
+    Scanline OpenEXR header with RGBA half channels and optional metadata, followed by dummy pixel data.
+    """
+    channels = b"".join(name + b"\x00" + struct.pack("<iB3xii", 1, 0, 1, 1) for name in [b"A", b"B", b"G", b"R"])
+    header = [b"\x76\x2f\x31\x01", struct.pack("<i", 2),
+              exr_attribute("channels", "chlist", channels + b"\x00"),
+              exr_attribute("comment", "string", b"x" * metadata_size),
+              exr_attribute("compression", "compression", b"\x03"),
+              exr_attribute("dataWindow", "box2i", struct.pack("<iiii", 0, 0, width - 1, height - 1)),
+              exr_attribute("displayWindow", "box2i", struct.pack("<iiii", 0, 0, width - 1, height - 1)),
+              exr_attribute("lineOrder", "lineOrder", b"\x00"),
+              exr_attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0)),
+              b"\x00"]
+    with open(path, "wb") as texture_file:
+        texture_file.write(b"".join(header) + b"\x00" * 4096)
+
+
+def write_png(path, width, height):
+    with open(path, "wb") as texture_file:
+        texture_file.write(b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" +
+                           struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0) + b"\x00" * 4096)
+
+
+def write_jpeg(path, width, height):
+    with open(path, "wb") as texture_file:
+        texture_file.write(b"\xff\xd8" + b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9 +
+                           b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 3) + b"\x00" * 4096)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    references = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    directory = tempfile.mkdtemp()
+    paths = []
+    expected = {}
+    for index in range(count):
+        kind = index % 10
+        if kind == 0:
+            path = os.path.join(directory, "gobo{0}.png".format(index))
+            write_png(path, 512, 256)
+        elif kind == 1:
+            path = os.path.join(directory, "gobo{0}.jpg".format(index))
+            write_jpeg(path, 640, 480)
+        elif kind == 2:
+            path = os.path.join(directory, "missing{0}.exr".format(index))
+        elif kind == 3:
+            path = os.path.join(directory, "tiles{0}.<UDIM>.exr".format(index))
+            for tile in [1001, 1002]:
+                write_exr(path.replace("<UDIM>", str(tile)), 1024, 1024)
+        else:
+            # Some EXR files carry a lot of metadata
+            path = os.path.join(directory, "gobo{0}.exr".format(index))
+            write_exr(path, 2048, 1024, 100000 if kind == 9 else 0)
+        paths.append(path)
+        expected[path] = kind
+
+    # Every texture used by several Lights of both Renderers
+    lights = {}
+    for index in range(count * references):
+        path = paths[index % count]
+        lights["light{0}".format(index)] = {"Mantra": {"nodeType": "quad", "texture_node": "file{0}".format(index),
+                                                       "texture_map": path},
+                                            "Arnold": {"nodeType": "quad", "texture_map": path}}
+    light_file = os.path.join(directory, "lights.json")
+    with open(light_file, "w") as json_file:
+        json.dump(lights, json_file)
+
+    cache_path = os.path.join(directory, "texture_cache.json")
+    sys.stdout.write("{0} textures, {1} references\n".format(count, count * references))
+    for label in ["cold", "cached session", "cached file"]:
+        if label == "cached file":
+            texture_check.header_cache.clear()
+        start = time.time()
+        textures, results = texture_check.check_light_files([light_file], cache_path=cache_path)
+        sys.stdout.write("  {0:<15} {1:.3f}s\n".format(label, time.time() - start))
+
+    sys.stdout.write("  {0}\n".format(texture_check.texture_summary(textures, results)[-1]))
+
+    # Every texture is reported as expected
+    problems = texture_check.texture_problems(textures, results)
+    for path, kind in expected.items():
+        files = results[path]
+        if kind == 2 and path not in problems["missing"]:
+            raise RuntimeError("{0} should be missing".format(path))
+        if kind in [0, 1] and path not in problems["not_linear"]:
+            raise RuntimeError("{0} should not be linear".format(path))
+        if kind == 3 and (len(files) != 2 or files[0]["width"] != 1024):
+            raise RuntimeError("{0} tiles are wrong: {1}".format(path, files))
+        if kind > 3 and (files[0]["width"], files[0]["height"], files[0]["channels"]) != (2048, 1024,
+                                                                                           ["A", "B", "G", "R"]):
+            raise RuntimeError("{0} header is wrong: {1}".format(path, files))
+        if kind == 0 and (files[0]["width"], files[0]["height"]) != (512, 256):
+            raise RuntimeError("{0} header is wrong: {1}".format(path, files))
+        if kind == 1 and (files[0]["width"], files[0]["height"]) != (640, 480):
+            raise RuntimeError("{0} header is wrong: {1}".format(path, files))
+
+    # A channel name cut off at the very end of a truncated file is reported as unreadable, without hanging
+    path = os.path.join(directory, "truncated.exr")
+    with open(path, "wb") as texture_file:
+        texture_file.write(b"\x76\x2f\x31\x01" + struct.pack("<i", 2) + exr_attribute("comment", "string", b"x") +
+                           exr_attribute("channels", "chlist", b"R" * 16))
+    if "error" not in texture_check.check_file(path):
+        raise RuntimeError("{0} should be unreadable".format(path))
+
+
+if __name__ == "__main__":
+    main()
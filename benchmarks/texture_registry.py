@@ -0,0 +1,83 @@
+"""
+
+texture_registry.py
+
+Counts the texture Materials created by houdini_logic.import_json_file when many Lights share a few gobo textures,
+some of them through different Maya file nodes and spellings of the same path, and on a second Import.
+
+Usage:
+    python benchmarks/texture_registry.py [number of lights]
+
+"""
+
+import os
+import sys
+import time
+import posixpath
+import tempfile
+
+from synthetic_lights import build_maya_scene
+
+import hou
+import maya.cmds as cmds
+from logic import maya_logic, houdini_logic
+from logic.light_file import load_light_file
+
+
+def add_texture_aliases(count):
+    """
+    Connect half of the textured Lights to other file nodes reading the same gobo textures.
+    :param count: Number of Lights
+    :return: None
+    """
+    for index in range(3):
+        cmds.add_node("goboBackslash{0}".format(index), "file",
+                      {"fileTextureName": "\\textures\\gobo{0}.exr".format(index), "colorSpace": "Raw"})
+        cmds.add_node("goboDotted{0}".format(index), "file",
+                      {"fileTextureName": "/textures/./gobo{0}.exr".format(index), "colorSpace": "Raw"})
+
+    for index in range(0, count, 7):
+        if index % 14 == 0:
+            continue
+        alias = "goboBackslash" if index % 28 == 7 else "goboDotted"
+        cmds.scene["|lights|light{0}".format(index)]["connections"] = {
+            "color": "{0}{1}.outColor".format(alias, index % 3)}
+
+
+def run_import(path, label):
+    start = time.time()
+    registry = houdini_logic.import_json_file(path, 0.1, True, False)
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<14} {1:>4} Materials in /mat  {2:.3f}s  {3}\n".format(
+        label, len(houdini_logic.mat.children()), elapsed, houdini_logic.texture_report(registry)))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    build_maya_scene(cmds, count)
+    add_texture_aliases(count)
+
+    path = os.path.join(tempfile.mkdtemp(), "lights.json")
+    maya_logic.export_json_file(path)
+
+    # Previous behaviour: one Material per Maya file node name
+    file_nodes = set(light_data["Mantra"]["texture_node"] for light_data in load_light_file(path).values()
+                     if "texture_node" in light_data["Mantra"])
+    sys.stdout.write("{0} lights, {1} file nodes\n".format(count, len(file_nodes)))
+
+    hou.reset()
+    run_import(path, "first Import")
+    run_import(path, "second Import")
+
+    # Every Light reads its own texture
+    for light_obj in houdini_logic.obj.children():
+        material = light_obj.evalParm("shop_materialpath")
+        if not material:
+            continue
+        texture_map = hou.node(material).evalParm("map").replace("\\", "/")
+        if posixpath.normpath(texture_map) != "/textures/gobo{0}.exr".format(int(light_obj.name()[19:]) % 3):
+            raise RuntimeError("{0} uses the wrong texture {1}".format(light_obj.name(), texture_map))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+
+ui_launcher.py
+
+Times shelf clicks of ui/launcher.py against stand-in maya, hou and PySide2 modules: the first click importing the
+UI, later clicks keeping the modules and the window, against the previous launcher which reloaded the UI module and
+built a new window on every click, and a click after a source file changed.
+
+Usage:
+    python benchmarks/ui_launcher.py [maya or houdini] [number of clicks]
+
+"""
+
+import os
+import sys
+import time
+import importlib
+
+from synthetic_lights import package_path
+
+import PySide2
+
+title = "Maya to Houdini Light Transfer"
+version = "1.0"
+
+
+def previous_click(host):
+    """
+    Previous behaviour: reload the UI module and build a new window on every click.
+    """
+    if sys.version[0] == "3":
+        from importlib import reload
+    if host == "maya":
+        from ui import maya_ui
+        reload(maya_ui)
+        window = maya_ui.MayaUI(title, version)
+    else:
+        from ui import houdini_ui
+        reload(houdini_ui)
+        window = houdini_ui.HoudiniUI(title, version)
+    window.show()
+
+
+def timed_clicks(label, click, count):
+    PySide2.created.clear()
+    start = time.time()
+    for index in range(count):
+        click()
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<16} {1:>8.3f} ms per click  {2:>6} Qt objects\n".format(
+        label, elapsed * 1000.0 / count, sum(PySide2.created.values())))
+
+
+def main():
+    host = sys.argv[1] if len(sys.argv) > 1 else "maya"
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    # The host has loaded its own module at startup
+    importlib.import_module("maya.cmds" if host == "maya" else "hou")
+    from ui import launcher
+    sys.stdout.write("{0}, {1} clicks\n".format(host, count))
+
+    start = time.time()
+    launcher.launch(title, version)
+    elapsed = time.time() - start
+    sys.stdout.write("  {0:<16} {1:>8.3f} ms, {2} tool modules\n".format("first click", elapsed * 1000.0,
+                                                                         len(launcher.tool_modules())))
+
+    # Only the modules of the host are imported
+    other_host = [name for name in launcher.host_ui_modules if name != host][0]
+    if launcher.host_ui_modules[other_host][0] in sys.modules:
+        raise RuntimeError("The {0} UI was imported in {1}".format(other_host, host))
+
+    timed_clicks("previous", lambda: previous_click(host), count)
+    launcher.close_window()
+    launcher.launch(title, version)
+    timed_clicks("cached", lambda: launcher.launch(title, version), count)
+
+    # A changed source file loads the tool modules again and builds a new window
+    window = launcher.launcher_state["window"]
+    source = os.path.join(package_path, "logic", "light_file.py")
+    mtime = os.path.getmtime(source)
+    os.utime(source, (mtime, mtime + 1))
+    try:
+        timed_clicks("changed source", lambda: launcher.launch(title, version), 1)
+    finally:
+        os.utime(source, (mtime, mtime))
+    if launcher.launcher_state["window"] is window:
+        raise RuntimeError("The window was kept after a source file changed")
+
+
+if __name__ == "__main__":
+    main()
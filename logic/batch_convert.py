@@ -0,0 +1,192 @@
+"""
+
+batch_convert.py
+
+Command line conversion of exported Light files to resolved Houdini Light Nodes, without Maya or Houdini.
+
+Every Light of the resolved file holds, per Renderer, the Houdini Node name, Node Type and final Parameter values.
+Houdini imports resolved files like any exported file, the Scene Scale is already applied.
+
+Usage (from the script folder):
+    python -m logic.batch_convert shots/*.json --output-directory resolved --scale 0.1 --jobs 8
+
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import multiprocessing
+
+from logic.light_file import is_json_lines, read_light_file, write_json_lines_record
+from logic.conversion_kernel import resolve_lights
+from logic.renderer_backends import renderer_backends, selected_backends
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+# Suffix added to the resolved file names
+resolved_suffix = "_houdini"
+
+# Number of Lights resolved together by the conversion kernel
+batch_size = 4096
+
+
+def resolved_file_path(source, output_directory, extension):
+    """
+    Path of the resolved file of an exported Light file.
+    :param source: Exported Light file path
+    :param output_directory: Folder of the resolved files
+    :param extension: Resolved file extension, ".json" or ".jsonl"
+    :return: Resolved file path
+    """
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(output_directory, "{0}{1}{2}".format(name, resolved_suffix, extension))
+
+
+def light_batches(source):
+    """
+    Read an exported Light file in batches of Lights.
+    :param source: Json, Json Lines or Binary Light Rig file path
+    :return: Generator of lists of (Light name, Exported Light data)
+    """
+    batch = []
+    for light, light_json, file_progress in read_light_file(source):
+        batch.append((light, light_json))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def convert_file(source, destination, scale, renderers):
+    """
+    Resolve every Light of an exported Light file and write them to a Json or Json Lines file.
+    :param source: Json, Json Lines or Binary Light Rig file path
+    :param destination: Json or Json Lines file path
+    :param scale: Scene Scale Value
+    :param renderers: Renderer names to resolve
+    :return: Number of Lights
+    """
+    light_count = 0
+
+    # Stream Lights to the Json Lines file one batch at a time
+    if is_json_lines(destination):
+        with open(destination, "w") as json_lines_file:
+            for batch in light_batches(source):
+                for (light, light_json), resolved in zip(batch, resolve_lights(batch, scale, renderers)):
+                    write_json_lines_record(json_lines_file, light, resolved)
+                light_count += len(batch)
+        return light_count
+
+    # Dictionary to save resolved Lights py2 or py3
+    if sys.version[0] == "3":
+        resolved_data = {}
+    else:
+        resolved_data = OrderedDict()
+
+    for batch in light_batches(source):
+        for (light, light_json), resolved in zip(batch, resolve_lights(batch, scale, renderers)):
+            resolved_data[light] = resolved
+        light_count += len(batch)
+
+    with open(destination, "w") as json_file:
+        json.dump(resolved_data, json_file, indent=4, ensure_ascii=False)
+
+    return light_count
+
+
+def convert_file_job(job):
+    """
+    Worker of batch_convert(), errors are returned instead of stopping the other files.
+    :param job: (Source, Destination, Scene Scale Value, Renderer names)
+    :return: (Source, Destination, Number of Lights, Seconds, Error message or None)
+    """
+    source, destination, scale, renderers = job
+    start = time.time()
+    try:
+        light_count = convert_file(source, destination, scale, renderers)
+    except Exception as error:
+        return source, destination, 0, time.time() - start, "{0}: {1}".format(type(error).__name__, error)
+    return source, destination, light_count, time.time() - start, None
+
+
+def batch_convert(sources, output_directory, scale, renderers, jobs=None, extension=".json"):
+    """
+    Resolve several exported Light files in parallel, one file per process.
+    :param sources: Exported Light file paths
+    :param output_directory: Folder of the resolved files
+    :param scale: Scene Scale Value
+    :param renderers: Renderer names to resolve
+    :param jobs: Number of processes, all CPU cores if None
+    :param extension: Resolved file extension, ".json" or ".jsonl"
+    :return: List of (Source, Destination, Number of Lights, Seconds, Error message or None) in sources order
+    """
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory)
+
+    batch = [(source, resolved_file_path(source, output_directory, extension), scale, renderers)
+             for source in sources]
+
+    # Single process, easier to debug
+    if jobs == 1 or len(batch) < 2:
+        return [convert_file_job(job) for job in batch]
+
+    pool = multiprocessing.Pool(min(jobs or multiprocessing.cpu_count(), len(batch)))
+    try:
+        return pool.map(convert_file_job, batch, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def main():
+    """
+    Command line batch converter.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Convert exported Light files to resolved Houdini Light Nodes "
+                                                 "without Maya or Houdini.")
+    parser.add_argument("sources", nargs="+", help="Exported Light files or glob patterns")
+    parser.add_argument("-o", "--output-directory", required=True, help="Folder of the resolved files")
+    parser.add_argument("--scale", type=float, default=0.1, help="Scene Scale Value (default 0.1)")
+    parser.add_argument("--renderers", nargs="+", choices=list(renderer_backends), default=["Mantra", "Arnold"],
+                        help="Renderers to resolve, plugins included (default Mantra and Arnold)")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of processes (default all CPU cores)")
+    parser.add_argument("--format", choices=["json", "jsonl"], default="json", help="Resolved file format")
+    args = parser.parse_args()
+
+    # Expand glob patterns, the Windows shell doesn't
+    sources = []
+    for pattern in args.sources:
+        sources.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    # Renderers in the order of the registered backends
+    renderers = [backend["name"] for backend in selected_backends(args.renderers)]
+
+    start = time.time()
+    results = batch_convert(sources, args.output_directory, args.scale, renderers, args.jobs,
+                            ".{0}".format(args.format))
+
+    # Summary
+    failures = 0
+    for source, destination, light_count, seconds, error in results:
+        if error:
+            failures += 1
+            sys.stdout.write("FAILED {0}: {1}\n".format(source, error))
+        else:
+            sys.stdout.write("{0} -> {1}: {2} Lights in {3:.3f}s\n".format(source, destination, light_count,
+                                                                           seconds))
+    sys.stdout.write("{0} files converted, {1} failed in {2:.3f}s\n".format(len(results) - failures, failures,
+                                                                            time.time() - start))
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+
+batch_import.py
+
+Command line Import of many exported Light files into Houdini scenes, one headless hython process per file.
+
+Every Light file is imported into its own .hip file, either an empty scene or a copy of a template scene.
+Workers run in parallel, the summary lists the time and any failure of every file.
+
+Usage (from the script folder):
+    python -m logic.batch_import shots/*.json --hip-directory hip --template-hip lighting.hip --jobs 8
+
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import subprocess
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+# Script folder, for hython workers running this file directly
+package_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if package_path not in sys.path:
+    sys.path.insert(0, package_path)
+
+# Prefix of the worker result line on stdout
+result_prefix = "BATCH_IMPORT_RESULT "
+
+
+def hip_file_path(source, hip_directory):
+    """
+    Path of the .hip file an exported Light file is imported into.
+    :param source: Exported Light file path
+    :param hip_directory: Folder of the .hip files
+    :return: .hip file path
+    """
+    name = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(hip_directory, "{0}.hip".format(name))
+
+
+def import_worker(source, hip_path, scale, mantra_check, arnold_check, template_hip=None, renderers=None):
+    """
+    Import one Light file into a new Houdini scene and save it, run inside hython.
+    :param source: Json, Json Lines or Binary Light Rig file path
+    :param hip_path: .hip file to save
+    :param scale: Scene Scale Value
+    :param mantra_check: Import Mantra Lights
+    :param arnold_check: Import Arnold Lights
+    :param template_hip: .hip file to start from, empty scene if None
+    :param renderers: Renderer names of any registered backend, replacing mantra_check and arnold_check if given
+    :return: Number of Lights imported
+    """
+    import hou
+
+    if template_hip:
+        hou.hipFile.load(template_hip, suppress_save_prompt=True, ignore_load_warnings=True)
+    else:
+        hou.hipFile.clear(suppress_save_prompt=True)
+
+    # houdini_logic holds /obj and /mat of the loaded scene
+    from logic import houdini_logic
+
+    light_count = [0]
+
+    def count_lights(count, file_progress):
+        light_count[0] = count
+
+    houdini_logic.import_json_file(source, scale, mantra_check, arnold_check, count_lights, renderers=renderers)
+    hou.hipFile.save(hip_path)
+
+    return light_count[0]
+
+
+def import_job(job):
+    """
+    Run one hython worker, errors are returned instead of stopping the other files.
+    :param job: (hython executable, Source, .hip file, Scene Scale Value, Mantra, Arnold, Template .hip file,
+        Renderer names or None)
+    :return: (Source, .hip file, Number of Lights, Seconds, Error message or None)
+    """
+    hython, source, hip_path, scale, mantra_check, arnold_check, template_hip, renderers = job
+    command = [hython, os.path.realpath(__file__), "--worker", source, hip_path, "--scale", repr(scale)]
+    if mantra_check:
+        command.append("--mantra")
+    if arnold_check:
+        command.append("--arnold")
+    if template_hip:
+        command.extend(["--template-hip", template_hip])
+    if renderers:
+        command.extend(["--renderers"] + list(renderers))
+
+    start = time.time()
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+    except OSError as error:
+        return source, hip_path, 0, time.time() - start, "{0}: {1}".format(hython, error)
+    seconds = time.time() - start
+
+    # Worker result is its last line starting with result_prefix
+    for line in reversed(stdout.decode("utf-8", "replace").splitlines()):
+        if line.startswith(result_prefix):
+            return source, hip_path, json.loads(line[len(result_prefix):])["lights"], seconds, None
+
+    error_lines = stderr.decode("utf-8", "replace").strip().splitlines() or ["no result"]
+    return source, hip_path, 0, seconds, "exit code {0}: {1}".format(process.returncode, error_lines[-1])
+
+
+def batch_import(sources, hip_directory, scale, mantra_check, arnold_check, template_hip=None, jobs=None,
+                 hython="hython", renderers=None):
+    """
+    Import several Light files into their own .hip files in parallel, one hython process per file.
+    :param sources: Exported Light file paths
+    :param hip_directory: Folder of the .hip files
+    :param scale: Scene Scale Value
+    :param mantra_check: Import Mantra Lights
+    :param arnold_check: Import Arnold Lights
+    :param template_hip: .hip file every scene starts from, empty scene if None
+    :param jobs: Number of parallel workers, all CPU cores if None
+    :param hython: hython executable
+    :param renderers: Renderer names of any registered backend, replacing mantra_check and arnold_check if given
+    :return: List of (Source, .hip file, Number of Lights, Seconds, Error message or None) in sources order
+    """
+    if not os.path.isdir(hip_directory):
+        os.makedirs(hip_directory)
+
+    batch = [(hython, source, hip_file_path(source, hip_directory), scale, mantra_check, arnold_check, template_hip,
+              renderers) for source in sources]
+
+    # Threads only wait on the hython processes
+    pool = ThreadPool(max(1, min(jobs or multiprocessing.cpu_count(), len(batch))))
+    try:
+        return pool.map(import_job, batch, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def main():
+    """
+    Command line batch Import, and hython worker with --worker.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Import exported Light files into Houdini scenes with parallel "
+                                                 "hython workers.")
+    parser.add_argument("sources", nargs="+", help="Exported Light files or glob patterns, or with --worker: "
+                                                   "Light file and .hip file")
+    parser.add_argument("--hip-directory", default=".", help="Folder of the saved .hip files (default current)")
+    parser.add_argument("--template-hip", default=None, help=".hip file every scene starts from")
+    parser.add_argument("--scale", type=float, default=0.1, help="Scene Scale Value (default 0.1)")
+    parser.add_argument("--mantra", action="store_true", help="Import Mantra Lights")
+    parser.add_argument("--arnold", action="store_true", help="Import Arnold Lights")
+    parser.add_argument("--renderers", nargs="+", default=None,
+                        help="Renderers to Import, plugins included, replacing --mantra and --arnold")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of parallel workers (default all CPU cores)")
+    parser.add_argument("--hython", default="hython", help="hython executable (default hython on PATH)")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Both Renderers if none is given
+    mantra_check = args.mantra or not args.arnold
+    arnold_check = args.arnold or not args.mantra
+
+    if args.worker:
+        light_count = import_worker(args.sources[0], args.sources[1], args.scale, mantra_check, arnold_check,
+                                    args.template_hip, args.renderers)
+        sys.stdout.write("{0}{1}\n".format(result_prefix, json.dumps({"lights": light_count})))
+        return
+
+    # Expand glob patterns, the Windows shell doesn't
+    sources = []
+    for pattern in args.sources:
+        sources.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    start = time.time()
+    results = batch_import(sources, args.hip_directory, args.scale, mantra_check, arnold_check, args.template_hip,
+                           args.jobs, args.hython, args.renderers)
+
+    # Summary
+    failures = 0
+    for source, hip_path, light_count, seconds, error in results:
+        if error:
+            failures += 1
+            sys.stdout.write("FAILED {0}: {1}\n".format(source, error))
+        else:
+            sys.stdout.write("{0} -> {1}: {2} Lights in {3:.3f}s\n".format(source, hip_path, light_count, seconds))
+    sys.stdout.write("{0} files imported, {1} failed in {2:.3f}s\n".format(len(results) - failures, failures,
+                                                                           time.time() - start))
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
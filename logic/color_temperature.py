@@ -0,0 +1,182 @@
+"""
+
+color_temperature.py
+
+This file contains the Color Temperature to Color conversion, without any Maya or Houdini dependency.
+
+Every Color Temperature is converted once per session, from the first source which knows it:
+    Exact samples: Colors given by Arnold in Maya, or saved in the exported Light file.
+    Converter: Arnold in Maya, the result is added to the exact samples.
+    Interpolation: Linear between the two nearest exact samples, if they are close enough.
+    Planckian model: Planckian locus approximation (Kim et al.), in linear Rec.709 with a luminance of 1.
+
+"""
+
+import sys
+import bisect
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+# Exported Parameter holding the Color Temperature in Kelvin, and the Color Parameters it sets
+kelvin_parm = "aiColorTemperature"
+color_parms = ["colorR", "colorG", "colorB"]
+
+# Exact Colors of Color Temperatures, from Arnold or from exported Light files
+# Kelvin: [Red, Green, Blue]
+temperature_samples = {}
+
+# Sorted Kelvin of the exact samples, for interpolation
+sample_kelvins = []
+
+# Colors already given by temperature_color()
+# Kelvin: [Red, Green, Blue]
+temperature_cache = {}
+
+# Largest gap in Kelvin between two exact samples used for interpolation
+interpolation_range = 500.0
+
+# Kelvin range of the Planckian locus approximation
+planckian_range = (1667.0, 25000.0)
+
+# CIE XYZ to linear Rec.709 matrix
+xyz_to_rec709 = [[3.2404542, -1.5371385, -0.4985314],
+                 [-0.9692660, 1.8760108, 0.0415560],
+                 [0.0556434, -0.2040259, 1.0572252]]
+
+
+def add_temperature_samples(samples):
+    """
+    Add exact Colors of Color Temperatures, they replace interpolated or modelled Colors.
+    :param samples: Dictionary of Kelvin, number or text, to [Red, Green, Blue]
+    :return: None
+    """
+    for kelvin, color in samples.items():
+        temperature_samples[float(kelvin)] = [float(channel) for channel in color]
+
+    sample_kelvins[:] = sorted(temperature_samples)
+    temperature_cache.clear()
+
+
+def clear_temperature_samples():
+    """
+    Forget every exact sample and cached Color.
+    :return: None
+    """
+    temperature_samples.clear()
+    sample_kelvins[:] = []
+    temperature_cache.clear()
+
+
+def planckian_color(kelvin):
+    """
+    Color of a black body, from an approximation of the Planckian locus.
+    :param kelvin: Color Temperature in Kelvin
+    :return: [Red, Green, Blue] in linear Rec.709, luminance of 1
+    """
+    kelvin = min(max(float(kelvin), planckian_range[0]), planckian_range[1])
+
+    # CIE xy chromaticity
+    if kelvin <= 4000:
+        x = -0.2661239e9 / kelvin ** 3 - 0.2343589e6 / kelvin ** 2 + 0.8776956e3 / kelvin + 0.179910
+    else:
+        x = -3.0258469e9 / kelvin ** 3 + 2.1070379e6 / kelvin ** 2 + 0.2226347e3 / kelvin + 0.240390
+    if kelvin <= 2222:
+        y = -1.1063814 * x ** 3 - 1.34811020 * x ** 2 + 2.18555832 * x - 0.20219683
+    elif kelvin <= 4000:
+        y = -0.9549476 * x ** 3 - 1.37418593 * x ** 2 + 2.09137015 * x - 0.16748867
+    else:
+        y = 3.0817580 * x ** 3 - 5.87338670 * x ** 2 + 3.75112997 * x - 0.37001483
+
+    # CIE XYZ with a luminance of 1, to Rec.709
+    xyz = [x / y, 1.0, (1.0 - x - y) / y]
+    return [max(0.0, sum(row[index] * xyz[index] for index in range(3))) for row in xyz_to_rec709]
+
+
+def interpolated_color(kelvin):
+    """
+    Color of a Color Temperature from the two nearest exact samples.
+    :param kelvin: Color Temperature in Kelvin
+    :return: [Red, Green, Blue], or None if no samples are close enough
+    """
+    index = bisect.bisect_left(sample_kelvins, kelvin)
+    if index == 0 or index == len(sample_kelvins):
+        return None
+
+    low = sample_kelvins[index - 1]
+    high = sample_kelvins[index]
+    if high - low > interpolation_range:
+        return None
+
+    weight = (kelvin - low) / (high - low)
+    return [low_channel + (high_channel - low_channel) * weight
+            for low_channel, high_channel in zip(temperature_samples[low], temperature_samples[high])]
+
+
+def temperature_color(kelvin, converter=None):
+    """
+    Color of a Color Temperature, computed once per Color Temperature.
+    :param kelvin: Color Temperature in Kelvin
+    :param converter: Function of Kelvin to exact [Red, Green, Blue], e.g. cmds.arnoldTemperatureToColor
+    :return: [Red, Green, Blue]
+    """
+    kelvin = float(kelvin)
+    if kelvin in temperature_cache:
+        return temperature_cache[kelvin]
+
+    if kelvin in temperature_samples:
+        color = temperature_samples[kelvin]
+    elif converter:
+        add_temperature_samples({kelvin: converter(kelvin)})
+        color = temperature_samples[kelvin]
+    else:
+        color = interpolated_color(kelvin) or planckian_color(kelvin)
+
+    temperature_cache[kelvin] = color
+    return color
+
+
+def light_temperatures(lights):
+    """
+    Color Temperatures exported in Kelvin by Lights, static or animated.
+    :param lights: Dictionary of Light name to Light data
+    :return: Sorted list of Kelvin
+    """
+    kelvins = set()
+    for light_data in lights.values():
+        for renderer_parms in light_data.values():
+            if isinstance(renderer_parms, dict) and kelvin_parm in renderer_parms:
+                value = renderer_parms[kelvin_parm]
+                kelvins.update(float(kelvin) for kelvin in (value if isinstance(value, list) else [value])
+                               if isinstance(kelvin, (int, float)))
+
+    return sorted(kelvins)
+
+
+def temperature_record(kelvins):
+    """
+    Exact samples of Color Temperatures, saved in an exported Light file before the Lights using them.
+    The record has the layout of a Light, so every Light file format can hold it.
+    :param kelvins: Color Temperatures in Kelvin
+    :return: Dictionary of Kelvin text to {Color Parameter: value}, only Color Temperatures with an exact sample
+    """
+    # Dictionary of samples py2 or py3
+    if sys.version[0] == "3":
+        record = {}
+    else:
+        record = OrderedDict()
+
+    for kelvin in kelvins:
+        if float(kelvin) in temperature_samples:
+            record[repr(float(kelvin))] = dict(zip(color_parms, temperature_samples[float(kelvin)]))
+
+    return record
+
+
+def add_temperature_record(record):
+    """
+    Add the exact samples of an exported Light file.
+    :param record: Dictionary of Kelvin text to {Color Parameter: value}
+    :return: None
+    """
+    add_temperature_samples(dict((kelvin, [color[parm] for parm in color_parms]) for kelvin, color in record.items()))
@@ -0,0 +1,385 @@
+"""
+
+conversion_kernel.py
+
+This file contains the batched Maya to Houdini Parameter conversion, giving the same values as convert_light().
+
+Lights of one Renderer are grouped by Maya Light Type and exported keys, and converted one Parameter column at a time.
+Every Column Converter has the same signature and writes the converted values in the Houdini Parameters of every Light:
+    column_converter(parms_list, names, values, lights, scale, table)
+Column Converters come from the backend of the Renderer, see renderer_backends.py, and from the common ones below.
+Converters without a Column Converter run on every Light of the column, in the same Parameter order.
+The World Matrix of a Light is decomposed once for all the Renderers converted together.
+
+NumPy is used for the arithmetic of float columns when it is installed, otherwise plain Python.
+Exponents and logarithms always use the math module, so the values are bit-identical to convert_light().
+
+"""
+
+import sys
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from logic.light_file import frames_key
+from logic.light_conversion import light_exposure_calc, soft_edge_exposure_calc, parm_table, expand_world_matrix, \
+    conversion_order, resolve_light, resolved_node, convert_value, convert_skip, convert_scaled, \
+    convert_double_scaled, convert_contribution, convert_mantra_light_type, convert_mantra_rotate_x, \
+    convert_mantra_rotate_y, convert_mantra_rotate_z, convert_mantra_scale_z, convert_mantra_ai_exposure, \
+    convert_mantra_exposure, convert_mantra_radius, convert_mantra_angle, convert_mantra_soft_edge, \
+    convert_arnold_light_type, convert_arnold_scale_y, convert_arnold_scale_z, convert_arnold_ai_exposure, \
+    convert_arnold_exposure, convert_arnold_cone_angle, convert_arnold_penumbra_angle, convert_color_temperature
+from logic.color_temperature import color_parms, temperature_color
+from logic.renderer_backends import renderer_backends, add_column_converters, load_plugins
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+# Smallest column sent to NumPy, shorter columns are faster in plain Python
+numpy_min_size = 64
+
+
+def float_array(values):
+    """
+    NumPy array of a column if every value is a float.
+    :param values: Column values
+    :return: NumPy float64 array, or None
+    """
+    for value in values:
+        if type(value) is not float:
+            return None
+    return numpy.array(values, dtype=numpy.float64)
+
+
+def map_columns(function, *columns):
+    """
+    Apply an arithmetic function on every row of the columns, on NumPy arrays when all columns are floats.
+    The function only uses +, -, *, / and abs, which give the same values on Python floats and NumPy float64.
+    :param function: Function of one value per column
+    :param columns: Columns of the same length
+    :return: List of values
+    """
+    if numpy is not None and len(columns[0]) >= numpy_min_size:
+        arrays = [float_array(column) for column in columns]
+        if all(array is not None for array in arrays):
+            return function(*arrays).tolist()
+
+    return [function(*values) for values in zip(*columns)]
+
+
+def set_column(parms_list, name, values):
+    """
+    Set one Houdini Parameter on every Light.
+    :param parms_list: Houdini Parameters of every Light
+    :param name: Houdini Parameter name
+    :param values: Column values
+    :return: None
+    """
+    for parms, value in zip(parms_list, values):
+        parms[name] = value
+
+
+# Common Column Converters
+def column_value(parms_list, names, values, lights, scale, table):
+    set_column(parms_list, names[0], values)
+
+
+def column_skip(parms_list, names, values, lights, scale, table):
+    pass
+
+
+def column_scaled(parms_list, names, values, lights, scale, table):
+    set_column(parms_list, names[0], map_columns(lambda value: value * scale, values))
+
+
+def column_double_scaled(parms_list, names, values, lights, scale, table):
+    set_column(parms_list, names[0], map_columns(lambda value: value * 2 * scale, values))
+
+
+def column_contribution(parms_list, names, values, lights, scale, table):
+    contributions = [0.5 <= value <= 1 for value in values]
+    for name in names:
+        set_column(parms_list, name, contributions)
+
+
+def column_constant(converter):
+    """
+    Column Converter of a Converter which only depends on the Maya Light Type and Scene Scale.
+    :param converter: Converter
+    :return: Column Converter
+    """
+    def column_converter(parms_list, names, values, lights, scale, table):
+        # Dictionary to store constant Parameters py2 or py3
+        if sys.version[0] == "3":
+            constant_parms = {}
+        else:
+            constant_parms = OrderedDict()
+        converter(constant_parms, names, values[0], lights[0], scale, table)
+
+        for parms in parms_list:
+            parms.update(constant_parms)
+
+    return column_converter
+
+
+def column_color_temperature(parms_list, names, values, lights, scale, table):
+    colors = [temperature_color(value) for value in values]
+    for index, parm in enumerate(color_parms):
+        set_column(parms_list, table[parm][0][0], [color[index] for color in colors])
+
+
+# Mantra Column Converters
+def column_mantra_rotate_x(parms_list, names, values, lights, scale, table):
+    if lights[0]["nodeType"] == "cylinderC" or lights[0]["nodeType"] == "cylinderL":
+        values = map_columns(lambda value: value * -1, values)
+    set_column(parms_list, names[0], values)
+
+
+def column_mantra_rotate_y(parms_list, names, values, lights, scale, table):
+    if lights[0]["nodeType"] == "aiSkyDomeLight":
+        values = map_columns(lambda value: value + 180, values)
+    set_column(parms_list, names[0], values)
+
+
+def column_mantra_rotate_z(parms_list, names, values, lights, scale, table):
+    if lights[0]["nodeType"] == "cylinderC" or lights[0]["nodeType"] == "cylinderL":
+        values = map_columns(lambda value: value + 90, values)
+    set_column(parms_list, names[0], values)
+
+
+def column_mantra_scale_z(parms_list, names, values, lights, scale, table):
+    if lights[0]["nodeType"] == "cylinderC":
+        scale_x = [light.get("scaleX") for light in lights]
+        values = map_columns(lambda value, x: ((value + x) / 2) * (40 / 3) * scale, values, scale_x)
+    else:
+        values = map_columns(lambda value: value * scale, values)
+    set_column(parms_list, names[0], values)
+
+
+def column_mantra_exposure(normalize_parm):
+    """
+    Column Converter of the Mantra Exposure Converters.
+    :param normalize_parm: Maya Normalize Parameter name of the Exposure Parameter
+    :return: Column Converter
+    """
+    def column_converter(parms_list, names, values, lights, scale, table):
+        node_type = lights[0]["nodeType"]
+        if node_type == "aiSkyDomeLight":
+            pass
+        elif normalize_parm == "aiNormalize" and (node_type == "directionalLightD" or
+                                                  node_type == "directionalLightS"):
+            values = [light_exposure_calc(value, 2 ** -2.65, 1, 1) for value in values]
+        elif normalize_parm == "normalize" and node_type == "cylinderL":
+            values = [light_exposure_calc(value, 0.05, 1, scale) for value in values]
+        else:
+            values = [light_exposure_calc(value, 2 ** -2.65, 1, scale)
+                      if light.get(normalize_parm) is None or light[normalize_parm] else value
+                      for value, light in zip(values, lights)]
+        set_column(parms_list, names[0], values)
+
+    return column_converter
+
+
+def column_mantra_radius(parms_list, names, values, lights, scale, table):
+    values = map_columns(lambda value: value * 2 * scale, values)
+    set_column(parms_list, names[0], values)
+    set_column(parms_list, names[1], values)
+
+
+def column_mantra_angle(parms_list, names, values, lights, scale, table):
+    set_column(parms_list, names[0], map_columns(lambda value: value / 2, values))
+
+
+def column_mantra_soft_edge(parms_list, names, values, lights, scale, table):
+    set_column(parms_list, names[0], values)
+    for parms, value, light in zip(parms_list, values, lights):
+        if value != 0:
+            normalize = light["aiNormalize"] if "aiNormalize" in light else light["normalize"]
+            exposure = light["aiExposure"] if "aiExposure" in light else light["exposure"]
+            parms["light_exposure"] = soft_edge_exposure_calc(normalize, exposure, scale, value)
+
+
+# Arnold Column Converters
+def column_arnold_scale_y(parms_list, names, values, lights, scale, table):
+    node_type = lights[0]["nodeType"]
+    if node_type == "disk":
+        scale_x = [light.get("scaleX") for light in lights]
+        values = map_columns(lambda value, x: ((value + x) / 2) * scale, values, scale_x)
+    elif node_type == "areaLight" or node_type == "quad":
+        values = map_columns(lambda value: value * 2 * scale, values)
+    elif node_type == "cylinder":
+        values = map_columns(lambda value: (value * 2) * scale, values)
+    else:
+        values = map_columns(lambda value: value * scale, values)
+    set_column(parms_list, names[0], values)
+
+
+def column_arnold_scale_z(parms_list, names, values, lights, scale, table):
+    if lights[0]["nodeType"] == "cylinder":
+        scale_x = [light.get("scaleX") for light in lights]
+        values = map_columns(lambda value, x: ((value + x) / 2) * scale, values, scale_x)
+    else:
+        values = map_columns(lambda value: value * scale, values)
+    set_column(parms_list, names[0], values)
+
+
+def column_arnold_exposure(normalize_parm):
+    """
+    Column Converter of the Arnold Exposure Converters.
+    :param normalize_parm: Maya Normalize Parameter name of the Exposure Parameter
+    :return: Column Converter
+    """
+    def column_converter(parms_list, names, values, lights, scale, table):
+        if lights[0]["nodeType"] != "directionalLight":
+            values = [light_exposure_calc(value, 1, 1, scale) if light.get(normalize_parm) else value
+                      for value, light in zip(values, lights)]
+            set_column(parms_list, names[0], values)
+
+    return column_converter
+
+
+def column_arnold_cone_angle(parms_list, names, values, lights, scale, table):
+    values = [value if light["penumbraAngle"] < 0 else value + (light["penumbraAngle"] * 2)
+              for value, light in zip(values, lights)]
+    set_column(parms_list, names[0], values)
+
+
+def column_arnold_penumbra_angle(parms_list, names, values, lights, scale, table):
+    set_column(parms_list, names[0], map_columns(abs, values))
+
+
+# Column Converters of the Common Converters, used by every backend
+column_converters = {convert_value: column_value,
+                     convert_skip: column_skip,
+                     convert_scaled: column_scaled,
+                     convert_double_scaled: column_double_scaled,
+                     convert_contribution: column_contribution,
+                     convert_color_temperature: column_color_temperature}
+
+# Column Converters of the Mantra backend
+mantra_column_converters = {convert_mantra_light_type: column_constant(convert_mantra_light_type),
+                            convert_mantra_rotate_x: column_mantra_rotate_x,
+                            convert_mantra_rotate_y: column_mantra_rotate_y,
+                            convert_mantra_rotate_z: column_mantra_rotate_z,
+                            convert_mantra_scale_z: column_mantra_scale_z,
+                            convert_mantra_ai_exposure: column_mantra_exposure("aiNormalize"),
+                            convert_mantra_exposure: column_mantra_exposure("normalize"),
+                            convert_mantra_radius: column_mantra_radius,
+                            convert_mantra_angle: column_mantra_angle,
+                            convert_mantra_soft_edge: column_mantra_soft_edge}
+
+# Column Converters of the Arnold backend
+arnold_column_converters = {convert_arnold_light_type: column_constant(convert_arnold_light_type),
+                            convert_arnold_scale_y: column_arnold_scale_y,
+                            convert_arnold_scale_z: column_arnold_scale_z,
+                            convert_arnold_ai_exposure: column_arnold_exposure("aiNormalize"),
+                            convert_arnold_exposure: column_arnold_exposure("normalize"),
+                            convert_arnold_cone_angle: column_arnold_cone_angle,
+                            convert_arnold_penumbra_angle: column_arnold_penumbra_angle}
+
+# Mantra and Arnold are registered by light_conversion.py before their Column Converters exist
+add_column_converters("Mantra", mantra_column_converters)
+add_column_converters("Arnold", arnold_column_converters)
+
+
+def convert_lights(renderer, lights, scale, decomposed=None):
+    """
+    Convert many exported Lights of one Renderer to Houdini Parameter values, same as convert_light() on each.
+    :param renderer: Renderer name
+    :param lights: List of exported Light Parameters of the Renderer
+    :param scale: Scene Scale Value
+    :param decomposed: Dictionary of decomposed World Matrices, shared with the other Renderers of the same Lights
+    :return: List of Dictionaries of Houdini Parameter to value, in lights order
+    """
+    # World Matrices are decomposed first, Transform Parameters are converted like any other column
+    if decomposed is None:
+        decomposed = {}
+    lights = [expand_world_matrix(light, parm_table(renderer, light["nodeType"]), decomposed=decomposed)
+              for light in lights]
+
+    # Column Converters of the Renderer backend, added to the common ones
+    renderer_columns = dict(column_converters)
+    renderer_columns.update(renderer_backends[renderer]["column_converters"])
+
+    # Lights with the same Maya Light Type and exported keys share their columns
+    groups = {}
+    for index, light in enumerate(lights):
+        groups.setdefault((light["nodeType"], tuple(light)), []).append(index)
+
+    converted = [None] * len(lights)
+    for (node_type, keys), indices in groups.items():
+        table = parm_table(renderer, node_type)
+        group_lights = [lights[index] for index in indices]
+
+        # Houdini Parameters of every Light py2 or py3
+        if sys.version[0] == "3":
+            parms_list = [{} for index in indices]
+        else:
+            parms_list = [OrderedDict() for index in indices]
+
+        # Parameters are converted in the order of convert_light()
+        for parm in conversion_order(group_lights[0]):
+            names, converter = table[parm]
+            values = [light[parm] for light in group_lights]
+            if converter in renderer_columns:
+                renderer_columns[converter](parms_list, names, values, group_lights, scale, table)
+            else:
+                for parms, value, light in zip(parms_list, values, group_lights):
+                    converter(parms, names, value, light, scale, table)
+
+        for index, parms in zip(indices, parms_list):
+            converted[index] = parms
+
+    return converted
+
+
+def resolve_lights(lights, scale, renderers):
+    """
+    Resolve many exported Lights, same as resolve_light() on each.
+    :param lights: List of (Light name, Exported Light data)
+    :param scale: Scene Scale Value
+    :param renderers: Renderer names to resolve, in the order of the registered backends
+    :return: List of Dictionaries of Renderer to resolved Light Node, in lights order
+    """
+    # Convert every Renderer in one batch, from the exported Light data of its backend source,
+    # the World Matrix of a Light is the same for every Renderer and decomposed once
+    converted = {}
+    decomposed = {}
+    for renderer in renderers:
+        source = renderer_backends[renderer]["source"]
+        indices = [index for index, (light_name, light_json) in enumerate(lights)
+                   if source in light_json and "parms" not in light_json[source]
+                   and "parms" not in light_json.get(renderer, {}) and frames_key not in light_json]
+        parms_list = convert_lights(renderer, [lights[index][1][source] for index in indices], scale, decomposed)
+        converted[renderer] = dict(zip(indices, parms_list))
+
+    resolved_lights = []
+    for index, (light_name, light_json) in enumerate(lights):
+        # Animated Lights are converted frame by frame
+        if frames_key in light_json:
+            resolved_lights.append(resolve_light(light_name, light_json, scale, renderers))
+            continue
+
+        # Dictionary to store resolved Light Nodes py2 or py3
+        if sys.version[0] == "3":
+            resolved = {}
+        else:
+            resolved = OrderedDict()
+
+        for renderer in renderers:
+            if "parms" in light_json.get(renderer, {}):
+                resolved[renderer] = light_json[renderer]
+            elif index in converted[renderer]:
+                resolved[renderer] = resolved_node(renderer, light_name,
+                                                   light_json[renderer_backends[renderer]["source"]],
+                                                   converted[renderer][index])
+
+        resolved_lights.append(resolved)
+
+    return resolved_lights
+
+
+# Renderer plugins, their Column Converters can use the ones above
+load_plugins()
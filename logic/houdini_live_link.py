@@ -0,0 +1,178 @@
+"""
+
+houdini_live_link.py
+
+This file contains the Houdini side of the Live Link: Lights published by Maya are updated while they are edited.
+
+Records are received on a worker thread and applied on the Houdini main thread, from an event loop callback.
+Every record received since the last callback is applied at once, so a Light changed several times is updated once.
+
+"""
+
+import sys
+import hou
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from logic import houdini_logic
+from logic.live_link import default_port, merge_delta, connect, receive_records, close_socket
+from logic.light_file import schema_key, temperatures_key
+from logic.light_schema import schema_version
+from logic.color_temperature import add_temperature_record
+
+# Live Link subscriber state
+# connection: Socket connected to Maya, None when stopped
+# records: Queue of (Light name, Light data) received by the worker thread, (None, None) once Maya closed
+# lights: Light name: Light data received so far
+# settings: Scene Scale Value, Mantra Checkbox, Arnold Checkbox, Renderer names
+# registry: Texture registry from houdini_logic.texture_registry()
+# node_index: Node index from houdini_logic.light_node_index()
+# applied: Number of Light updates applied
+subscriber_state = {"connection": None, "records": queue.Queue(), "lights": {}, "settings": None, "registry": None,
+                    "node_index": None, "applied": 0}
+
+
+def status_message(message, warning=False):
+    """
+    Show a Live Link message on the Status Bar, there is none in hython.
+    :param message: Message text
+    :param warning: Show as a Warning
+    :return: None
+    """
+    if hou.isUIAvailable():
+        hou.ui.setStatusMessage(message, severity=hou.severityType.Warning if warning else hou.severityType.Message)
+    else:
+        sys.stdout.write("{0}{1}\n".format("Warning: " if warning else "", message))
+
+
+def received_lights():
+    """
+    Take every record received since the last call, in order.
+    :return: List of changed Light names, True if Maya closed the Live Link
+    """
+    changed = []
+    closed = False
+    records = subscriber_state["records"]
+    while True:
+        try:
+            light, light_data = records.get_nowait()
+        except queue.Empty:
+            break
+
+        if light is None:
+            closed = True
+        elif light == schema_key:
+            version = light_data["light_schema"]["version"]
+            if version != schema_version:
+                status_message("Maya publishes Light schema {0}, this package uses {1}.".format(
+                    version, schema_version), warning=True)
+        elif light == temperatures_key:
+            add_temperature_record(light_data)
+        else:
+            merge_delta(subscriber_state["lights"], light, light_data)
+            if light not in changed:
+                changed.append(light)
+
+    return changed, closed
+
+
+def update_lights(lights):
+    """
+    Update the Houdini Light Nodes of changed Lights, with their changed Parameters only.
+    :param lights: Light names
+    :return: None
+    """
+    scale, mantra_check, arnold_check, renderers = subscriber_state["settings"]
+    new_nodes = []
+    for light in lights:
+        try:
+            imported = houdini_logic.import_light(light, subscriber_state["lights"][light], scale, mantra_check,
+                                                  arnold_check, True, subscriber_state["registry"],
+                                                  subscriber_state["node_index"], renderers)
+        except hou.ObjectWasDeleted:
+            # Light Node deleted in Houdini since the last update, created again
+            subscriber_state["node_index"] = houdini_logic.light_node_index()
+            subscriber_state["registry"] = houdini_logic.texture_registry()
+            imported = houdini_logic.import_light(light, subscriber_state["lights"][light], scale, mantra_check,
+                                                  arnold_check, True, subscriber_state["registry"],
+                                                  subscriber_state["node_index"], renderers)
+        new_nodes.extend(imported[1])
+
+    # Layout Light Nodes created for new Lights
+    if new_nodes:
+        houdini_logic.layout_light_nodes(new_nodes)
+
+
+def apply_records():
+    """
+    Houdini event loop callback, apply every record received since the last call.
+    The Live Link updates are not Undo steps, the Maya Scene holds the edits.
+    :return: Number of Lights updated
+    """
+    if subscriber_state["connection"] is None:
+        return 0
+
+    changed, closed = received_lights()
+    if changed:
+        with hou.undos.disabler():
+            update_lights(changed)
+        subscriber_state["applied"] += len(changed)
+
+    if closed:
+        stop_subscriber()
+        status_message("Live Link closed by Maya.")
+
+    return len(changed)
+
+
+def start_subscriber(scale, mantra_check, arnold_check, port=default_port, renderers=None):
+    """
+    Subscribe to the Lights published by Maya until stop_subscriber(), see maya_live_link.start_publisher().
+    Maya first sends every Light, then the changed Parameters of the edited Lights.
+    :param scale: Scene Scale Value
+    :param mantra_check: Mantra Checkbox
+    :param arnold_check: Arnold Checkbox
+    :param port: Port of the Maya publisher
+    :param renderers: Renderer names of any registered backend, replacing the Checkboxes if given
+    :return: None
+    """
+    stop_subscriber()
+    renderers = houdini_logic.selected_renderers(mantra_check, arnold_check, renderers)
+
+    connection = connect(port)
+    subscriber_state.update({"connection": connection, "records": queue.Queue(), "lights": {},
+                             "settings": (scale, mantra_check, arnold_check, renderers),
+                             "registry": houdini_logic.texture_registry(),
+                             "node_index": houdini_logic.light_node_index(), "applied": 0})
+
+    records = subscriber_state["records"]
+    receive_records(connection, lambda light, light_data: records.put((light, light_data)))
+    if hou.isUIAvailable():
+        hou.ui.addEventLoopCallback(apply_records)
+
+    status_message("Live Link connected to Maya on port {0}.".format(port))
+
+
+def stop_subscriber():
+    """
+    Stop updating the Lights and disconnect from Maya.
+    :return: None
+    """
+    if subscriber_state["connection"] is None:
+        return
+
+    if hou.isUIAvailable() and apply_records in hou.ui.eventLoopCallbacks():
+        hou.ui.removeEventLoopCallback(apply_records)
+    close_socket(subscriber_state["connection"])
+    subscriber_state.update({"connection": None, "registry": None, "node_index": None})
+
+
+def is_subscribed():
+    """
+    Live Link subscriber state.
+    :return: True while the Lights are updated
+    """
+    return subscriber_state["connection"] is not None
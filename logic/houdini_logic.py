@@ -9,728 +9,637 @@ This file contains all the Houdini logic to load Json file and create Lights.
 import os
 import sys
 import json
+import time
+import hashlib
+import posixpath
+import threading
 import hou
-import math
 
-# Current script path
-package_path = os.path.dirname(os.path.realpath(__file__))
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
-# Json file path
-json_file_path = os.path.join(package_path, "maya_to_houdini_light_data.json")
+from logic.light_file import read_light_file, reduce_curve, schema_mismatch
+from logic.texture_check import check_light_files, texture_problems, texture_summary
+from logic.light_conversion import resolve_light
+from logic.conversion_kernel import resolve_lights
+from logic.renderer_backends import renderer_backends, selected_backends
+from logic.progress import add_time, timings_message
 
-# Load maya_to_houdini_light_data Json for py2 or py3
-if sys.version[0] == "3":
-    with open(json_file_path, "r") as json_file:
-        light_data = json.load(json_file)
-else:
+if sys.version[0] != "3":
     from collections import OrderedDict
-    with open(json_file_path, "r") as json_file:
-        light_data = json.load(json_file, object_pairs_hook=OrderedDict)
+
+obj = hou.node("obj")
+mat = hou.node("mat")
+
+# Node User Data holding the Parameters set by the last Import
+imported_parms_key = "maya_light_parms"
+
+# Node User Data holding the frames and keyframes set by the last Import
+imported_keyframes_key = "maya_light_keyframes"
+
+# Keys on a straight line between their neighbours, within this tolerance, are not set
+keyframe_tolerance = 1e-6
+
+# Node User Data holding the Maya DAG path and the Renderer of imported Light Nodes
+dag_path_data = "maya_dag_path"
+renderer_data = "maya_renderer"
+
+# Node User Data holding the Light file imported Light Nodes come from
+source_file_data = "maya_light_file"
+
+# Node User Data holding the Texture key of shared texture Materials
+texture_key_data = "maya_texture_key"
+
+# Number of Lights converted together ahead of the Node creation, and converted chunks waiting to be created
+resolve_chunk_size = 256
+resolve_queue_size = 4
+
+# Texture Material orientation, and Color Space of textures exported without one
+texture_orientation = 1
+default_texture_colorspace = "auto"
+
+
+def texture_key(texture_map, colorspace, orientation):
+    """
+    Texture key of a texture Material, the same for every spelling of the same texture path.
+    :param texture_map: Texture file path
+    :param colorspace: Texture Color Space
+    :param orientation: Texture orientation
+    :return: Content hash
+    """
+    path = posixpath.normpath(texture_map.replace("\\", "/"))
+    content = json.dumps([path, colorspace, orientation])
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+def texture_registry():
+    """
+    Shared texture Materials already in the Houdini Scene, created by previous Imports.
+    :return: Texture registry
+        nodes: Dictionary of Texture key to Texture Node
+        uses: Dictionary of Texture key to number of Lights using it in this Import
+        created: Number of Texture Nodes created by this Import
+    """
+    nodes = {}
+    for tex_node in mat.children():
+        key = tex_node.userData(texture_key_data)
+        if key:
+            nodes[key] = tex_node
+
+    return {"nodes": nodes, "uses": {}, "created": 0}
 
 
-def light_exposure_calc(light_exposure, renderer_conversion_factor, old_scale, new_scale):
+def texture_node(name, texture_map, registry, colorspace=None):
     """
-    Calculate Light Exposure based on Scene Scale and Renderer Conversion Factor.
-    :param light_exposure: Light Exposure Value
-    :param renderer_conversion_factor: Renderer Conversion Factor
-    :param old_scale: Old Scene Scale
-    :param new_scale: New Scene Scale
-    :return: New Exposure Value
+    Texture Material used by Mantra Area and Quad Lights, shared by every Light using the same texture.
+    The Material is created if no Material of the registry has the same Texture key.
+    :param name: Maya file node name, used to name a new Material
+    :param texture_map: Texture file path
+    :param registry: Texture registry from texture_registry()
+    :param colorspace: Texture Color Space, default_texture_colorspace if None
+    :return: Texture Node
     """
-    # Exposure to Intensity conversion
-    exposure_to_intensity = 2 ** light_exposure
+    if colorspace is None:
+        colorspace = default_texture_colorspace
+    key = texture_key(texture_map, colorspace, texture_orientation)
+    registry["uses"][key] = registry["uses"].get(key, 0) + 1
 
-    # Renderer Intensity conversion factor
-    renderer_total_intensity = renderer_conversion_factor * exposure_to_intensity
+    if key in registry["nodes"]:
+        return registry["nodes"][key]
 
-    # Scale Factor
-    scale_factor = new_scale / old_scale
+    tex_node = mat.node(name)
+    if tex_node and (tex_node.userData(texture_key_data) or tex_node.parm("map").eval() != texture_map):
+        # Name taken by another texture
+        name = "{0}_{1}".format(name, key[:8])
+        tex_node = mat.node(name)
 
-    # New Intensity based on Scale Factor
-    new_intensity = (scale_factor ** 2) * renderer_total_intensity
+    # Material of an Import without Texture keys, or a new one
+    if not tex_node:
+        tex_node = mat.createNode("texture::2.0", name)
+        tex_node.parm("orient").set(texture_orientation)
+        tex_node.parm("map").set(texture_map)
+        registry["created"] += 1
+    tex_node.setUserData(texture_key_data, key)
 
-    # Intensity to Exposure conversion
-    intensity_to_exposure = math.log(new_intensity, 2)
-    return intensity_to_exposure
+    registry["nodes"][key] = tex_node
+    return tex_node
 
 
-def soft_edge_exposure_calc(normalize, exposure, scale, value):
+def texture_report(registry):
     """
-    Soft Edge Exposure Calculator for Lights with Soft Edge Parameter.
-    :param normalize: Light Normalize Value
-    :param exposure: Light Exposure Value
-    :param scale: New Scale Value
-    :param value: Soft Edge Value
-    :return: New Exposure Value based on Soft Edge Value
+    Texture deduplication summary of an Import.
+    :param registry: Texture registry from texture_registry()
+    :return: Message
     """
+    uses = sum(registry["uses"].values())
+    if not uses:
+        return ""
 
-    # Current Mantra Exposure Value
-    current_exposure = light_exposure_calc(exposure, 2 ** -2.65, 1, scale)
+    return "{0} textured Lights share {1} texture Materials ({2} created), {3:.1f}x deduplication.".format(
+        uses, len(registry["uses"]), registry["created"], uses / float(len(registry["uses"])))
 
-    # Exposure to Intensity conversion
-    total_int = 2 ** exposure
 
-    if normalize:
-        # Mantra Soft Edge conversion factor
-        mantra_total_int = 0.5 * total_int
+def selected_renderers(mantra_check, arnold_check, renderers=None):
+    """
+    Renderers to Import, in the order of the registered backends.
+    :param mantra_check: Mantra Checkbox
+    :param arnold_check: Arnold Checkbox
+    :param renderers: Renderer names of any registered backend, replacing the Checkboxes if given
+    :return: List of Renderer names
+    """
+    if renderers is None:
+        renderers = [renderer for renderer, check in [("Mantra", mantra_check), ("Arnold", arnold_check)] if check]
+    return [backend["name"] for backend in selected_backends(renderers)]
+
+
+def light_node_index():
+    """
+    Nodes of the Houdini Scene, indexed once so every imported Light finds its Nodes of previous Imports.
+    The network of every registered Renderer backend is indexed.
+    :return: Dictionary of
+        networks: {Network path: Network Node}, networks missing from the Scene are left out
+        paths: {(Renderer, Maya DAG path): Light Node imported with a DAG path}
+        names: {(Network path, Node name): Node}
+    """
+    node_index = {"networks": {}, "paths": {}, "names": {}}
+    for backend in renderer_backends.values():
+        network_path = backend["network"]
+        if network_path in node_index["networks"]:
+            continue
+        network = obj if network_path == obj.path() else hou.node(network_path)
+        if network is None:
+            continue
+        node_index["networks"][network_path] = network
+
+        for light_obj in network.children():
+            node_index["names"][(network_path, light_obj.name())] = light_obj
+            dag_path = light_obj.userData(dag_path_data)
+            if dag_path is not None:
+                node_index["paths"][(light_obj.userData(renderer_data), dag_path)] = light_obj
+
+    return node_index
+
+
+def indexed_light_node(node_index, renderer, light_name, dag_path):
+    """
+    Light Node of a previous Import of one Light, found by its Maya DAG path, or by its name if imported without one.
+    Nodes imported from another Maya DAG path are never returned.
+    :param node_index: Node index from light_node_index()
+    :param renderer: Renderer name
+    :param light_name: Houdini Node name
+    :param dag_path: Maya DAG path of the Light, None for files exported without it
+    :return: Houdini Node or None
+    """
+    if dag_path is not None and (renderer, dag_path) in node_index["paths"]:
+        return node_index["paths"][(renderer, dag_path)]
 
-        # Scale Factor
-        scale_factor = scale / 1
+    light_obj = node_index["names"].get((renderer_backends[renderer]["network"], light_name))
+    if light_obj and dag_path is not None and light_obj.userData(dag_path_data) not in [None, dag_path]:
+        return None
+    return light_obj
 
-        # New Intensity based on Scale Factor
-        new_intensity = (scale_factor ** 2) * mantra_total_int
 
-        # Intensity to Exposure conversion
-        mantra_exp = math.log(new_intensity, 2)
+def apply_parms(light_obj, parms, ordered_parms=()):
+    """
+    Set Houdini Parameters on a Light Node in one call.
+    Light Type and multiparm count Parameters are set first on their own, as the other Parameters depend on them.
+    :param light_obj: Light Node
+    :param parms: Dictionary of Houdini Parameter to value
+    :param ordered_parms: Houdini Parameters set first, from the Renderer backend
+    :return: None
+    """
+    # Parameters keep their order py2 or py3
+    if sys.version[0] == "3":
+        bulk_parms = dict(parms)
     else:
-        # Mantra Soft Edge conversion factor
-        mantra_total_int = 0.8 * total_int
+        bulk_parms = OrderedDict(parms)
+    for parm in ordered_parms:
+        if parm in bulk_parms:
+            light_obj.parm(parm).set(bulk_parms.pop(parm))
 
-        # Intensity to Exposure conversion
-        mantra_exp = math.log(mantra_total_int, 2)
+    if bulk_parms:
+        light_obj.setParms(bulk_parms)
 
-    # New Exposure Value Calculation using Fit Range
-    # Soft Edge Value Range
-    old_range = [1, 0]
 
-    # Soft Edge required minimum Exposure to Old Exposure Value Range
-    new_range = [mantra_exp, current_exposure]
+def apply_keyframes(light_obj, frames, keyframes):
+    """
+    Set animated Houdini Parameters, one setKeyframes call per Parameter with linear keys.
+    Keys on a straight line between the keys around them are skipped, linear interpolation gives the same values.
+    :param light_obj: Light Node
+    :param frames: Sampled frames
+    :param keyframes: Dictionary of Houdini Parameter to value per frame
+    :return: None
+    """
+    for parm, values in keyframes.items():
+        keys = []
+        for index in reduce_curve(values, keyframe_tolerance):
+            key = hou.Keyframe()
+            key.setFrame(frames[index])
+            key.setValue(values[index])
+            key.setExpression("linear()", hou.exprLanguage.Hscript)
+            keys.append(key)
 
-    # Fit Range Soft Edge Value to Exposure based on above 2 Ranges
-    old_percentage = (value - old_range[0]) / (old_range[1] - old_range[0])
-    soft_edge_exposure = ((new_range[1] - new_range[0]) * old_percentage) + new_range[0]
+        houdini_parm = light_obj.parm(parm)
+        houdini_parm.deleteAllKeyframes()
+        houdini_parm.setKeyframes(keys)
 
-    return soft_edge_exposure
 
+def changed_parms(light_obj, parms):
+    """
+    Houdini Parameters whose current value on the Light Node differs from the imported value.
+    Parameters changed by hand in Houdini are set back to the imported value, the others are not set again.
+    Parameters the Light Node doesn't have yet are changed.
+    :param light_obj: Light Node
+    :param parms: Dictionary of Houdini Parameter to value
+    :return: Dictionary of changed Houdini Parameter to value
+    """
+    changed = {}
+    for parm, value in parms.items():
+        houdini_parm = light_obj.parm(parm)
+        if houdini_parm is None or houdini_parm.eval() != value:
+            changed[parm] = value
 
-obj = hou.node("obj")
-mat = hou.node("mat")
+    return changed
 
 
-def import_json_file(path, scale, mantra_check, arnold_check):
+def import_light(light, light_json, scale, mantra_check, arnold_check, update=False, registry=None,
+                 node_index=None, renderers=None, source_file=None):
     """
-    Load Json file and Import Lights to Houdini Scene.
-    :param path: Json file path
+    Create or update the Houdini Light Nodes of one exported Light, for every selected Renderer backend.
+    :param light: Light name
+    :param light_json: Exported Light data
     :param scale: Scene Scale Value
     :param mantra_check: Mantra Checkbox
     :param arnold_check: Arnold Checkbox
+    :param update: Update existing Light Nodes with the changed Parameters only, instead of recreating them
+    :param registry: Texture registry from texture_registry(), the Scene is scanned if None
+    :param node_index: Node index from light_node_index(), the Scene is scanned if None
+    :param renderers: Renderer names from selected_renderers(), replacing the Checkboxes if given
+    :param source_file: Light file path from light_file_path(), saved on the Light Nodes if given
+    :return: Imported Light Nodes, Created Light Nodes
+    """
+    light_nodes = []
+    new_nodes = []
+
+    # Renderers to Import
+    if renderers is None:
+        renderers = selected_renderers(mantra_check, arnold_check)
+
+    # Loop through resolved Light Nodes of every Renderer
+    for renderer, node in resolve_light(light, light_json, scale, renderers).items():
+        backend = renderer_backends[renderer]
+        light_name = node["light_name"]
+        light_node_type = node["light_node_type"]
+        parms = node["parms"]
+
+        # Mantra Texture Map is applied through a texture Material
+        if "texture_node" in node:
+            if registry is None:
+                registry = texture_registry()
+            tex_node = texture_node(node["texture_node"], node["texture_map"], registry,
+                                    node.get("texture_colorspace"))
+            parms["shop_materialpath"] = tex_node.path()
+
+        # Animated Parameters
+        keyframes = node.get("keyframes", {})
+
+        # Record of the imported Parameters, to find the changes on the next Import
+        imported_parms = json.dumps(parms, sort_keys=True)
+        imported_keyframes = json.dumps([node["frames"], keyframes], sort_keys=True) if keyframes else ""
+
+        # Light Node of a previous Import
+        if node_index is None:
+            node_index = light_node_index()
+        dag_path = node.get("dag_path")
+        light_obj = indexed_light_node(node_index, renderer, light_name, dag_path)
+
+        # Update already existing Light with the changed Parameters only
+        if update and light_obj and light_obj.type().name() == light_node_type:
+            # Light renamed in Maya, or named differently to avoid a name collision
+            if light_obj.name() != light_name:
+                node_index["names"].pop((backend["network"], light_obj.name()), None)
+                light_obj.setName(light_name, unique_name=True)
+                node_index["names"][(backend["network"], light_obj.name())] = light_obj
+
+            previous_keyframes = light_obj.userData(imported_keyframes_key)
+            if previous_keyframes != imported_keyframes:
+                # Parameters which are not animated anymore lose their keys
+                if previous_keyframes:
+                    for parm in json.loads(previous_keyframes)[1]:
+                        if parm not in keyframes:
+                            light_obj.parm(parm).deleteAllKeyframes()
+
+                apply_keyframes(light_obj, node.get("frames"), keyframes)
+                light_obj.setUserData(imported_keyframes_key, imported_keyframes)
+
+            # Light Type and multiparm counts first, the multiparm instances exist once their count is set
+            ordered_parms = [parm for parm in backend["ordered_parms"] if parm in parms]
+            apply_parms(light_obj, changed_parms(light_obj, dict((parm, parms[parm]) for parm in ordered_parms)),
+                        ordered_parms)
+            changed = changed_parms(light_obj, dict((parm, value) for parm, value in parms.items()
+                                                    if parm not in ordered_parms))
+            if changed:
+                apply_parms(light_obj, changed)
+            if light_obj.userData(imported_parms_key) != imported_parms:
+                light_obj.setUserData(imported_parms_key, imported_parms)
+
+        else:
+            # Delete already existing Light from Houdini Scene
+            if light_obj:
+                node_index["names"].pop((backend["network"], light_obj.name()), None)
+                light_obj.destroy()
+
+            # Create Light in the network of the Renderer backend,
+            # Houdini makes the name unique if a Node of another Maya Light has it
+            network = node_index["networks"][backend["network"]]
+            if backend["create_node"]:
+                light_obj = backend["create_node"](network, light_node_type, light_name)
+            else:
+                light_obj = network.createNode(light_node_type, light_name)
+            node_index["names"][(backend["network"], light_obj.name())] = light_obj
+            new_nodes.append(light_obj)
+
+            # Set Houdini Parameters
+            apply_parms(light_obj, parms, backend["ordered_parms"])
+            apply_keyframes(light_obj, node.get("frames"), keyframes)
+            light_obj.setUserData(imported_parms_key, imported_parms)
+            light_obj.setUserData(imported_keyframes_key, imported_keyframes)
+
+        # Maya DAG path, also on Lights imported before it was exported
+        if dag_path is not None and light_obj.userData(dag_path_data) != dag_path:
+            light_obj.setUserData(dag_path_data, dag_path)
+            light_obj.setUserData(renderer_data, renderer)
+            node_index["paths"][(renderer, dag_path)] = light_obj
+
+        # Light file of the Import, Remove Missing only deletes the Lights of the same file
+        if source_file is not None and light_obj.userData(source_file_data) != source_file:
+            light_obj.setUserData(source_file_data, source_file)
+
+        # Keep selected
+        light_obj.setSelected(True)
+
+        # Append Light Node to the list
+        light_nodes.append(light_obj)
+
+    return light_nodes, new_nodes
+
+
+def light_file_path(path):
+    """
+    Light file path saved on the imported Light Nodes, the same for every spelling of the path.
+    :param path: Json, Json Lines or Binary Light Rig file path
+    :return: Absolute normalized path
+    """
+    return os.path.normcase(os.path.abspath(path))
+
+
+def remove_missing_lights(imported_nodes, source_file, mantra_check, arnold_check, renderers=None):
+    """
+    Delete Lights created by a previous Import of the same file which are not in the file anymore.
+    Lights imported from other files are kept.
+    :param imported_nodes: Light Nodes of the current Import
+    :param source_file: Light file path from light_file_path()
+    :param mantra_check: Mantra Checkbox
+    :param arnold_check: Arnold Checkbox
+    :param renderers: Renderer names from selected_renderers(), replacing the Checkboxes if given
+    :return: Number of deleted Lights
+    """
+    imported_paths = set(light_obj.path() for light_obj in imported_nodes)
+
+    # Light Node name prefixes of the selected Renderers, per network
+    prefixes = {}
+    for renderer in renderers or selected_renderers(mantra_check, arnold_check):
+        backend = renderer_backends[renderer]
+        prefixes.setdefault(backend["network"], []).append(backend["node_name_prefix"])
+
+    removed = 0
+    for network_path, network_prefixes in prefixes.items():
+        network = obj if network_path == obj.path() else hou.node(network_path)
+        for light_obj in network.children() if network else []:
+            if light_obj.path() in imported_paths or not light_obj.name().startswith(tuple(network_prefixes)):
+                continue
+
+            # Only Lights created by this tool from the same file
+            if light_obj.userData(imported_parms_key) is not None and \
+                    light_obj.userData(source_file_data) == source_file:
+                light_obj.destroy()
+                removed += 1
+
+    return removed
+
+
+def preflight_textures(path):
+    """
+    Check the textures of a Light file before Import: missing files, unreadable headers and formats other than EXR.
+    With the Houdini UI the Import can be cancelled, otherwise the report is printed.
+    :param path: Json, Json Lines or Binary Light Rig file path
+    :return: True to Import the Lights
+    """
+    textures, results = check_light_files([path])
+    problems = texture_problems(textures, results)
+    if not [texture for texture_list in problems.values() for texture in texture_list]:
+        return True
+
+    lines = texture_summary(textures, results)
+    if not hou.isUIAvailable():
+        sys.stdout.write("\n".join(lines) + "\n")
+        return True
+
+    return hou.ui.displayMessage(lines[-1], buttons=("Import", "Cancel"), severity=hou.severityType.Warning,
+                                 default_choice=0, close_choice=1, title="Texture Check",
+                                 details="\n".join(lines[:-1])) == 0
+
+
+def resolved_chunks(path, scale, renderers, timings=None):
+    """
+    Read and convert the Lights of a Light file on a worker thread, ahead of the Houdini Node creation.
+    Only the conversion runs on the worker, hou is only used by the caller on the main thread.
+    :param path: Json, Json Lines or Binary Light Rig file path
+    :param scale: Scene Scale Value
+    :param renderers: Renderer names to resolve
+    :param timings: Dictionary of phase name to seconds, the worker time is added as "read and convert"
+    :return: Generator of lists of (Light name, resolved Light data, Fraction of the file read)
+    """
+    chunks = queue.Queue(resolve_queue_size)
+    stop = threading.Event()
+
+    def put(item):
+        # Give up if the Import stopped reading
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            started = time.time()
+            chunk = []
+            for light, light_json, file_progress in read_light_file(path):
+                chunk.append((light, light_json, file_progress))
+                if len(chunk) < resolve_chunk_size:
+                    continue
+                resolved = resolve_lights([(light, light_json) for light, light_json, progress in chunk], scale,
+                                          renderers)
+                started = add_time(timings, "read and convert", started)
+                if not put([(light, resolved_json, progress)
+                            for (light, light_json, progress), resolved_json in zip(chunk, resolved)]):
+                    return
+                chunk = []
+                started = time.time()
+
+            resolved = resolve_lights([(light, light_json) for light, light_json, progress in chunk], scale,
+                                      renderers)
+            add_time(timings, "read and convert", started)
+            if put([(light, resolved_json, progress)
+                    for (light, light_json, progress), resolved_json in zip(chunk, resolved)]):
+                put(None)
+        except Exception as error:
+            put(error)
+
+    thread = threading.Thread(target=worker, name="Import Lights reader")
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        stop.set()
+        thread.join()
+
+
+def layout_light_nodes(new_nodes):
+    """
+    Layout newly created Light Nodes in their networks, once per network.
+    :param new_nodes: Created Light Nodes
     :return: None
     """
+    networks = {}
+    for light_obj in new_nodes:
+        network = light_obj.parent()
+        networks.setdefault(network.path(), (network, []))[1].append(light_obj)
 
-    # Load Maya exported Json file as py2 or py3
-    if sys.version[0] == "3":
-        with open(path, "r") as file:
-            json_load = json.load(file)
-    else:
-        with open(path, "r") as file:
-            json_load = json.load(file, object_pairs_hook=OrderedDict)
+    for network, light_nodes in networks.values():
+        network.layoutChildren(items=light_nodes)
+
+
+def import_json_file(path, scale, mantra_check, arnold_check, progress_callback=None, update=False,
+                     remove_missing=False, texture_check=False, timings=None, renderers=None):
+    """
+    Load Json file and Import Lights to Houdini Scene.
+    Lights are read and converted on a worker thread, and created on the main thread while the file is being read.
+    The whole Import is one Undo step, and cooking is deferred until it is done.
+    A cancelled Import keeps the Lights fully imported so far, and doesn't remove missing Lights.
+    :param path: Json, Json Lines or Binary Light Rig file path
+    :param scale: Scene Scale Value
+    :param mantra_check: Mantra Checkbox
+    :param arnold_check: Arnold Checkbox
+    :param progress_callback: Called after every Light with (Number of Lights imported, Fraction of the file read),
+        returns True to cancel the Import
+    :param update: Only set the changed Parameters of existing Lights and only create new Lights
+    :param remove_missing: Delete Lights previously imported from this file which are not in it anymore
+    :param texture_check: Check the textures first, see preflight_textures()
+    :param timings: Dictionary of phase name to seconds, from progress.new_timings(), filled with the time per phase
+        and shown on the Status Bar
+    :param renderers: Renderer names of any registered backend, replacing the Checkboxes if given
+    :return: Texture registry of the Import, see texture_registry(), None if cancelled
+    """
+    # Texture pre-flight
+    started = time.time()
+    if texture_check and not preflight_textures(path):
+        return None
+    started = add_time(timings, "texture check", started) if texture_check else started
 
     # Houdini Light Nodes
     light_nodes = []
 
-    # Clear Houdini Node selection
-    hou.Node.setSelected(obj, False, clear_all_selected=True)
-
-    # Loop through Maya Exported Json file
-    for light in json_load:
-        # Loop through Renderer
-        for renderer in json_load[light].keys():
-            # Mantra Specific changes
-            if renderer == "Mantra" and mantra_check:
-                # Delete already existing Light from Houdini Scene
-                if bool(obj.node("mantra_{0}".format(light))):
-                    light_obj = obj.node("mantra_{0}".format(light))
-                    light_obj.destroy()
-
-                # Create Light
-                light_obj = obj.createNode(
-                    light_data[renderer][json_load[light][renderer]["nodeType"]]["light_node_type"],
-                    "mantra_{0}".format(light))
-
-                # Keep selected
-                light_obj.setSelected(True)
-
-                # Append Light Node to the list
-                light_nodes.append(light_obj)
-
-                # Set Viewport Icon Scale as per Scale Value
-                if json_load[light][renderer]["nodeType"] != "aiSkyDomeLight":
-                    light_obj.parm("iconscale").set(scale)
-
-                # Loop through Maya Exported Json
-                for parm, value in json_load[light][renderer].items():
-                    if parm == "nodeType":
-                        if json_load[light][renderer][parm] != "aiSkyDomeLight":
-                            # Set Light Type
-                            light_obj.parm("light_type").set(
-                                light_data[renderer][json_load[light][renderer][parm]]["light_node_sub_type"])
-
-                        # Set Default Parameters as per Light Type
-                        if json_load[light][renderer][parm] == "spotLightP" or \
-                                json_load[light][renderer][parm] == "spotLightS":
-                            light_obj.parm("coneenable").set(True)
-                        elif json_load[light][renderer][parm] == "areaLight":
-                            light_obj.parm("coneenable").set(True)
-                            light_obj.parm("singlesided").set(True)
-                            light_obj.parm("edgeenable").set(True)
-                        elif json_load[light][renderer][parm] == "quad":
-                            light_obj.parm("coneenable").set(True)
-                            light_obj.parm("singlesided").set(True)
-                            light_obj.parm("edgeenable").set(True)
-                        elif json_load[light][renderer][parm] == "disk":
-                            light_obj.parm("coneenable").set(True)
-                            light_obj.parm("singlesided").set(True)
-                        elif json_load[light][renderer][parm] == "cylinderC":
-                            light_obj.parm("rOrd").set(2)
-                            light_obj.parm("singlesided").set(True)
-                        elif json_load[light][renderer][parm] == "cylinderL":
-                            light_obj.parm("rOrd").set(2)
-                            light_obj.parm("singlesided").set(True)
-
-                        # Add Light Contributions
-                        light_obj.parm("light_contrib").set(
-                            light_data[renderer][json_load[light][renderer][parm]]["num_of_light_contrib"])
-                        for contrib in range(
-                                1, light_data[renderer][json_load[light][renderer][parm]]["num_of_light_contrib"] + 1):
-                            light_obj.parm("light_contribname{0}".format(contrib)).set(
-                                list(light_data["light_contribution_parms"])[contrib - 1])
-
-                    elif parm == "translateX":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                            value * scale)
-
-                    elif parm == "translateY":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                            value * scale)
-
-                    elif parm == "translateZ":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                            value * scale)
-
-                    elif parm == "rotateX":
-                        if json_load[light][renderer]["nodeType"] == "cylinderC" or \
-                                json_load[light][renderer]["nodeType"] == "cylinderL":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value * -1)
-                        else:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value)
-
-                    elif parm == "rotateY":
-                        if json_load[light][renderer]["nodeType"] == "aiSkyDomeLight":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value + 180)
-                        else:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value)
-
-                    elif parm == "rotateZ":
-                        if json_load[light][renderer]["nodeType"] == "cylinderC" or \
-                                json_load[light][renderer]["nodeType"] == "cylinderL":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value + 90)
-                        else:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value)
-
-                    elif parm == "scaleX":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                            value * 2 * scale)
-
-                    elif parm == "scaleY":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                            value * 2 * scale)
-
-                    elif parm == "scaleZ":
-                        if json_load[light][renderer]["nodeType"] == "cylinderC":
-                            scale_x = json_load[light][renderer].get("scaleX")
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                ((value + scale_x) / 2) * (40 / 3) * scale)
-                        else:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value * scale)
-
-                    elif parm == "aiExposure":
-                        if json_load[light][renderer]["nodeType"] == "aiSkyDomeLight":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value)
-                        elif json_load[light][renderer]["nodeType"] == "directionalLightD"\
-                                or json_load[light][renderer]["nodeType"] == "directionalLightS":
-                            exposure = light_exposure_calc(json_load[light][renderer][parm],
-                                                           2 ** -2.65, 1, 1)
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                exposure)
-                        else:
-                            if json_load[light][renderer].get("aiNormalize") is None or \
-                                    json_load[light][renderer]["aiNormalize"]:
-                                exposure = light_exposure_calc(json_load[light][renderer][parm],
-                                                               2 ** -2.65, 1, scale)
-                            else:
-                                exposure = value
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                exposure)
-
-                    elif parm == "exposure":
-                        if json_load[light][renderer]["nodeType"] == "aiSkyDomeLight":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                value)
-                        elif json_load[light][renderer]["nodeType"] == "cylinderL":
-                            exposure = light_exposure_calc(json_load[light][renderer][parm],
-                                                           0.05, 1, scale)
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                exposure)
-                        else:
-                            if json_load[light][renderer].get("normalize") is None or \
-                                    json_load[light][renderer]["normalize"]:
-                                exposure = light_exposure_calc(json_load[light][renderer][parm],
-                                                               2 ** -2.65, 1, scale)
-                            else:
-                                exposure = value
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                exposure)
-
-                    elif parm == "aiRadius":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm][0]).set(
-                            value * 2 * scale)
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm][1]).set(
-                            value * 2 * scale)
-
-                    elif parm == "aiAngle":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                            value / 2)
-
-                    elif parm == "coneAngle" or parm == "penumbraAngle":
-                        # Skipping this as it is adjusted with dropoff parameter
-                        pass
-
-                    elif parm == "dropoff":
-                        if value == 0 or value == 1:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set(1)
-                            if json_load[light][renderer]["penumbraAngle"] >= 90 and \
-                                    json_load[light][renderer]["coneAngle"] >= 90:
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["coneAngle"]).set(0)
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["penumbraAngle"]).set(90)
-                            elif json_load[light][renderer]["penumbraAngle"] >= 90 and \
-                                    json_load[light][renderer]["coneAngle"] < 90:
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["penumbraAngle"]).set(90)
-                            else:
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"]["coneAngle"]).set(
-                                    json_load[light][renderer]["coneAngle"])
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["penumbraAngle"]).set(json_load[light][renderer]["penumbraAngle"])
-
-                        elif 1 > value > 0:
-                            dropoff = 1 - (math.log(100 - (value * 100), 100))
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(dropoff)
-
-                        elif value > 1:
-                            if json_load[light][renderer]["nodeType"] == "spotLightP":
-                                light_obj.parm("sharpspot").set(False)
-                                if json_load[light][renderer]["penumbraAngle"] > \
-                                        json_load[light][renderer]["coneAngle"]:
-                                    coneangle = json_load[light][renderer]["coneAngle"] / 2
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["coneAngle"]).set(0)
-                                    light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                   ["light_parms"][parm]).set(value)
-                                    if json_load[light][renderer]["penumbraAngle"] >= 90:
-                                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                       ["light_parms"]["penumbraAngle"]).set(90)
-                                    else:
-                                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                       ["light_parms"]["penumbraAngle"]).set(
-                                            json_load[light][renderer]["penumbraAngle"] + coneangle)
-                                else:
-                                    coneangle = json_load[light][renderer]["coneAngle"] / 2
-                                    penumbra = json_load[light][renderer]["penumbraAngle"] / 2
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["coneAngle"]).set(0)
-                                    light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                   ["light_parms"][parm]).set(value)
-                                    if coneangle + penumbra > 90:
-                                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                       ["light_parms"]["penumbraAngle"]).set(90)
-                                    else:
-                                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                       ["light_parms"]["penumbraAngle"]).set(coneangle + penumbra)
-                            else:
-                                light_obj.parm("sharpspot").set(True)
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"][parm]).set(value)
-                                if json_load[light][renderer]["penumbraAngle"] >= 90:
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["coneAngle"]).set(0)
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["penumbraAngle"]).set(90)
-                                else:
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["coneAngle"]).set(json_load[light][renderer]["coneAngle"])
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["penumbraAngle"]).set(
-                                        json_load[light][renderer]["penumbraAngle"])
-
-                    elif parm == "aiSpread":
-                        if value >= 0.4:
-                            old_range = [0.4, 1]
-                            new_range = [1, 50]
-                            exposure_range = [0.9, 0]
-                            old_percentage = (value - old_range[0]) / (old_range[1] - old_range[0])
-                            new_num = ((new_range[1] - new_range[0]) * old_percentage) + new_range[0]
-                            cone_value = math.log(new_num, new_range[1])
-                            new_exposure_num = ((exposure_range[1] - exposure_range[0])
-                                                * cone_value) + exposure_range[0]
-                            spread_values = [cone_value * 180, 180, 10]
-                            for num in range(len(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                 ["light_parms"][parm])):
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"][parm][num]).set(spread_values[num])
-
-                            if new_exposure_num != 0:
-                                try:
-                                    exposure_value = light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["aiExposure"]).eval() + new_exposure_num
-                                except KeyError:
-                                    exposure_value = light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["exposure"]).eval() + new_exposure_num
-
-                                old_exp_value = light_exposure_calc(exposure_value, 1, 1, 1 / scale)
-                                exp_scale_value = light_exposure_calc(old_exp_value, 1, 1, scale)
-
-                                try:
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["aiExposure"]).set(exp_scale_value)
-                                except KeyError:
-                                    light_obj.parm(
-                                        light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                        ["light_parms"]["exposure"]).set(exp_scale_value)
-
-                        elif 0.4 > value >= 0.02:
-                            old_range = [0.02, 0.4]
-                            new_range = [0, 1]
-                            exposure_range = [7, 0]
-                            old_percentage = (value - old_range[0]) / (old_range[1] - old_range[0])
-                            new_num = ((new_range[1] - new_range[0]) * old_percentage) + new_range[0]
-                            cone_value = (2 ** new_num) - 1
-                            exp_value = math.log(1 + new_num, 1 + new_range[1])
-                            new_exposure_num = ((exposure_range[1] - exposure_range[0])
-                                                * exp_value) + exposure_range[0]
-                            spread_values = [0, cone_value * 180, 10]
-
-                            for num in range(len(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                 ["light_parms"][parm])):
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"][parm][num]).set(spread_values[num])
-
-                            try:
-                                exposure_value = light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["aiExposure"]).eval()
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["aiExposure"]).set(exposure_value + new_exposure_num)
-                            except KeyError:
-                                exposure_value = light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["exposure"]).eval()
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"]["exposure"]).set(exposure_value + new_exposure_num)
-                        else:
-                            spread_values = [4.5, 0, 0]
-                            for num in range(len(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                                 ["light_parms"][parm])):
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"][parm][num]).set(spread_values[num])
-                            try:
-                                exposure_value = light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["aiExposure"]).eval() + 8
-                            except KeyError:
-                                exposure_value = light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["exposure"]).eval() + 8
-
-                            exp_scale_value = light_exposure_calc(exposure_value, 1, 1, scale)
-
-                            try:
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"]["aiExposure"]).set(exp_scale_value)
-                            except KeyError:
-                                light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                               ["light_parms"]["exposure"]).set(exp_scale_value)
-
-                    elif parm == "aiRoundness":
-                        # Convert to Disk Light
-                        if value > 0.5:
-                            light_obj.parm("light_type").set(light_data[renderer]["disk"]["light_node_sub_type"])
-
-                    elif parm == "aiSoftEdge":
-                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                       ["light_parms"][parm]).set(value)
-                        if value != 0:
-                            try:
-                                normalize = json_load[light][renderer]["aiNormalize"]
-                            except KeyError:
-                                normalize = json_load[light][renderer]["normalize"]
-                            try:
-                                exposure = soft_edge_exposure_calc(normalize, json_load[light][renderer]["aiExposure"],
-                                                                   scale, value)
-                            except KeyError:
-                                exposure = soft_edge_exposure_calc(normalize, json_load[light][renderer]["exposure"],
-                                                                   scale, value)
-                            light_obj.parm("light_exposure").set(exposure)
-
-                    elif parm == "texture_node":
-                        # Skipping this as it is adjusted in texture_map parameter
-                        pass
-
-                    elif parm == "texture_map":
-                        if json_load[light][renderer]["nodeType"] == "aiSkyDomeLight":
-                            light_obj.parm("env_map").set(value)
-                        elif json_load[light][renderer]["nodeType"] == "areaLight" or \
-                                json_load[light][renderer]["nodeType"] == "quad":
-                            if bool(mat.node(json_load[light][renderer]["texture_node"])):
-                                tex_node = mat.node(json_load[light][renderer]["texture_node"])
-                            else:
-                                tex_node = mat.createNode("texture::2.0", json_load[light][renderer]["texture_node"])
-                                tex_node.parm("orient").set(1)
-                                tex_node.parm("map").set(value)
-                            light_obj.parm("shop_materialpath").set(tex_node.path())
-
-                    elif parm == "aiCamera":
-                        if 0.5 <= value <= 1:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(True)
-                        else:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(False)
-
-                    elif parm == "aiDiffuse":
-                        if 0.5 <= value <= 1:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(True)
-                        else:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(False)
-
-                    elif parm == "aiSpecular":
-                        for spec in light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]:
-                            if 0.5 <= value <= 1:
-                                light_obj.parm(spec).set(True)
-                            else:
-                                light_obj.parm(spec).set(False)
-
-                    elif parm == "aiSss":
-                        if 0.5 <= value <= 1:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(True)
-                        else:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(False)
-
-                    elif parm == "aiIndirect":
-                        if 0.5 <= value <= 1:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(True)
-                        else:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(False)
-
-                    elif parm == "aiVolume":
-                        if 0.5 <= value <= 1:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(True)
-                        else:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(False)
-
-                    elif parm == "aiTransmission":
-                        if 0.5 <= value <= 1:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(True)
-                        else:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(False)
-                    else:
-                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                       ["light_parms"][parm]).set(value)
-
-            # Arnold Specific changes
-            elif renderer == "Arnold" and arnold_check:
-                # Delete already existing Light from Houdini Scene
-                if bool(obj.node("arnold_{0}".format(light))):
-                    light_obj = obj.node("arnold_{0}".format(light))
-                    light_obj.destroy()
-
-                # Create Light
-                light_obj = obj.createNode("arnold_light", "arnold_{0}".format(light))
-
-                # Keep selected
-                hou.Node.setSelected(light_obj, True)
-
-                # Append Light Node to the list
-                light_nodes.append(light_obj)
-
-                # Set Viewport Icon Scale as per Scale Value
-                if json_load[light][renderer]["nodeType"] != "aiSkyDomeLight":
-                    light_obj.parm("l_iconscale").set(scale)
-
-                # Loop through Maya Exported Json
-                for parm, value in json_load[light][renderer].items():
-                    if parm == "nodeType":
-                        # Set Light Type
-                        light_obj.parm("ar_light_type").set(light_data[renderer][json_load[light][renderer][parm]]
-                                                            ["light_node_sub_type"])
-
-                    elif parm == "translateX":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]
-                            ["light_parms"][parm]).set(value * scale)
-
-                    elif parm == "translateY":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]
-                            ["light_parms"][parm]).set(value * scale)
-
-                    elif parm == "translateZ":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]
-                            ["light_parms"][parm]).set(value * scale)
-
-                    elif parm == "scaleX":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]
-                            ["light_parms"][parm]).set(value * 2 * scale)
-
-                    elif parm == "scaleY":
-                        if json_load[light][renderer]["nodeType"] == "disk":
-                            scale_x = json_load[light][renderer].get("scaleX")
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]["light_parms"][parm]).set(
-                                ((value + scale_x) / 2) * scale)
-                        elif json_load[light][renderer]["nodeType"] == "areaLight" or \
-                                json_load[light][renderer]["nodeType"] == "quad":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set(value * 2 * scale)
-                        elif json_load[light][renderer]["nodeType"] == "cylinder":
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set((value * 2) * scale)
-                        else:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set(value * scale)
-
-                    elif parm == "scaleZ":
-                        if json_load[light][renderer]["nodeType"] == "cylinder":
-                            scale_x = json_load[light][renderer].get("scaleX")
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set(((value + scale_x) / 2) * scale)
-                        else:
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set(value * scale)
-
-                    elif parm == "aiExposure":
-                        if json_load[light][renderer]["nodeType"] != "directionalLight":
-                            if json_load[light][renderer].get("aiNormalize"):
-                                exposure = light_exposure_calc(value, 1, 1, scale)
-
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"][parm]).set(exposure)
-                            else:
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"][parm]).set(value)
-
-                    elif parm == "exposure":
-                        if json_load[light][renderer]["nodeType"] != "directionalLight":
-                            if json_load[light][renderer].get("normalize"):
-                                exposure = light_exposure_calc(value, 1, 1, scale)
-
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"][parm]).set(exposure)
-                            else:
-                                light_obj.parm(
-                                    light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                    ["light_parms"][parm]).set(value)
-
-                    elif parm == "aiRadius":
-                        light_obj.parm(
-                            light_data[renderer][json_load[light][renderer]["nodeType"]]
-                            ["light_parms"][parm]).set(value * scale)
-
-                    elif parm == "coneAngle":
-                        if json_load[light][renderer]["penumbraAngle"] < 0:
-                            light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                           ["light_parms"][parm]).set(value)
-                        else:
-                            cone_angle = value + (json_load[light][renderer]["penumbraAngle"] * 2)
-                            light_obj.parm(
-                                light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                ["light_parms"][parm]).set(cone_angle)
-
-                    elif parm == "penumbraAngle":
-                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                       ["light_parms"][parm]).set(abs(value))
-
-                    elif parm == "texture_map":
-                        light_obj.parm("ar_light_color_type").set(1)
-                        light_obj.parm("ar_light_color_texture").set(value)
-
-                    else:
-                        light_obj.parm(light_data[renderer][json_load[light][renderer]["nodeType"]]
-                                       ["light_parms"][parm]).set(value)
-
-    # Layout Light Nodes in Houdini Scene
-    if len(light_nodes) != 0:
-        obj.layoutChildren(items=light_nodes)
-
-    # Show Message on Status Bar
-    hou.ui.setStatusMessage("Lights Imported.")
+    # Newly created Houdini Light Nodes
+    new_nodes = []
+
+    # Number of Lights imported
+    light_count = 0
+    cancelled = False
+
+    # Renderers to Import, every Light is converted for all of them in one pass
+    renderers = selected_renderers(mantra_check, arnold_check, renderers)
+
+    # Texture Materials shared by all Lights, and with previous Imports
+    registry = texture_registry()
+
+    # Light Nodes of previous Imports
+    node_index = light_node_index()
+    source_file = light_file_path(path)
+
+    # Defer cooking until every Light is created
+    update_mode = hou.updateModeSetting()
+    hou.setUpdateMode(hou.updateMode.Manual)
+
+    try:
+        with hou.undos.group("Import Lights"):
+            # Clear Houdini Node selection
+            hou.Node.setSelected(obj, False, clear_all_selected=True)
+
+            # Loop through Maya Exported Json file while it is read and converted
+            for chunk in resolved_chunks(path, scale, renderers, timings):
+                started = time.time()
+                for light, light_json, file_progress in chunk:
+                    imported = import_light(light, light_json, scale, mantra_check, arnold_check, update, registry,
+                                            node_index, renderers, source_file)
+                    light_nodes.extend(imported[0])
+                    new_nodes.extend(imported[1])
+
+                    # Report progress, the Lights imported so far stay in the Scene if cancelled
+                    light_count += 1
+                    if progress_callback and progress_callback(light_count, file_progress):
+                        cancelled = True
+                        break
+                add_time(timings, "create", started)
+                if cancelled:
+                    break
+
+            # Delete Lights which are not in the file anymore
+            started = time.time()
+            if remove_missing and not cancelled:
+                remove_missing_lights(light_nodes, source_file, mantra_check, arnold_check, renderers)
+
+            # Layout new Light Nodes in Houdini Scene
+            if len(new_nodes) != 0:
+                layout_light_nodes(new_nodes)
+            add_time(timings, "layout", started)
+    finally:
+        hou.setUpdateMode(update_mode)
+
+    # Files exported with another Light schema may have Parameters this package doesn't convert the same way
+    mismatch = schema_mismatch(path)
+
+    # Time per phase, if timed
+    imported = "Lights Imported."
+    if timings:
+        imported = "Lights Imported ({0}).".format(timings_message(timings))
+
+    # Show Message on Status Bar, there is none in hython
+    if hou.isUIAvailable():
+        if cancelled:
+            hou.ui.setStatusMessage("Import cancelled, {0} Lights imported.".format(light_count),
+                                    severity=hou.severityType.Warning)
+        elif mismatch:
+            hou.ui.setStatusMessage(" ".join([imported, mismatch, texture_report(registry)]).strip(),
+                                    severity=hou.severityType.Warning)
+        else:
+            hou.ui.setStatusMessage(" ".join([imported, texture_report(registry)]).strip())
+    elif mismatch:
+        sys.stdout.write("Warning: {0}\n".format(mismatch))
+
+    if cancelled:
+        return None
+    return registry
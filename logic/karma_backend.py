@@ -0,0 +1,121 @@
+"""
+
+karma_backend.py
+
+This file contains a Karma Renderer plugin, USD Lights created in /stage from the exported Arnold Light data.
+
+Enable it with the MAYA_TO_HOUDINI_RENDERERS environment variable, see renderer_backends.py:
+    MAYA_TO_HOUDINI_RENDERERS=logic.karma_backend
+
+Only the core USD Lux inputs are converted: Transform, Intensity, Exposure, Normalize and Color.
+Every other exported Arnold Parameter is skipped.
+The conversion kernel converts them one column at a time with karma_column_converters.
+
+"""
+
+from logic.light_conversion import light_data, convert_skip, convert_scaled, convert_arnold_ai_exposure, \
+    convert_arnold_exposure
+from logic.renderer_backends import register_backend
+from logic.conversion_kernel import column_constant, column_arnold_exposure
+
+# Houdini Light Node Type and Light Type menu value per Maya Light Type
+karma_light_types = {"pointLight": ("light::2.0", "sphere"),
+                     "spotLight": ("light::2.0", "sphere"),
+                     "areaLight": ("light::2.0", "rect"),
+                     "quad": ("light::2.0", "rect"),
+                     "disk": ("light::2.0", "disk"),
+                     "cylinder": ("light::2.0", "cylinder"),
+                     "directionalLight": ("distantlight::2.0", None),
+                     "aiSkyDomeLight": ("domelight::2.0", None)}
+
+# Houdini Parameter per exported Maya Parameter
+karma_parms = {"translateX": "tx",
+               "translateY": "ty",
+               "translateZ": "tz",
+               "rotateX": "rx",
+               "rotateY": "ry",
+               "rotateZ": "rz",
+               "intensity": "xn__inputsintensity_i0a",
+               "aiExposure": "xn__inputsexposure_vya",
+               "exposure": "xn__inputsexposure_vya",
+               "aiNormalize": "xn__inputsnormalize_01a",
+               "normalize": "xn__inputsnormalize_01a",
+               "colorR": "xn__inputscolor_ztar",
+               "colorG": "xn__inputscolor_ztag",
+               "colorB": "xn__inputscolor_ztab"}
+
+
+def karma_type_mapping():
+    """
+    Karma type mapping, built from the Arnold type mapping so every exported Arnold Parameter has a Converter.
+    :return: Dictionary of Maya Light Type to its Houdini Light Type and Parameter names
+    """
+    light_types = {}
+    for light_type, (node_type, sub_type) in karma_light_types.items():
+        light_parms = {}
+        for parm in light_data["Arnold"][light_type]["light_parms"]:
+            light_parms[parm] = karma_parms.get(parm, [])
+        light_types[light_type] = {"light_node_type": node_type, "light_node_sub_type": sub_type,
+                                   "light_parms": light_parms}
+
+    return light_types
+
+
+# Karma type mapping
+karma_light_data = karma_type_mapping()
+
+
+def convert_karma_light_type(parms, names, value, light, scale, table):
+    """
+    Karma Light Type, Distant and Dome Lights have their own Node Type.
+    """
+    sub_type = karma_light_data[value]["light_node_sub_type"]
+    if sub_type is not None:
+        parms["lighttype"] = sub_type
+
+
+def karma_node_type(light):
+    """
+    Karma Houdini Node Type of one exported Light, from its Maya Light Type.
+    :param light: Exported Light Parameters of the Renderer
+    :return: Houdini Node Type name
+    """
+    return karma_light_data[light["nodeType"]]["light_node_type"]
+
+
+def create_karma_node(network, node_type, name):
+    """
+    Create a Light Node at the end of the Node chain of the network, and display it.
+    :param network: LOP network Node
+    :param node_type: Houdini Node Type name
+    :param name: Houdini Node name
+    :return: Houdini Node
+    """
+    display_node = network.displayNode()
+    light_obj = network.createNode(node_type, name)
+    if display_node is not None:
+        light_obj.setInput(0, display_node)
+    light_obj.setDisplayFlag(True)
+    return light_obj
+
+
+# Karma Converters per Maya Parameter, Parameters without a Houdini Parameter are skipped
+karma_converters = {"nodeType": convert_karma_light_type,
+                    "translateX": convert_scaled,
+                    "translateY": convert_scaled,
+                    "translateZ": convert_scaled,
+                    "aiExposure": convert_arnold_ai_exposure,
+                    "exposure": convert_arnold_exposure}
+for light_type_data in karma_light_data.values():
+    for maya_parm, houdini_parm in light_type_data["light_parms"].items():
+        if not houdini_parm:
+            karma_converters[maya_parm] = convert_skip
+
+# Karma Column Converters, the Transform and skipped Parameters use the common ones
+karma_column_converters = {convert_karma_light_type: column_constant(convert_karma_light_type),
+                           convert_arnold_ai_exposure: column_arnold_exposure("aiNormalize"),
+                           convert_arnold_exposure: column_arnold_exposure("normalize")}
+
+register_backend("Karma", "Arnold", karma_light_data, karma_converters, karma_node_type, "karma_",
+                 network="/stage", column_converters=karma_column_converters, create_node=create_karma_node,
+                 ordered_parms=["lighttype"])
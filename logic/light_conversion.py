@@ -0,0 +1,841 @@
+"""
+
+light_conversion.py
+
+This file contains the Maya to Houdini Parameter conversion, without any Houdini dependency.
+
+Mantra and Arnold are Renderer backends of logic/renderer_backends.py, with the type mapping of the compiled
+Light schema.
+For every (Renderer, Maya Light Type) a Parameter Table is resolved once from the type mapping of its backend:
+    Maya Parameter: (Houdini Parameter names, Converter)
+Every Converter has the same signature and writes the converted values in a dictionary of Houdini Parameters:
+    converter(parms, names, value, light, scale, table)
+
+"""
+
+import sys
+import math
+
+from logic.light_file import frames_key, world_matrix_key, animation_frames
+from logic.transform import transform_parms, rotate_parms, decompose_matrix
+from logic.color_temperature import kelvin_parm, color_parms, temperature_color
+from logic.renderer_backends import renderer_backends, register_backend
+from logic import light_schema
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+
+def schema_light_data():
+    """
+    Light data of the compiled Light schema, generated by maya_to_houdini_light_parms_py3.py, in the schema order.
+    :return: Dictionary of Renderer to {Maya Light Type: {"light_node_type", "light_node_sub_type",
+        "num_of_light_contrib", "light_parms"}}, plus "light_contribution_parms" and "color_light_params"
+    """
+    # Dictionaries py2 or py3
+    if sys.version[0] == "3":
+        ordered = dict
+    else:
+        ordered = OrderedDict
+
+    data = ordered()
+    for renderer, light_type, node_type, sub_type, contrib_count, parms in light_schema.light_types:
+        light_type_data = data.setdefault(renderer, ordered())[light_type] = ordered()
+        if node_type is not None:
+            light_type_data["light_node_type"] = light_schema.node_types[node_type]
+        light_type_data["light_node_sub_type"] = sub_type
+        if contrib_count is not None:
+            light_type_data["num_of_light_contrib"] = contrib_count
+
+        # Several Houdini Parameters are given as a list
+        light_type_data["light_parms"] = ordered()
+        for maya_parm, houdini_parm in parms:
+            if isinstance(houdini_parm, tuple):
+                houdini_parm = [light_schema.houdini_parms[index] for index in houdini_parm]
+            else:
+                houdini_parm = light_schema.houdini_parms[houdini_parm]
+            light_type_data["light_parms"][light_schema.maya_parms[maya_parm]] = houdini_parm
+
+    data["light_contribution_parms"] = ordered(light_schema.light_contribution_parms)
+    data["color_light_params"] = ordered(light_schema.color_light_params)
+    return data
+
+
+# Maya to Houdini Light data, loaded once
+light_data = schema_light_data()
+
+# Renderers of the exported Light data, in the schema order
+exported_renderers = [renderer for renderer in light_data
+                      if renderer not in ["light_contribution_parms", "color_light_params"]]
+
+# Exported keys which are not Light Parameters
+special_parms = ["nodeType", "texture_node", "texture_map", "texture_colorspace", "dag_path", kelvin_parm]
+
+# Houdini Material network holding the Mantra Light textures
+texture_network_path = "/mat"
+
+# Exported Exposure Parameters, converted before the Parameters adding to the converted Exposure
+exposure_parms = ["aiExposure", "exposure"]
+exposure_dependent_parms = ["aiSpread", "aiSoftEdge"]
+
+# Houdini default of the Mantra Light Exposure, the Spread adds to it for Lights exported without Exposure
+mantra_exposure_default = 0
+
+
+def light_exposure_calc(light_exposure, renderer_conversion_factor, old_scale, new_scale):
+    """
+    Calculate Light Exposure based on Scene Scale and Renderer Conversion Factor.
+    :param light_exposure: Light Exposure Value
+    :param renderer_conversion_factor: Renderer Conversion Factor
+    :param old_scale: Old Scene Scale
+    :param new_scale: New Scene Scale
+    :return: New Exposure Value
+    """
+    # Exposure to Intensity conversion
+    exposure_to_intensity = 2 ** light_exposure
+
+    # Renderer Intensity conversion factor
+    renderer_total_intensity = renderer_conversion_factor * exposure_to_intensity
+
+    # Scale Factor
+    scale_factor = new_scale / old_scale
+
+    # New Intensity based on Scale Factor
+    new_intensity = (scale_factor ** 2) * renderer_total_intensity
+
+    # Intensity to Exposure conversion
+    intensity_to_exposure = math.log(new_intensity, 2)
+    return intensity_to_exposure
+
+
+def soft_edge_exposure_calc(normalize, exposure, scale, value):
+    """
+    Soft Edge Exposure Calculator for Lights with Soft Edge Parameter.
+    :param normalize: Light Normalize Value
+    :param exposure: Light Exposure Value
+    :param scale: New Scale Value
+    :param value: Soft Edge Value
+    :return: New Exposure Value based on Soft Edge Value
+    """
+
+    # Current Mantra Exposure Value
+    current_exposure = light_exposure_calc(exposure, 2 ** -2.65, 1, scale)
+
+    # Exposure to Intensity conversion
+    total_int = 2 ** exposure
+
+    if normalize:
+        # Mantra Soft Edge conversion factor
+        mantra_total_int = 0.5 * total_int
+
+        # Scale Factor
+        scale_factor = scale / 1
+
+        # New Intensity based on Scale Factor
+        new_intensity = (scale_factor ** 2) * mantra_total_int
+
+        # Intensity to Exposure conversion
+        mantra_exp = math.log(new_intensity, 2)
+    else:
+        # Mantra Soft Edge conversion factor
+        mantra_total_int = 0.8 * total_int
+
+        # Intensity to Exposure conversion
+        mantra_exp = math.log(mantra_total_int, 2)
+
+    # New Exposure Value Calculation using Fit Range
+    # Soft Edge Value Range
+    old_range = [1, 0]
+
+    # Soft Edge required minimum Exposure to Old Exposure Value Range
+    new_range = [mantra_exp, current_exposure]
+
+    # Fit Range Soft Edge Value to Exposure based on above 2 Ranges
+    old_percentage = (value - old_range[0]) / (old_range[1] - old_range[0])
+    soft_edge_exposure = ((new_range[1] - new_range[0]) * old_percentage) + new_range[0]
+
+    return soft_edge_exposure
+
+
+def exposure_parm(table):
+    """
+    Houdini Exposure Parameter name of a Parameter Table.
+    :param table: Parameter Table
+    :return: Houdini Parameter name
+    """
+    if "aiExposure" in table:
+        return table["aiExposure"][0][0]
+    return table["exposure"][0][0]
+
+
+# Common Converters
+def convert_value(parms, names, value, light, scale, table):
+    """
+    Set the value as it is.
+    """
+    parms[names[0]] = value
+
+
+def convert_skip(parms, names, value, light, scale, table):
+    """
+    Nothing to set, the value is used by another Converter.
+    """
+    pass
+
+
+def convert_scaled(parms, names, value, light, scale, table):
+    """
+    Value multiplied by Scene Scale.
+    """
+    parms[names[0]] = value * scale
+
+
+def convert_double_scaled(parms, names, value, light, scale, table):
+    """
+    Value doubled and multiplied by Scene Scale.
+    """
+    parms[names[0]] = value * 2 * scale
+
+
+def convert_contribution(parms, names, value, light, scale, table):
+    """
+    Light Contribution Slider to Checkbox, 0.5 or greater will turn on.
+    """
+    for name in names:
+        if 0.5 <= value <= 1:
+            parms[name] = True
+        else:
+            parms[name] = False
+
+
+def convert_color_temperature(parms, names, value, light, scale, table):
+    """
+    Color Temperature exported in Kelvin, resolved to the Color Parameters.
+    """
+    for parm, channel in zip(color_parms, temperature_color(value)):
+        parms[table[parm][0][0]] = channel
+
+
+# Mantra Converters
+def convert_mantra_light_type(parms, names, value, light, scale, table):
+    """
+    Mantra Light Type, Default Parameters and Light Contributions.
+    """
+    # Set Viewport Icon Scale as per Scale Value
+    if value != "aiSkyDomeLight":
+        parms["iconscale"] = scale
+
+        # Set Light Type
+        parms["light_type"] = light_data["Mantra"][value]["light_node_sub_type"]
+
+    # Set Default Parameters as per Light Type
+    if value == "spotLightP" or value == "spotLightS":
+        parms["coneenable"] = True
+    elif value == "areaLight" or value == "quad":
+        parms["coneenable"] = True
+        parms["singlesided"] = True
+        parms["edgeenable"] = True
+    elif value == "disk":
+        parms["coneenable"] = True
+        parms["singlesided"] = True
+    elif value == "cylinderC" or value == "cylinderL":
+        parms["rOrd"] = 2
+        parms["singlesided"] = True
+
+    # Add Light Contributions
+    parms["light_contrib"] = light_data["Mantra"][value]["num_of_light_contrib"]
+    for contrib in range(1, light_data["Mantra"][value]["num_of_light_contrib"] + 1):
+        parms["light_contribname{0}".format(contrib)] = list(light_data["light_contribution_parms"])[contrib - 1]
+
+
+def convert_mantra_rotate_x(parms, names, value, light, scale, table):
+    if light["nodeType"] == "cylinderC" or light["nodeType"] == "cylinderL":
+        parms[names[0]] = value * -1
+    else:
+        parms[names[0]] = value
+
+
+def convert_mantra_rotate_y(parms, names, value, light, scale, table):
+    if light["nodeType"] == "aiSkyDomeLight":
+        parms[names[0]] = value + 180
+    else:
+        parms[names[0]] = value
+
+
+def convert_mantra_rotate_z(parms, names, value, light, scale, table):
+    if light["nodeType"] == "cylinderC" or light["nodeType"] == "cylinderL":
+        parms[names[0]] = value + 90
+    else:
+        parms[names[0]] = value
+
+
+def convert_mantra_scale_z(parms, names, value, light, scale, table):
+    if light["nodeType"] == "cylinderC":
+        scale_x = light.get("scaleX")
+        parms[names[0]] = ((value + scale_x) / 2) * (40 / 3) * scale
+    else:
+        parms[names[0]] = value * scale
+
+
+def convert_mantra_ai_exposure(parms, names, value, light, scale, table):
+    if light["nodeType"] == "aiSkyDomeLight":
+        parms[names[0]] = value
+    elif light["nodeType"] == "directionalLightD" or light["nodeType"] == "directionalLightS":
+        parms[names[0]] = light_exposure_calc(value, 2 ** -2.65, 1, 1)
+    else:
+        if light.get("aiNormalize") is None or light["aiNormalize"]:
+            parms[names[0]] = light_exposure_calc(value, 2 ** -2.65, 1, scale)
+        else:
+            parms[names[0]] = value
+
+
+def convert_mantra_exposure(parms, names, value, light, scale, table):
+    if light["nodeType"] == "aiSkyDomeLight":
+        parms[names[0]] = value
+    elif light["nodeType"] == "cylinderL":
+        parms[names[0]] = light_exposure_calc(value, 0.05, 1, scale)
+    else:
+        if light.get("normalize") is None or light["normalize"]:
+            parms[names[0]] = light_exposure_calc(value, 2 ** -2.65, 1, scale)
+        else:
+            parms[names[0]] = value
+
+
+def convert_mantra_radius(parms, names, value, light, scale, table):
+    parms[names[0]] = value * 2 * scale
+    parms[names[1]] = value * 2 * scale
+
+
+def convert_mantra_angle(parms, names, value, light, scale, table):
+    parms[names[0]] = value / 2
+
+
+def convert_mantra_dropoff(parms, names, value, light, scale, table):
+    """
+    Mantra Cone Roll, Cone Angle and Cone Delta from Maya Dropoff, Cone Angle and Penumbra Angle.
+    """
+    cone_parm = table["coneAngle"][0][0]
+    penumbra_parm = table["penumbraAngle"][0][0]
+
+    if value == 0 or value == 1:
+        parms[names[0]] = 1
+        if light["penumbraAngle"] >= 90 and light["coneAngle"] >= 90:
+            parms[cone_parm] = 0
+            parms[penumbra_parm] = 90
+        elif light["penumbraAngle"] >= 90 and light["coneAngle"] < 90:
+            parms[penumbra_parm] = 90
+        else:
+            parms[cone_parm] = light["coneAngle"]
+            parms[penumbra_parm] = light["penumbraAngle"]
+
+    elif 1 > value > 0:
+        parms[names[0]] = 1 - (math.log(100 - (value * 100), 100))
+
+    elif value > 1:
+        if light["nodeType"] == "spotLightP":
+            parms["sharpspot"] = False
+            if light["penumbraAngle"] > light["coneAngle"]:
+                coneangle = light["coneAngle"] / 2
+                parms[cone_parm] = 0
+                parms[names[0]] = value
+                if light["penumbraAngle"] >= 90:
+                    parms[penumbra_parm] = 90
+                else:
+                    parms[penumbra_parm] = light["penumbraAngle"] + coneangle
+            else:
+                coneangle = light["coneAngle"] / 2
+                penumbra = light["penumbraAngle"] / 2
+                parms[cone_parm] = 0
+                parms[names[0]] = value
+                if coneangle + penumbra > 90:
+                    parms[penumbra_parm] = 90
+                else:
+                    parms[penumbra_parm] = coneangle + penumbra
+        else:
+            parms["sharpspot"] = True
+            parms[names[0]] = value
+            if light["penumbraAngle"] >= 90:
+                parms[cone_parm] = 0
+                parms[penumbra_parm] = 90
+            else:
+                parms[cone_parm] = light["coneAngle"]
+                parms[penumbra_parm] = light["penumbraAngle"]
+
+
+def convert_mantra_spread(parms, names, value, light, scale, table):
+    """
+    Mantra Cone Angle, Cone Delta, Cone Roll and Exposure from Arnold Spread.
+    """
+    exposure_name = exposure_parm(table)
+
+    if value >= 0.4:
+        old_range = [0.4, 1]
+        new_range = [1, 50]
+        exposure_range = [0.9, 0]
+        old_percentage = (value - old_range[0]) / (old_range[1] - old_range[0])
+        new_num = ((new_range[1] - new_range[0]) * old_percentage) + new_range[0]
+        cone_value = math.log(new_num, new_range[1])
+        new_exposure_num = ((exposure_range[1] - exposure_range[0]) * cone_value) + exposure_range[0]
+        spread_values = [cone_value * 180, 180, 10]
+        for num in range(len(names)):
+            parms[names[num]] = spread_values[num]
+
+        if new_exposure_num != 0:
+            exposure_value = parms.get(exposure_name, mantra_exposure_default) + new_exposure_num
+            old_exp_value = light_exposure_calc(exposure_value, 1, 1, 1 / scale)
+            parms[exposure_name] = light_exposure_calc(old_exp_value, 1, 1, scale)
+
+    elif 0.4 > value >= 0.02:
+        old_range = [0.02, 0.4]
+        new_range = [0, 1]
+        exposure_range = [7, 0]
+        old_percentage = (value - old_range[0]) / (old_range[1] - old_range[0])
+        new_num = ((new_range[1] - new_range[0]) * old_percentage) + new_range[0]
+        cone_value = (2 ** new_num) - 1
+        exp_value = math.log(1 + new_num, 1 + new_range[1])
+        new_exposure_num = ((exposure_range[1] - exposure_range[0]) * exp_value) + exposure_range[0]
+        spread_values = [0, cone_value * 180, 10]
+        for num in range(len(names)):
+            parms[names[num]] = spread_values[num]
+
+        parms[exposure_name] = parms.get(exposure_name, mantra_exposure_default) + new_exposure_num
+
+    else:
+        spread_values = [4.5, 0, 0]
+        for num in range(len(names)):
+            parms[names[num]] = spread_values[num]
+
+        exposure_value = parms.get(exposure_name, mantra_exposure_default) + 8
+        parms[exposure_name] = light_exposure_calc(exposure_value, 1, 1, scale)
+
+
+def convert_mantra_roundness(parms, names, value, light, scale, table):
+    # Convert to Disk Light
+    if value > 0.5:
+        parms["light_type"] = light_data["Mantra"]["disk"]["light_node_sub_type"]
+
+
+def convert_mantra_soft_edge(parms, names, value, light, scale, table):
+    parms[names[0]] = value
+    if value != 0:
+        if "aiNormalize" in light:
+            normalize = light["aiNormalize"]
+        else:
+            normalize = light["normalize"]
+        if "aiExposure" in light:
+            exposure = light["aiExposure"]
+        else:
+            exposure = light["exposure"]
+        parms["light_exposure"] = soft_edge_exposure_calc(normalize, exposure, scale, value)
+
+
+def convert_mantra_texture_map(parms, names, value, light, scale, table):
+    """
+    Environment Map, or Material path of the texture node created by the importer for Area and Quad Lights.
+    """
+    if light["nodeType"] == "aiSkyDomeLight":
+        parms["env_map"] = value
+    elif light["nodeType"] == "areaLight" or light["nodeType"] == "quad":
+        parms["shop_materialpath"] = "{0}/{1}".format(texture_network_path, light["texture_node"])
+
+
+# Arnold Converters
+def convert_arnold_light_type(parms, names, value, light, scale, table):
+    """
+    Arnold Light Type.
+    """
+    # Set Viewport Icon Scale as per Scale Value
+    if value != "aiSkyDomeLight":
+        parms["l_iconscale"] = scale
+
+    # Set Light Type
+    parms["ar_light_type"] = light_data["Arnold"][value]["light_node_sub_type"]
+
+
+def convert_arnold_scale_y(parms, names, value, light, scale, table):
+    if light["nodeType"] == "disk":
+        scale_x = light.get("scaleX")
+        parms[names[0]] = ((value + scale_x) / 2) * scale
+    elif light["nodeType"] == "areaLight" or light["nodeType"] == "quad":
+        parms[names[0]] = value * 2 * scale
+    elif light["nodeType"] == "cylinder":
+        parms[names[0]] = (value * 2) * scale
+    else:
+        parms[names[0]] = value * scale
+
+
+def convert_arnold_scale_z(parms, names, value, light, scale, table):
+    if light["nodeType"] == "cylinder":
+        scale_x = light.get("scaleX")
+        parms[names[0]] = ((value + scale_x) / 2) * scale
+    else:
+        parms[names[0]] = value * scale
+
+
+def convert_arnold_ai_exposure(parms, names, value, light, scale, table):
+    if light["nodeType"] != "directionalLight":
+        if light.get("aiNormalize"):
+            parms[names[0]] = light_exposure_calc(value, 1, 1, scale)
+        else:
+            parms[names[0]] = value
+
+
+def convert_arnold_exposure(parms, names, value, light, scale, table):
+    if light["nodeType"] != "directionalLight":
+        if light.get("normalize"):
+            parms[names[0]] = light_exposure_calc(value, 1, 1, scale)
+        else:
+            parms[names[0]] = value
+
+
+def convert_arnold_cone_angle(parms, names, value, light, scale, table):
+    if light["penumbraAngle"] < 0:
+        parms[names[0]] = value
+    else:
+        parms[names[0]] = value + (light["penumbraAngle"] * 2)
+
+
+def convert_arnold_penumbra_angle(parms, names, value, light, scale, table):
+    parms[names[0]] = abs(value)
+
+
+def convert_arnold_texture_map(parms, names, value, light, scale, table):
+    parms["ar_light_color_type"] = 1
+    parms["ar_light_color_texture"] = value
+
+
+# Mantra Converters per Maya Parameter, every other Parameter uses convert_value
+mantra_converters = {"nodeType": convert_mantra_light_type,
+                     "translateX": convert_scaled,
+                     "translateY": convert_scaled,
+                     "translateZ": convert_scaled,
+                     "rotateX": convert_mantra_rotate_x,
+                     "rotateY": convert_mantra_rotate_y,
+                     "rotateZ": convert_mantra_rotate_z,
+                     "scaleX": convert_double_scaled,
+                     "scaleY": convert_double_scaled,
+                     "scaleZ": convert_mantra_scale_z,
+                     "aiExposure": convert_mantra_ai_exposure,
+                     "exposure": convert_mantra_exposure,
+                     "aiRadius": convert_mantra_radius,
+                     "aiAngle": convert_mantra_angle,
+                     "coneAngle": convert_skip,
+                     "penumbraAngle": convert_skip,
+                     "dropoff": convert_mantra_dropoff,
+                     "aiSpread": convert_mantra_spread,
+                     "aiRoundness": convert_mantra_roundness,
+                     "aiSoftEdge": convert_mantra_soft_edge,
+                     "texture_node": convert_skip,
+                     "texture_map": convert_mantra_texture_map,
+                     kelvin_parm: convert_color_temperature,
+                     "aiCamera": convert_contribution,
+                     "aiDiffuse": convert_contribution,
+                     "aiSpecular": convert_contribution,
+                     "aiSss": convert_contribution,
+                     "aiIndirect": convert_contribution,
+                     "aiVolume": convert_contribution,
+                     "aiTransmission": convert_contribution}
+
+# Arnold Converters per Maya Parameter, every other Parameter uses convert_value
+arnold_converters = {"nodeType": convert_arnold_light_type,
+                     "translateX": convert_scaled,
+                     "translateY": convert_scaled,
+                     "translateZ": convert_scaled,
+                     "scaleX": convert_double_scaled,
+                     "scaleY": convert_arnold_scale_y,
+                     "scaleZ": convert_arnold_scale_z,
+                     "aiExposure": convert_arnold_ai_exposure,
+                     "exposure": convert_arnold_exposure,
+                     "aiRadius": convert_scaled,
+                     "coneAngle": convert_arnold_cone_angle,
+                     "penumbraAngle": convert_arnold_penumbra_angle,
+                     "texture_map": convert_arnold_texture_map,
+                     kelvin_parm: convert_color_temperature}
+
+
+def mantra_node_type(light):
+    """
+    Mantra Houdini Node Type of one exported Light, from its Maya Light Type.
+    :param light: Exported Light Parameters of the Renderer
+    :return: Houdini Node Type name
+    """
+    return light_data["Mantra"][light["nodeType"]]["light_node_type"]
+
+
+def arnold_node_type(light):
+    """
+    Arnold Houdini Node Type, the same for every Light.
+    :param light: Exported Light Parameters of the Renderer
+    :return: Houdini Node Type name
+    """
+    return "arnold_light"
+
+
+def parm_table(renderer, node_type):
+    """
+    Parameter Table of a Renderer and Maya Light Type, resolved once and kept by the Renderer backend.
+    :param renderer: Renderer name
+    :param node_type: Exported Light nodeType
+    :return: Dictionary of Maya Parameter to (Houdini Parameter names, Converter)
+    """
+    backend = renderer_backends[renderer]
+    parm_tables = backend.setdefault("parm_tables", {})
+    if node_type not in parm_tables:
+        converters = backend["converters"]
+        table = {}
+        for parm in special_parms:
+            table[parm] = ((), converters.get(parm, convert_skip))
+        for parm, names in backend["light_types"][node_type]["light_parms"].items():
+            if not isinstance(names, list):
+                names = [names]
+            table[parm] = (tuple(names), converters.get(parm, convert_value))
+        parm_tables[node_type] = table
+
+    return parm_tables[node_type]
+
+
+def expand_world_matrix(light, table, previous_rotate=None, decomposed=None):
+    """
+    Exported Light with its World Matrix replaced by the Maya Transform Parameters of its Parameter Table.
+    The Maya rotation exported with the World Matrix gives back the same Euler angles, which the Euler based
+    rotation offsets of some Light Types depend on.
+    Lights exported with separate Transform Parameters are returned as they are.
+    :param light: Exported Light Parameters of the Renderer
+    :param table: Parameter Table
+    :param previous_rotate: Rotation of the previous frame, keeps animated rotations continuous
+    :param decomposed: Dictionary of the World Matrices decomposed so far, shared by the Renderers of the same Lights
+    :return: Exported Light Parameters of the Renderer
+    """
+    if world_matrix_key not in light:
+        return light
+
+    # Maya rotation, files exported without it use the previous frame
+    if all(parm in light for parm in rotate_parms):
+        previous_rotate = [light[parm] for parm in rotate_parms]
+
+    # Dictionary to store Light Parameters py2 or py3
+    if sys.version[0] == "3":
+        expanded = {}
+    else:
+        expanded = OrderedDict()
+
+    for parm, value in light.items():
+        if parm == world_matrix_key:
+            if decomposed is None:
+                transform = decompose_matrix(value, previous_rotate)
+            else:
+                key = (tuple(value), tuple(previous_rotate) if previous_rotate else None)
+                if key not in decomposed:
+                    decomposed[key] = decompose_matrix(value, previous_rotate)
+                transform = decomposed[key]
+            for transform_parm in transform_parms:
+                if transform_parm in table:
+                    expanded[transform_parm] = transform[transform_parm]
+        elif parm not in rotate_parms:
+            expanded[parm] = value
+
+    return expanded
+
+
+def conversion_order(light):
+    """
+    Exported Parameter names in conversion order, the Exposure before the Parameters adding to it.
+    Other Parameters keep the exported order.
+    :param light: Exported Light Parameters of the Renderer
+    :return: List of Maya Parameter names
+    """
+    order = list(light)
+    for exposure in exposure_parms:
+        dependent = [order.index(parm) for parm in exposure_dependent_parms if parm in light]
+        if exposure in light and dependent and min(dependent) < order.index(exposure):
+            order.remove(exposure)
+            order.insert(min(dependent), exposure)
+
+    return order
+
+
+def convert_light(renderer, light, scale):
+    """
+    Convert one exported Light to Houdini Parameter values.
+    Parameters keep the order they are first set in, so the Light Type comes first.
+    The Exposure is converted before the Spread and Soft Edge, which add to it.
+    :param renderer: Renderer name
+    :param light: Exported Light Parameters of the Renderer
+    :param scale: Scene Scale Value
+    :return: Dictionary of Houdini Parameter to value
+    """
+    table = parm_table(renderer, light["nodeType"])
+    light = expand_world_matrix(light, table)
+
+    # Dictionary to store Houdini Parameters py2 or py3
+    if sys.version[0] == "3":
+        parms = {}
+    else:
+        parms = OrderedDict()
+
+    for parm in conversion_order(light):
+        names, converter = table[parm]
+        converter(parms, names, light[parm], light, scale, table)
+
+    return parms
+
+
+def houdini_node_type(renderer, light):
+    """
+    Houdini Light Node Type of one exported Light.
+    :param renderer: Renderer name
+    :param light: Exported Light Parameters of the Renderer
+    :return: Houdini Node Type name
+    """
+    return renderer_backends[renderer]["node_type"](light)
+
+
+def resolve_light(light_name, light_json, scale, renderers):
+    """
+    Houdini Light Nodes of one exported Light with their final Parameter values, ready to be applied.
+    Every Renderer backend converts the exported Light data of its source, only the selected backends are used.
+    Lights which are already resolved are returned as they are.
+    :param light_name: Light name
+    :param light_json: Exported Light data
+    :param scale: Scene Scale Value
+    :param renderers: Renderer names to resolve, in the order of the registered backends
+    :return: Dictionary of Renderer to resolved Light Node
+        light_name: Houdini Node name
+        light_node_type: Houdini Node Type name
+        parms: Dictionary of Houdini Parameter to value
+        texture_node, texture_map, texture_colorspace: Texture Material of Mantra Area and Quad Lights, only if used,
+            texture_colorspace only if exported
+        dag_path: Maya DAG path of the Light, only if exported
+        frames, keyframes: Frames and Dictionary of animated Houdini Parameter to value per frame, only if animated
+    """
+    # Animated Lights
+    frames = None
+    if frames_key in light_json:
+        frames = animation_frames(light_json[frames_key])
+
+    # Dictionary to store resolved Light Nodes py2 or py3
+    if sys.version[0] == "3":
+        resolved = {}
+    else:
+        resolved = OrderedDict()
+
+    for renderer in renderers:
+        # Already resolved Light Node
+        if "parms" in light_json.get(renderer, {}):
+            resolved[renderer] = light_json[renderer]
+            continue
+
+        light = light_json.get(renderer_backends[renderer]["source"])
+        if light is None or "parms" in light:
+            continue
+
+        if frames:
+            parms, keyframes = convert_animated_light(renderer, light, frames, scale)
+            resolved[renderer] = resolved_node(renderer, light_name, light, parms, frames, keyframes)
+        else:
+            resolved[renderer] = resolved_node(renderer, light_name, light, convert_light(renderer, light, scale))
+
+    return resolved
+
+
+def resolved_node(renderer, light_name, light, parms, frames=None, keyframes=None):
+    """
+    Resolved Light Node of one Renderer, see resolve_light().
+    :param renderer: Renderer name
+    :param light_name: Light name
+    :param light: Exported Light Parameters of the Renderer
+    :param parms: Converted Houdini Parameters
+    :param frames: Frames of the animated Parameters
+    :param keyframes: Dictionary of animated Houdini Parameter to value per frame
+    :return: Dictionary of the resolved Light Node
+    """
+    # Dictionary to store resolved Light Node py2 or py3
+    if sys.version[0] == "3":
+        node = {}
+    else:
+        node = OrderedDict()
+    node["light_name"] = "{0}{1}".format(renderer_backends[renderer]["node_name_prefix"], light_name)
+    node["light_node_type"] = houdini_node_type(renderer, light)
+    node["parms"] = parms
+    if "shop_materialpath" in parms:
+        node["texture_node"] = light["texture_node"]
+        node["texture_map"] = light["texture_map"]
+        if "texture_colorspace" in light:
+            node["texture_colorspace"] = light["texture_colorspace"]
+    if "dag_path" in light:
+        node["dag_path"] = light["dag_path"]
+    if keyframes:
+        node["frames"] = frames
+        node["keyframes"] = keyframes
+
+    return node
+
+
+def convert_animated_light(renderer, light, frames, scale):
+    """
+    Convert one animated exported Light to Houdini Parameter values, frame by frame.
+    A Parameter not set on a frame keeps the value of the previous frame, or of the next one at the start.
+    :param renderer: Renderer name
+    :param light: Exported Light Parameters of the Renderer, animated Parameters hold one value per frame
+    :param frames: Sampled frames
+    :param scale: Scene Scale Value
+    :return: Dictionary of constant Houdini Parameter to value, Dictionary of animated Houdini Parameter to
+        value per frame
+    """
+    table = parm_table(renderer, light["nodeType"])
+
+    # Convert every frame
+    samples = []
+    previous_rotate = None
+    for index in range(len(frames)):
+        if sys.version[0] == "3":
+            frame_light = {}
+        else:
+            frame_light = OrderedDict()
+        for parm, value in light.items():
+            if parm == world_matrix_key:
+                frame_light[parm] = [element[index] if isinstance(element, list) else element for element in value]
+            else:
+                frame_light[parm] = value[index] if isinstance(value, list) else value
+
+        # World Matrix rotations follow the previous frame
+        frame_light = expand_world_matrix(frame_light, table, previous_rotate)
+        if "rotateX" in frame_light:
+            previous_rotate = [frame_light["rotateX"], frame_light["rotateY"], frame_light["rotateZ"]]
+
+        samples.append(convert_light(renderer, frame_light, scale))
+
+    # Dictionaries to store Houdini Parameters py2 or py3
+    if sys.version[0] == "3":
+        parms = {}
+        keyframes = {}
+    else:
+        parms = OrderedDict()
+        keyframes = OrderedDict()
+
+    for sample in samples:
+        for parm in sample:
+            if parm in parms or parm in keyframes:
+                continue
+
+            # Fill the frames where the Parameter isn't set
+            values = [frame_parms.get(parm) for frame_parms in samples]
+            first = next(value for value in values if value is not None)
+            for index in range(len(values)):
+                if values[index] is None:
+                    values[index] = values[index - 1] if index else first
+
+            # Text values can't be keyed, the first frame is kept
+            if values.count(values[0]) == len(values) or not isinstance(values[0], (int, float)):
+                parms[parm] = values[0]
+            else:
+                keyframes[parm] = values
+
+    return parms, keyframes
+
+
+# Mantra and Arnold backends, each converting its own exported Light data
+register_backend("Mantra", "Mantra", light_data["Mantra"], mantra_converters, mantra_node_type, "mantra_",
+                 ordered_parms=["light_type", "light_contrib"])
+register_backend("Arnold", "Arnold", light_data["Arnold"], arnold_converters, arnold_node_type, "arnold_",
+                 ordered_parms=["ar_light_type"])
@@ -0,0 +1,741 @@
+"""
+
+light_file.py
+
+This file contains the reading and writing of exported Light files, shared by Maya and Houdini logic.
+
+Three formats are supported:
+    Json (.json): one Json object with every Light, written at the end of the Export.
+    Json Lines (.jsonl): one Json object per Light and per line, written as soon as the Light is sampled.
+    Binary Light Rig (.mhl): string table header and fixed layout records per Light, optionally zlib compressed.
+
+"""
+
+import os
+import sys
+import json
+import hashlib
+import zlib
+import codecs
+import struct
+import argparse
+
+from logic.color_temperature import light_temperatures, temperature_record, add_temperature_record
+from logic.light_schema import schema_version
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+# Json Lines file extension
+json_lines_extension = ".jsonl"
+
+# Binary Light Rig file extension, magic number and version
+binary_extension = ".mhl"
+binary_magic = b"MHL"
+binary_version = 2
+
+# Binary Light Rig versions which can be read, version 1 has no World Matrix values
+binary_read_versions = [1, 2]
+
+# Binary Light Rig flags
+binary_compressed = 1
+
+# Binary Light Rig value type codes (struct formats), "N" is None and takes no bytes, "M" is a World Matrix
+binary_value_types = {bool: "?", int: "q", float: "d"}
+
+# Bytes read at once by the streaming readers
+read_chunk_size = 1 << 16
+
+# Json whitespace characters
+json_whitespace = " \t\n\r"
+
+# Light key holding the sampled frame range [start, end, step] of animated Lights
+frames_key = "frames"
+
+# Light Parameter holding the World Matrix of the Light Transform, 16 floats
+world_matrix_key = "worldMatrix"
+
+# Top level key of the curves shared by several animated channels, written before the Lights
+curves_key = "__curves__"
+
+# Top level key of the exact Colors of the Color Temperatures exported in Kelvin, written before the Lights
+temperatures_key = "__temperatures__"
+
+# Top level key of the Light schema version a file was exported with, written before every other record
+schema_key = "__schema__"
+
+# Light schema version of every Light file read, None for files exported before versioning
+# Light file path: Light schema version
+light_file_schemas = {}
+
+
+def is_json_lines(path):
+    """
+    Check if the Light file is a Json Lines file.
+    :param path: Light file path
+    :return: True if Json Lines file
+    """
+    return os.path.splitext(path)[1].lower() == json_lines_extension
+
+
+def is_binary(path):
+    """
+    Check if the Light file is a Binary Light Rig file.
+    :param path: Light file path
+    :return: True if Binary Light Rig file
+    """
+    return os.path.splitext(path)[1].lower() == binary_extension
+
+
+def animation_frames(frame_range):
+    """
+    Sampled frames of an animated Light.
+    :param frame_range: [Start frame, End frame, Step]
+    :return: List of frames
+    """
+    start, end, step = frame_range
+    count = int(round((end - start) / float(step))) + 1
+    return [start + index * step for index in range(count)]
+
+
+def reduce_curve(values, tolerance):
+    """
+    Linear keyframe reduction of a curve sampled on every frame.
+    Every dropped value is within tolerance of the line between the kept values around it.
+    :param values: Value per frame
+    :param tolerance: Largest allowed difference
+    :return: Indices of the kept values
+    """
+    if len(values) < 3:
+        return list(range(len(values)))
+
+    kept = [0]
+    for index in range(1, len(values) - 1):
+        # Extend the segment from the last kept value to the next value
+        start = kept[-1]
+        end = index + 1
+        slope = (values[end] - values[start]) / float(end - start)
+        for between in range(start + 1, end):
+            if abs(values[start] + slope * (between - start) - values[between]) > tolerance:
+                kept.append(index)
+                break
+    kept.append(len(values) - 1)
+
+    return kept
+
+
+def compress_channels(lights, deduplicate=True, tolerance=None):
+    """
+    Compress the animated channels of exported Lights in place.
+    Channels are optionally reduced to keys {"keys": [[frame index, value], ...]} within tolerance,
+    and curves used by several channels are moved to a shared table and referenced as {"curve": content hash}.
+    :param lights: Dictionary of Light name to Light data with animated channels
+    :param deduplicate: Share identical curves
+    :param tolerance: Keyframe reduction tolerance, no reduction if None
+    :return: Dictionary of content hash to shared curve
+    """
+    # Animated channels as (Renderer Parameters, Parameter name)
+    channels = []
+    for light_data in lights.values():
+        for renderer_parms in light_data.values():
+            if not isinstance(renderer_parms, dict):
+                continue
+            for parm, value in renderer_parms.items():
+                if parm == world_matrix_key:
+                    # Every World Matrix element is a channel of its own
+                    channels.extend((value, index) for index in range(len(value)) if isinstance(value[index], list))
+                elif isinstance(value, list):
+                    channels.append((renderer_parms, parm))
+
+    # Keyframe reduction
+    if tolerance is not None:
+        for renderer_parms, parm in channels:
+            values = renderer_parms[parm]
+            kept = reduce_curve(values, tolerance)
+            if len(kept) < len(values):
+                renderer_parms[parm] = {"keys": [[index, values[index]] for index in kept]}
+
+    curves = {}
+    if not deduplicate:
+        return curves
+
+    # Identical curves by content hash
+    hashes = []
+    usage = {}
+    for renderer_parms, parm in channels:
+        content = json.dumps(renderer_parms[parm], sort_keys=True)
+        content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+        hashes.append(content_hash)
+        usage[content_hash] = usage.get(content_hash, 0) + 1
+
+    for (renderer_parms, parm), content_hash in zip(channels, hashes):
+        if usage[content_hash] > 1:
+            curves[content_hash] = renderer_parms[parm]
+            renderer_parms[parm] = {"curve": content_hash}
+
+    return curves
+
+
+def expand_channel(value, curves):
+    """
+    Value per frame of a compressed animated channel, other values are returned as they are.
+    :param value: Channel value
+    :param curves: Dictionary of content hash to shared curve
+    :return: Channel value
+    """
+    if not isinstance(value, dict):
+        return value
+
+    if "curve" in value:
+        value = curves[value["curve"]]
+        if not isinstance(value, dict):
+            return value
+
+    # Linear interpolation between the kept keys
+    keys = value["keys"]
+    values = [keys[0][1]]
+    for (start, start_value), (end, end_value) in zip(keys[:-1], keys[1:]):
+        slope = (end_value - start_value) / float(end - start)
+        for index in range(start + 1, end):
+            values.append(start_value + slope * (index - start))
+        values.append(end_value)
+
+    return values
+
+
+def expand_light(light_data, curves):
+    """
+    Expand every compressed animated channel of one Light in place.
+    :param light_data: Light data
+    :param curves: Dictionary of content hash to shared curve
+    :return: Light data
+    """
+    if frames_key in light_data:
+        for renderer_parms in light_data.values():
+            if isinstance(renderer_parms, dict):
+                for parm, value in renderer_parms.items():
+                    if parm == world_matrix_key:
+                        renderer_parms[parm] = [expand_channel(element, curves) for element in value]
+                    elif isinstance(value, dict):
+                        renderer_parms[parm] = expand_channel(value, curves)
+
+    return light_data
+
+
+def json_decoder():
+    """
+    Json Decoder keeping the key order on py2.
+    :return: json.JSONDecoder
+    """
+    if sys.version[0] == "3":
+        return json.JSONDecoder()
+    return json.JSONDecoder(object_pairs_hook=OrderedDict)
+
+
+def read_json_lines(path):
+    """
+    Read a Json Lines Light file one Light at a time.
+    Incomplete last line (interrupted Export) is skipped.
+    :param path: Json Lines file path
+    :return: Generator of (Light name, Light data, Bytes read)
+    """
+    decoder = json_decoder()
+    position = 0
+
+    with open(path, "rb") as json_lines_file:
+        for line in json_lines_file:
+            if not line.endswith(b"\n"):
+                break
+            position += len(line)
+
+            line = line.decode("utf-8").strip()
+            if not line:
+                continue
+
+            # One Light per line
+            record = decoder.decode(line)
+            for light in record:
+                yield light, record[light], position
+
+
+def read_json_object(path):
+    """
+    Read a Json Light file one Light at a time, without loading the whole file.
+    Parses the top level object incrementally, one "Light name": {Light data} pair at a time.
+    :param path: Json file path
+    :return: Generator of (Light name, Light data, Bytes read)
+    """
+    decoder = json_decoder()
+    utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    with open(path, "rb") as json_file:
+        buffer = ""
+        position = 0
+        end_of_file = False
+        index = 0
+        started = False
+
+        while True:
+            # Skip whitespace and separators, read more data when the buffer runs out
+            while index < len(buffer) and buffer[index] in json_whitespace:
+                index += 1
+
+            record = None
+            if index < len(buffer):
+                if not started:
+                    if buffer[index] != "{":
+                        raise ValueError("Expecting '{{' at the start of {0}".format(path))
+                    started = True
+                    index += 1
+                    continue
+
+                if buffer[index] == "}":
+                    return
+                if buffer[index] == ",":
+                    index += 1
+                    continue
+
+                record = read_json_pair(decoder, buffer, index, end_of_file)
+
+            if record is None:
+                if end_of_file:
+                    raise ValueError("Unexpected end of Json file {0}".format(path))
+
+                # Keep only the unparsed part of the buffer
+                buffer = buffer[index:]
+                index = 0
+
+                chunk = json_file.read(read_chunk_size)
+                position += len(chunk)
+                end_of_file = not chunk
+                buffer += utf8_decoder.decode(chunk, end_of_file)
+                continue
+
+            light, light_data, index = record
+            yield light, light_data, position
+
+
+def read_json_pair(decoder, buffer, index, end_of_file):
+    """
+    Parse one "key": value pair of a Json object.
+    :param decoder: json.JSONDecoder
+    :param buffer: Text to parse
+    :param index: Start of the key in the buffer
+    :param end_of_file: True if the buffer holds the rest of the file
+    :return: (key, value, index after the value), or None if the buffer needs more data
+    """
+    try:
+        key, index = decoder.raw_decode(buffer, index)
+        while index < len(buffer) and buffer[index] in json_whitespace:
+            index += 1
+        if index >= len(buffer):
+            return None
+        if buffer[index] != ":":
+            raise ValueError("Expecting ':' after {0}".format(key))
+        index += 1
+        while index < len(buffer) and buffer[index] in json_whitespace:
+            index += 1
+        value, index = decoder.raw_decode(buffer, index)
+    except ValueError:
+        if end_of_file:
+            raise
+        return None
+
+    # A value ending with the buffer may be cut (e.g. a number), wait for more data
+    if index >= len(buffer) and not end_of_file:
+        return None
+
+    return key, value, index
+
+
+def binary_value_type(value):
+    """
+    Binary type code of a Parameter value.
+    :param value: Parameter value
+    :return: Type code
+    """
+    if value is None:
+        return "N"
+    if isinstance(value, (str, type(u""))):
+        return "s"
+    if isinstance(value, list) and len(value) == 16:
+        return "M"
+    if type(value) in binary_value_types:
+        return binary_value_types[type(value)]
+    if sys.version[0] != "3" and isinstance(value, long):
+        return "q"
+    raise TypeError("Unsupported Parameter value {0!r}".format(value))
+
+
+def write_binary_file(path, lights, compress=True):
+    """
+    Write Lights to a Binary Light Rig file.
+    Header: string table (Light, Renderer, Parameter names and string values) and record layouts.
+    Records: per Light its name index and, per Renderer, the Renderer name index, the layout index and the values
+    packed with the layout struct format.
+    :param path: Binary Light Rig file path
+    :param lights: Dictionary of Light name to {Renderer: {Parameter: value}}
+    :param compress: zlib compress the file
+    :return: None
+    """
+    strings = []
+    string_index = {}
+    layouts = []
+    layout_index = {}
+
+    def index_of(string):
+        if string not in string_index:
+            string_index[string] = len(strings)
+            strings.append(string)
+        return string_index[string]
+
+    records = []
+    for light in lights:
+        record = [struct.pack("<IB", index_of(light), len(lights[light]))]
+        for renderer, parms in lights[light].items():
+            # Layout of this Renderer record: Parameter names and value types
+            keys = []
+            types = ""
+            values = []
+            for parm, value in parms.items():
+                value_type = binary_value_type(value)
+                keys.append(index_of(parm))
+                types += value_type
+                if value_type == "s":
+                    values.append(index_of(value))
+                elif value_type == "M":
+                    values.extend(float(element) for element in value)
+                elif value_type != "N":
+                    values.append(value)
+
+            layout = (tuple(keys), types)
+            if layout not in layout_index:
+                layout_index[layout] = len(layouts)
+                layouts.append(layout)
+
+            record.append(struct.pack("<IH", index_of(renderer), layout_index[layout]))
+            record.append(struct.pack(binary_struct_format(types), *values))
+        records.append(b"".join(record))
+
+    header = json.dumps({"strings": strings, "layouts": [[list(keys), types] for keys, types in layouts],
+                         "count": len(records)}, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    body = struct.pack("<I", len(header)) + header + b"".join(records)
+
+    flags = 0
+    if compress:
+        flags |= binary_compressed
+        body = zlib.compress(body, 6)
+
+    with open(path, "wb") as binary_file:
+        binary_file.write(binary_magic + struct.pack("<BB", binary_version, flags))
+        binary_file.write(body)
+
+
+def binary_struct_format(types):
+    """
+    Struct format of a Binary Light Rig record layout.
+    :param types: Value type codes
+    :return: Struct format
+    """
+    return "<" + types.replace("N", "").replace("s", "I").replace("M", "16d")
+
+
+def read_binary_file(path):
+    """
+    Read a Binary Light Rig file one Light at a time.
+    :param path: Binary Light Rig file path
+    :return: Generator of (Light name, Light data, Bytes read)
+    """
+    with open(path, "rb") as binary_file:
+        data = binary_file.read()
+
+    if data[:len(binary_magic)] != binary_magic:
+        raise ValueError("{0} is not a Binary Light Rig file".format(path))
+    version, flags = struct.unpack_from("<BB", data, len(binary_magic))
+    if version not in binary_read_versions:
+        raise ValueError("Unsupported Binary Light Rig version {0} in {1}".format(version, path))
+
+    size = len(data)
+    body = data[len(binary_magic) + 2:]
+    if flags & binary_compressed:
+        body = zlib.decompress(body)
+
+    header_size = struct.unpack_from("<I", body)[0]
+    header = json_decoder().decode(body[4:4 + header_size].decode("utf-8"))
+    strings = header["strings"]
+
+    # Compile layouts: Parameter names, struct, unpacked positions of string values and of World Matrices,
+    # and positions of None values
+    layouts = []
+    for keys, types in header["layouts"]:
+        string_values = []
+        matrix_values = []
+        position = 0
+        for value_type in types.replace("N", ""):
+            if value_type == "s":
+                string_values.append(position)
+            elif value_type == "M":
+                matrix_values.insert(0, position)
+                position += 15
+            position += 1
+        layouts.append(([strings[key] for key in keys], struct.Struct(binary_struct_format(types)), string_values,
+                        matrix_values, [index for index, value_type in enumerate(types) if value_type == "N"]))
+
+    offset = 4 + header_size
+    for count in range(header["count"]):
+        light, renderer_count = struct.unpack_from("<IB", body, offset)
+        offset += 5
+
+        if sys.version[0] == "3":
+            light_data = {}
+        else:
+            light_data = OrderedDict()
+
+        for renderer in range(renderer_count):
+            renderer, layout = struct.unpack_from("<IH", body, offset)
+            offset += 6
+            keys, layout_struct, string_values, matrix_values, none_values = layouts[layout]
+            values = layout_struct.unpack_from(body, offset)
+            offset += layout_struct.size
+
+            if string_values or matrix_values or none_values:
+                values = list(values)
+                for index in string_values:
+                    values[index] = strings[values[index]]
+                # Last World Matrix first, the positions of the others don't move
+                for index in matrix_values:
+                    values[index:index + 16] = [values[index:index + 16]]
+                for index in none_values:
+                    values.insert(index, None)
+
+            if sys.version[0] == "3":
+                light_data[strings[renderer]] = dict(zip(keys, values))
+            else:
+                light_data[strings[renderer]] = OrderedDict(zip(keys, values))
+
+        yield strings[light], light_data, size * offset // len(body)
+
+
+def convert_light_file(source, destination, compress=True):
+    """
+    Convert a Light file between Json, Json Lines and Binary Light Rig formats, based on the file extensions.
+    Animated Lights can only be converted to Json and Json Lines.
+    :param source: Source Light file path
+    :param destination: Destination Light file path
+    :param compress: zlib compress Binary Light Rig files
+    :return: None
+    """
+    # The converted file keeps the schema version of the source file
+    if is_binary(destination):
+        lights = with_temperatures(load_light_file(source))
+        if any(frames_key in light_data for light_data in lights.values()):
+            raise ValueError("Animated Lights can't be saved as Binary Light Rig, use Json or Json Lines.")
+        write_binary_file(destination, with_schema(lights, light_file_schemas[source]), compress)
+    elif is_json_lines(destination):
+        json_lines_file, exported = open_json_lines(destination)
+        temperatures = set()
+        try:
+            for light, light_data, file_progress in read_light_file(source):
+                # The schema version is known once the first Light is read
+                if not exported and light_file_schemas[source]:
+                    write_json_lines_record(json_lines_file, schema_key, schema_record(light_file_schemas[source]))
+                exported.add(light)
+                write_temperatures_record(json_lines_file, {light: light_data}, temperatures)
+                write_json_lines_record(json_lines_file, light, light_data)
+        finally:
+            json_lines_file.close()
+    else:
+        lights = with_temperatures(load_light_file(source))
+        with open(destination, "w") as json_file:
+            json.dump(with_schema(lights, light_file_schemas[source]), json_file, indent=4, ensure_ascii=False)
+
+
+def read_light_file(path):
+    """
+    Read a Json or Json Lines Light file one Light at a time.
+    :param path: Light file path
+    :return: Generator of (Light name, Light data, Fraction of the file read)
+    """
+    size = float(os.path.getsize(path)) or 1.0
+
+    if is_json_lines(path):
+        records = read_json_lines(path)
+    elif is_binary(path):
+        records = read_binary_file(path)
+    else:
+        records = read_json_object(path)
+
+    # Schema version, shared curves and Color Temperature samples come before the Lights using them
+    light_file_schemas[path] = None
+    curves = {}
+    for light, light_data, position in records:
+        if light == schema_key:
+            light_file_schemas[path] = light_data["light_schema"]["version"]
+            continue
+        if light == curves_key:
+            curves = light_data
+            continue
+        if light == temperatures_key:
+            add_temperature_record(light_data)
+            continue
+
+        yield light, expand_light(light_data, curves), min(position / size, 1.0)
+
+
+def load_light_file(path):
+    """
+    Load a Json, Json Lines or Binary Light Rig file.
+    :param path: Light file path
+    :return: Dictionary of Light name to Light data
+    """
+    if is_json_lines(path) or is_binary(path):
+        if sys.version[0] == "3":
+            return dict((light, light_data) for light, light_data, file_progress in read_light_file(path))
+        return OrderedDict((light, light_data) for light, light_data, file_progress in read_light_file(path))
+
+    # Load Json file as py2 or py3
+    with open(path, "r") as light_file:
+        if sys.version[0] == "3":
+            lights = json.load(light_file)
+        else:
+            lights = json.load(light_file, object_pairs_hook=OrderedDict)
+
+    # Schema version and Color Temperature samples
+    light_file_schemas[path] = lights.pop(schema_key, {}).get("light_schema", {}).get("version")
+    add_temperature_record(lights.pop(temperatures_key, {}))
+
+    # Expand compressed animated channels
+    curves = lights.pop(curves_key, {})
+    for light_data in lights.values():
+        expand_light(light_data, curves)
+
+    return lights
+
+
+def open_json_lines(path, resume=False):
+    """
+    Open a Json Lines Light file for writing.
+    :param path: Json Lines file path
+    :param resume: Keep the Lights already written in the file and append new ones
+    :return: Open file, Set of Light names already in the file
+    """
+    exported = set()
+
+    if resume and os.path.exists(path):
+        # Size of the file up to the last complete line, and the Lights written in it
+        size = 0
+        with open(path, "rb") as json_lines_file:
+            for line in json_lines_file:
+                if not line.endswith(b"\n"):
+                    break
+                size += len(line)
+                if line.strip():
+                    exported.update(json.loads(line.decode("utf-8")))
+
+        # Drop the incomplete last line and append after the completed Lights
+        json_lines_file = open(path, "a")
+        json_lines_file.truncate(size)
+        return json_lines_file, exported
+
+    return open(path, "w"), exported
+
+
+def with_temperatures(lights):
+    """
+    Lights preceded by the exact Colors of the Color Temperatures they export in Kelvin, if any are known.
+    :param lights: Dictionary of Light name to Light data
+    :return: Dictionary of Light name to Light data
+    """
+    record = temperature_record(light_temperatures(lights))
+    if not record:
+        return lights
+
+    if sys.version[0] == "3":
+        return dict([(temperatures_key, record)] + list(lights.items()))
+    return OrderedDict([(temperatures_key, record)] + list(lights.items()))
+
+
+def schema_record(version=schema_version):
+    """
+    Light schema version record, with the layout of a Light so every Light file format can hold it.
+    :param version: Light schema version
+    :return: {"light_schema": {"version": version}}
+    """
+    return {"light_schema": {"version": version}}
+
+
+def with_schema(lights, version=schema_version):
+    """
+    Lights preceded by the Light schema version they were exported with.
+    :param lights: Dictionary of Light name to Light data
+    :param version: Light schema version, nothing is added if None
+    :return: Dictionary of Light name to Light data
+    """
+    if version is None:
+        return lights
+
+    if sys.version[0] == "3":
+        return dict([(schema_key, schema_record(version))] + list(lights.items()))
+    return OrderedDict([(schema_key, schema_record(version))] + list(lights.items()))
+
+
+def schema_mismatch(path):
+    """
+    Warning about a Light file read with another Light schema version than this package uses,
+    its Parameters may not match the Parameter Tables.
+    :param path: Light file path, already read
+    :return: Warning text, empty if the versions match or the file has no version
+    """
+    version = light_file_schemas.get(path)
+    if version is None or version == schema_version:
+        return ""
+    return "{0} was exported with Light schema {1}, this package uses {2}.".format(path, version, schema_version)
+
+
+def write_temperatures_record(json_lines_file, lights, written=None):
+    """
+    Write the exact Colors of the Color Temperatures of some Lights to a Json Lines file, before the Lights.
+    :param json_lines_file: Open Json Lines file
+    :param lights: Dictionary of Light name to Light data about to be written
+    :param written: Set of Kelvin already written to the file, updated
+    :return: None
+    """
+    if written is None:
+        written = set()
+
+    record = temperature_record([kelvin for kelvin in light_temperatures(lights) if kelvin not in written])
+    if record:
+        write_json_lines_record(json_lines_file, temperatures_key, record)
+        written.update(float(kelvin) for kelvin in record)
+
+
+def write_json_lines_record(json_lines_file, light, light_data):
+    """
+    Write one Light as one line of a Json Lines file.
+    :param json_lines_file: Open Json Lines file
+    :param light: Light name
+    :param light_data: Light data
+    :return: None
+    """
+    json_lines_file.write(json.dumps({light: light_data}, ensure_ascii=False))
+    json_lines_file.write("\n")
+
+
+def main():
+    """
+    Command line Light file converter.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Convert Light files between Json (.json), Json Lines (.jsonl) "
+                                                 "and Binary Light Rig (.mhl) formats.")
+    parser.add_argument("source", help="Source Light file")
+    parser.add_argument("destination", help="Destination Light file")
+    parser.add_argument("--no-compress", action="store_true", help="Write uncompressed Binary Light Rig files")
+    args = parser.parse_args()
+
+    convert_light_file(args.source, args.destination, not args.no_compress)
+    sys.stdout.write("Lights converted to {0}\n".format(args.destination))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+
+light_schema.py
+
+Generated by maya_to_houdini_light_parms_py3.py, do not edit.
+
+Compiled Maya to Houdini Light schema, see light_conversion.schema_light_data().
+
+"""
+
+# Version of the schema, saved in every exported Light file
+schema_version = "96fcbefa1015"
+
+# Maya Parameter names, by index
+maya_parms = ("translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "visibility", "intensity",
+              "aiSamples", "aiCastShadows", "aiShadowDensity", "aiAov", "aiDiffuse", "aiSpecular", "aiSss",
+              "aiIndirect", "aiVolume", "colorR", "colorG", "colorB", "aiExposure", "shadColorR", "shadColorG",
+              "shadColorB", "aiRadius", "aiNormalize", "aiCamera", "aiTransmission", "aiAngle", "coneAngle",
+              "penumbraAngle", "dropoff", "scaleX", "scaleY", "aiSpread", "aiSoftEdge", "aiRoundness",
+              "aiShadowColorR", "aiShadowColorG", "aiShadowColorB", "exposure", "normalize", "scaleZ", "camera",
+              "transmission", "aiVolumeSamples", "aiCastVolumetricShadows", "aiMaxBounces", "aiLensRadius",
+              "aiAspectRatio", "resolution", "format", "aiAovIndirect")
+
+# Houdini Parameter names, by index
+houdini_parms = ("tx", "ty", "tz", "rx", "ry", "rz", "light_enable", "light_intensity", "vm_samplingquality",
+                 "shadow_type", "shadow_intensity", "vm_lpetag", "light_contribenable1", "light_contribenable2",
+                 "light_contribenable3", "light_contribenable4", "light_contribenable5", "light_contribenable6",
+                 "light_colorr", "light_colorg", "light_colorb", "light_exposure", "shadow_colorr", "shadow_colorg",
+                 "shadow_colorb", "areasize1", "areasize2", "normalizearea", "light_contribprimary",
+                 "light_contribenable7", "vm_envangle", "coneangle", "conedelta", "coneroll", "edgewidth", "",
+                 "ar_intensity", "ar_samples", "ar_volume_samples", "ar_shadow_density", "ar_cast_shadows",
+                 "ar_cast_volumetric_shadows", "ar_diffuse", "ar_specular", "ar_sss", "ar_indirect", "ar_volume",
+                 "ar_max_bounces", "ar_aov", "ar_exposure", "ar_point_radius", "ar_normalize", "ar_shadow_colorr",
+                 "ar_shadow_colorg", "ar_shadow_colorb", "ar_camera", "ar_transmission", "ar_angle",
+                 "ar_spot_roundness", "ar_cone_angle", "ar_penumbra_angle", "ar_spot_radius", "ar_lens_radius",
+                 "ar_aspect_ratio", "ar_quad_roundness", "ar_soft_edge", "ar_spread", "ar_quad_sizex", "ar_quad_sizey",
+                 "ar_disk_radius", "ar_cylinder_radius", "ar_height", "ar_resolution", "ar_format", "ar_aov_indirect")
+
+# Houdini Light Node Types, by index
+node_types = ("hlight::2.0", "envlight")
+
+# Light Types: (Renderer, Maya Light Type, Houdini Node Type index or None, Light Type menu value,
+#     Number of Light Contributions or None, ((Maya Parameter index, Houdini Parameter index or indices), ...))
+light_types = (
+    ("Mantra", "pointLightP", 0, 0, 6,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (21, 22), (22, 23),
+      (23, 24))),
+    ("Mantra", "pointLightS", 0, 4, 7,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (24, (25, 26)), (25, 27),
+      (21, 22), (22, 23), (23, 24), (26, 28), (27, 29))),
+    ("Mantra", "directionalLightD", 0, 7, 6,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (21, 22), (22, 23),
+      (23, 24))),
+    ("Mantra", "directionalLightS", 0, 8, 6,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (28, 30), (21, 22),
+      (22, 23), (23, 24))),
+    ("Mantra", "spotLightP", 0, 0, 6,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (29, 31), (30, 32), (31, 33),
+      (20, 21), (21, 22), (22, 23), (23, 24))),
+    ("Mantra", "spotLightS", 0, 4, 6,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (29, 31), (30, 32), (31, 33),
+      (20, 21), (24, (25, 26)), (25, 27), (21, 22), (22, 23), (23, 24))),
+    ("Mantra", "areaLight", 0, 2, 7,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (20, 21), (32, 25), (33, 26),
+      (25, 27), (34, (31, 32, 33)), (35, 34), (36, 35), (37, 22), (38, 23), (39, 24), (26, 28), (27, 29))),
+    ("Mantra", "quad", 0, 2, 7,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (40, 21), (32, 25), (33, 26),
+      (41, 27), (34, (31, 32, 33)), (35, 34), (36, 35), (37, 22), (38, 23), (39, 24), (26, 28), (27, 29))),
+    ("Mantra", "disk", 0, 3, 7,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (40, 21), (32, 25), (33, 26),
+      (41, 27), (34, (31, 32, 33)), (37, 22), (38, 23), (39, 24), (26, 28), (27, 29))),
+    ("Mantra", "cylinderC", 0, 5, 7,
+     ((0, 0), (1, 1), (2, 2), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12), (13, (13, 14)), (14, 15),
+      (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (3, 4), (4, 3), (5, 5), (40, 21), (32, 26), (33, 25), (42, 26),
+      (41, 27), (37, 22), (38, 23), (39, 24), (26, 28), (27, 29))),
+    ("Mantra", "cylinderL", 0, 1, 6,
+     ((0, 0), (1, 1), (2, 2), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12), (13, (13, 14)), (14, 15),
+      (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (3, 4), (4, 3), (5, 5), (40, 21), (33, 25), (41, 27), (37, 22),
+      (38, 23), (39, 24))),
+    ("Mantra", "aiSkyDomeLight", 1, "", 7,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 7), (8, 8), (9, 9), (10, 10), (11, 11), (12, 12),
+      (13, (13, 14)), (14, 15), (15, 16), (16, 17), (17, 18), (18, 19), (19, 20), (40, 21), (43, 28), (44, 29))),
+    ("Arnold", "pointLight", None, 0, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (20, 49),
+      (24, 50), (25, 51), (21, 52), (22, 53), (23, 54), (26, 55), (27, 56))),
+    ("Arnold", "directionalLight", None, 1, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (20, 49),
+      (28, 57), (25, 51), (21, 52), (22, 53), (23, 54))),
+    ("Arnold", "spotLight", None, 2, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (20, 49),
+      (36, 58), (29, 59), (30, 60), (24, 61), (48, 62), (49, 63), (25, 51), (21, 52), (22, 53), (23, 54))),
+    ("Arnold", "areaLight", None, 3, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (20, 49),
+      (36, 64), (35, 65), (34, 66), (32, 67), (33, 68), (25, 51), (21, 52), (22, 53), (23, 54), (26, 55), (27, 56))),
+    ("Arnold", "quad", None, 3, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (40, 49),
+      (36, 64), (35, 65), (34, 66), (32, 67), (33, 68), (41, 51), (37, 52), (38, 53), (39, 54), (26, 55), (27, 56))),
+    ("Arnold", "disk", None, 4, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (40, 49),
+      (36, 64), (35, 65), (34, 66), (32, 69), (33, 69), (41, 51), (37, 52), (38, 53), (39, 54), (26, 55), (27, 56))),
+    ("Arnold", "cylinder", None, 5, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (40, 49),
+      (32, 70), (33, 71), (42, 70), (41, 51), (37, 52), (38, 53), (39, 54), (26, 55), (27, 56))),
+    ("Arnold", "aiSkyDomeLight", None, 6, None,
+     ((0, 0), (1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, 6), (7, 36), (8, 37), (45, 38), (10, 39), (9, 40), (46, 41),
+      (12, 42), (13, 43), (14, 44), (15, 45), (16, 46), (47, 47), (11, 48), (17, 18), (18, 19), (19, 20), (50, 72),
+      (51, 73), (40, 49), (37, 52), (38, 53), (39, 54), (43, 55), (44, 56), (52, 74))))
+
+# Mantra Light Contributions: (Contribution name, Houdini Parameter)
+light_contribution_parms = (("diffuse", "light_contribenable1"), ("reflect", "light_contribenable2"),
+                            ("coat", "light_contribenable3"), ("sss", "light_contribenable4"),
+                            ("indirect", "light_contribenable5"), ("volume", "light_contribenable6"),
+                            ("refract", "light_contribenable7"), ("camera", "light_contribprimary"))
+
+# Color Parameters: (Maya Parameter, Houdini Parameter)
+color_light_params = (("colorR", "light_colorr"), ("colorG", "light_colorg"), ("colorB", "light_colorb"))
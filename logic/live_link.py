@@ -0,0 +1,209 @@
+"""
+
+live_link.py
+
+This file contains the Live Link protocol between Maya and Houdini, without any Maya or Houdini dependency.
+
+Maya publishes the exported Lights on a localhost socket and Houdini subscribes to them.
+The stream is a Json Lines Light file which never ends:
+    A new subscriber first gets the Light schema version, the exact Colors of the Color Temperatures and every Light.
+    Every later record of a Light only holds the Parameters which changed, per Renderer.
+    A Renderer whose Maya Light Type or Parameter names changed is sent whole, and listed in replaced_key.
+
+"""
+
+import json
+import socket
+import threading
+
+# Localhost address and default port of the Live Link
+live_link_host = "127.0.0.1"
+default_port = 7393
+
+# Bytes read at once from the socket
+receive_size = 1 << 16
+
+# Key of a Light record listing the Renderers sent whole, which replace the Parameters received before
+replaced_key = "__replaced__"
+
+
+def light_delta(previous, current):
+    """
+    Parameters of a Light which changed since it was last sent.
+    :param previous: Light data last sent, None if never sent
+    :param current: Light data now
+    :return: Dictionary of Renderer to changed Parameters, empty if nothing changed
+    """
+    if previous is None:
+        return current
+
+    delta = {}
+    replaced = []
+    for renderer, parms in current.items():
+        previous_parms = previous.get(renderer, {})
+
+        # Parameters added or removed, the Renderer is sent whole so no stale Parameter is kept
+        if previous_parms.get("nodeType") != parms.get("nodeType") or list(previous_parms) != list(parms):
+            delta[renderer] = parms
+            replaced.append(renderer)
+            continue
+
+        changed = dict((parm, value) for parm, value in parms.items() if previous_parms[parm] != value)
+        if changed:
+            delta[renderer] = changed
+
+    if replaced:
+        delta[replaced_key] = replaced
+    return delta
+
+
+def merge_delta(lights, light, delta):
+    """
+    Apply a Light record of the stream to the Lights received so far.
+    :param lights: Dictionary of Light name to Light data, updated
+    :param light: Light name
+    :param delta: Light data, or its changed Parameters per Renderer
+    :return: Light data
+    """
+    replaced = delta.get(replaced_key, [])
+    if light not in lights:
+        lights[light] = {}
+
+    for renderer, parms in delta.items():
+        if renderer == replaced_key:
+            continue
+        if renderer in replaced or renderer not in lights[light]:
+            lights[light][renderer] = parms
+        else:
+            lights[light][renderer].update(parms)
+    return lights[light]
+
+
+def encode_records(records):
+    """
+    Json Lines of stream records, sent at once.
+    :param records: List of (Light name, Light data)
+    :return: UTF-8 bytes
+    """
+    lines = [json.dumps({light: light_data}, ensure_ascii=False) + "\n" for light, light_data in records]
+    return "".join(lines).encode("utf-8")
+
+
+def listen(port=default_port):
+    """
+    Open the publisher socket on localhost.
+    :param port: Port, 0 for any free port
+    :return: Listening socket
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind((live_link_host, port))
+    server.listen(5)
+    return server
+
+
+def accept_subscribers(server, on_subscriber):
+    """
+    Start accepting subscribers on a worker thread, until the publisher socket is closed.
+    :param server: Listening socket from listen()
+    :param on_subscriber: Called on the worker thread with every connected socket
+    :return: Thread
+    """
+    def worker():
+        while True:
+            try:
+                connection, address = server.accept()
+            except (OSError, socket.error):
+                return
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            on_subscriber(connection)
+
+    thread = threading.Thread(target=worker, name="Live Link publisher")
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def send_records(connections, records):
+    """
+    Send stream records to subscribers.
+    :param connections: Connected sockets
+    :param records: List of (Light name, Light data)
+    :return: Connected sockets which are still open, Number of bytes sent to each
+    """
+    if not records:
+        return list(connections), 0
+
+    data = encode_records(records)
+    open_connections = []
+    for connection in connections:
+        try:
+            connection.sendall(data)
+            open_connections.append(connection)
+        except (OSError, socket.error):
+            connection.close()
+
+    return open_connections, len(data)
+
+
+def close_socket(connection):
+    """
+    Close a socket, and wake up the worker thread blocked reading from it.
+    :param connection: Listening or connected socket
+    :return: None
+    """
+    try:
+        connection.shutdown(socket.SHUT_RDWR)
+    except (OSError, socket.error):
+        pass
+    connection.close()
+
+
+def connect(port=default_port, timeout=5.0):
+    """
+    Connect a subscriber to the publisher.
+    :param port: Port of the publisher
+    :param timeout: Seconds to wait for the publisher
+    :return: Connected socket
+    """
+    connection = socket.create_connection((live_link_host, port), timeout)
+    connection.settimeout(None)
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return connection
+
+
+def receive_records(connection, on_record):
+    """
+    Start reading stream records on a worker thread, until the connection is closed.
+    :param connection: Connected socket from connect()
+    :param on_record: Called on the worker thread with (Light name, Light data) for every record,
+        and with (None, None) once the connection is closed
+    :return: Thread
+    """
+    def worker():
+        buffer = b""
+        try:
+            while True:
+                data = connection.recv(receive_size)
+                if not data:
+                    break
+                buffer += data
+                if b"\n" not in data:
+                    continue
+
+                # Complete lines only, the rest waits for more data
+                lines = buffer.split(b"\n")
+                buffer = lines.pop()
+                for line in lines:
+                    if line.strip():
+                        for light, light_data in json.loads(line.decode("utf-8")).items():
+                            on_record(light, light_data)
+        except (OSError, socket.error, ValueError):
+            pass
+        finally:
+            on_record(None, None)
+
+    thread = threading.Thread(target=worker, name="Live Link subscriber")
+    thread.daemon = True
+    thread.start()
+    return thread
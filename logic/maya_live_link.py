@@ -0,0 +1,214 @@
+"""
+
+maya_live_link.py
+
+This file contains the Maya side of the Live Link: the selected Lights are published to Houdini while they are edited.
+
+Lights are sampled with the Export code and watched with the Export cache callbacks.
+Every Light changed during one event loop tick is sampled again once, when Maya is idle,
+and only its changed Parameters are sent to the subscribers.
+
+"""
+
+import sys
+import threading
+import maya.cmds as cmds
+import maya.utils
+
+from logic import maya_logic
+from logic.live_link import default_port, light_delta, listen, accept_subscribers, send_records, close_socket
+from logic.light_file import schema_key, schema_record, temperatures_key
+from logic.color_temperature import light_temperatures, temperature_record
+
+# Live Link publisher state
+# server: Listening socket, None when stopped
+# lock: Guards new_subscribers, which are added by the accepting thread
+# subscribers: Sockets of the subscribers which have every Light
+# new_subscribers: Sockets of the subscribers waiting for every Light
+# lights: Light Transform: (Light Shape, Maya Light Type, Light name)
+# export_plan: Export Plan from maya_logic.build_export_plan()
+# sent: Light name: Light data last sent
+# kelvins: Color Temperatures whose exact Colors were sent
+# changed: Light Transforms changed since the last flush
+# scheduled: A flush waits for Maya to be idle
+# bytes_sent: Bytes sent to every subscriber
+publisher_state = {"server": None, "lock": threading.Lock(), "subscribers": [], "new_subscribers": [], "lights": {},
+                   "export_plan": None, "sent": {}, "kelvins": set(), "changed": set(), "scheduled": False,
+                   "bytes_sent": 0}
+
+
+def schedule_flush():
+    """
+    Flush the changed Lights once Maya is idle, once per event loop tick however many Lights changed.
+    Thread safe, subscribers are added from the accepting thread.
+    :return: None
+    """
+    if not publisher_state["scheduled"]:
+        publisher_state["scheduled"] = True
+        maya.utils.executeDeferred(flush_changes)
+
+
+def light_changed(light):
+    """
+    Export cache listener, marks published Lights as changed.
+    :param light: Light Transform node, None if every Light may have changed
+    :return: None
+    """
+    if publisher_state["server"] is None:
+        return
+
+    if light is None:
+        publisher_state["changed"].update(publisher_state["lights"])
+    elif light in publisher_state["lights"]:
+        publisher_state["changed"].add(light)
+    else:
+        return
+    schedule_flush()
+
+
+def subscriber_connected(connection):
+    """
+    Publisher socket listener, the new subscriber gets every Light on the next flush.
+    :param connection: Connected socket
+    :return: None
+    """
+    with publisher_state["lock"]:
+        publisher_state["new_subscribers"].append(connection)
+    schedule_flush()
+
+
+def sample_lights(lights):
+    """
+    Sample Lights again, through the Export cache, which also watches them for changes.
+    Lights deleted from the Maya Scene are not published anymore.
+    :param lights: Light Transform nodes
+    :return: List of (Light name, Light data)
+    """
+    samples = []
+    for light in lights:
+        if not cmds.objExists(light):
+            publisher_state["lights"].pop(light, None)
+            continue
+        light_shape, light_type, light_name = publisher_state["lights"][light]
+        samples.append((light_name, maya_logic.cached_sample_light(light, light_shape, publisher_state["export_plan"],
+                                                                   None, light_type)))
+
+    return samples
+
+
+def temperatures_records(lights):
+    """
+    Exact Colors of the Color Temperatures of some Lights which were not sent yet.
+    :param lights: Dictionary of Light name to Light data
+    :return: List of (temperatures_key, record), empty if nothing is new
+    """
+    record = temperature_record([kelvin for kelvin in light_temperatures(lights)
+                                 if kelvin not in publisher_state["kelvins"]])
+    publisher_state["kelvins"].update(float(kelvin) for kelvin in record)
+    return [(temperatures_key, record)] if record else []
+
+
+def flush_changes():
+    """
+    Send the changed Parameters of the changed Lights to the subscribers, and every Light to new subscribers.
+    :return: None
+    """
+    publisher_state["scheduled"] = False
+    if publisher_state["server"] is None:
+        return
+
+    # Changed Parameters of the changed Lights
+    changed = sorted(publisher_state["changed"])
+    publisher_state["changed"].clear()
+    records = []
+    samples = sample_lights(changed)
+    records.extend(temperatures_records(dict(samples)))
+    for light_name, light_export in samples:
+        delta = light_delta(publisher_state["sent"].get(light_name), light_export)
+        if delta:
+            records.append((light_name, delta))
+            publisher_state["sent"][light_name] = light_export
+
+    publisher_state["subscribers"], size = send_records(publisher_state["subscribers"], records)
+    publisher_state["bytes_sent"] += size
+
+    # New subscribers get every Light as it is now
+    with publisher_state["lock"]:
+        new_subscribers = publisher_state["new_subscribers"]
+        publisher_state["new_subscribers"] = []
+    if new_subscribers:
+        sent = publisher_state["sent"]
+        records = [(schema_key, schema_record())]
+        temperatures = temperature_record(light_temperatures(sent))
+        if temperatures:
+            records.append((temperatures_key, temperatures))
+        records.extend(sent.items())
+        publisher_state["subscribers"].extend(send_records(new_subscribers, records)[0])
+
+
+def start_publisher(port=default_port, kelvin=False, recursive=False):
+    """
+    Publish the selected Lights to Houdini until stop_publisher(), see houdini_live_link.start_subscriber().
+    :param port: Localhost port, 0 for any free port
+    :param kelvin: Publish Color Temperatures in Kelvin with their exact Colors, resolved by Houdini
+    :param recursive: Also publish the Lights anywhere under selected groups
+    :return: Port the subscribers connect to
+    """
+    stop_publisher()
+
+    # Lights list
+    lights = maya_logic.lights_list(recursive)
+    if not lights["transforms"]:
+        raise ValueError("Select the Lights to publish.")
+
+    # Sample every Light again if the cached Lights were sampled with other settings
+    if maya_logic.export_cache_settings["kelvin"] != kelvin:
+        maya_logic.clear_export_cache()
+        maya_logic.export_cache_settings["kelvin"] = kelvin
+    publisher_state["export_plan"] = maya_logic.build_export_plan(kelvin)
+
+    publisher_state["lights"] = dict(zip(lights["transforms"], zip(lights["shapes"], lights["types"],
+                                                                   lights["names"])))
+    matrices = maya_logic.world_matrices(lights["transforms"])
+    for light, light_shape, light_type, light_name in zip(lights["transforms"], lights["shapes"], lights["types"],
+                                                          lights["names"]):
+        publisher_state["sent"][light_name] = maya_logic.cached_sample_light(
+            light, light_shape, publisher_state["export_plan"], matrices[light], light_type)
+    publisher_state["kelvins"].update(light_temperatures(publisher_state["sent"]))
+
+    # Publisher socket
+    publisher_state["server"] = listen(port)
+    maya_logic.light_change_listeners.append(light_changed)
+    accept_subscribers(publisher_state["server"], subscriber_connected)
+
+    port = publisher_state["server"].getsockname()[1]
+    sys.stdout.write("Live Link: publishing {0} Lights on port {1}\n".format(len(publisher_state["lights"]), port))
+    return port
+
+
+def stop_publisher():
+    """
+    Stop publishing and disconnect the subscribers.
+    :return: None
+    """
+    if light_changed in maya_logic.light_change_listeners:
+        maya_logic.light_change_listeners.remove(light_changed)
+
+    if publisher_state["server"] is not None:
+        close_socket(publisher_state["server"])
+        sys.stdout.write("Live Link stopped\n")
+    with publisher_state["lock"]:
+        for connection in publisher_state["subscribers"] + publisher_state["new_subscribers"]:
+            close_socket(connection)
+        publisher_state["new_subscribers"] = []
+
+    publisher_state.update({"server": None, "subscribers": [], "lights": {}, "export_plan": None, "sent": {},
+                            "kelvins": set(), "changed": set(), "scheduled": False, "bytes_sent": 0})
+
+
+def is_publishing():
+    """
+    Live Link publisher state.
+    :return: True while the Lights are published
+    """
+    return publisher_state["server"] is not None
@@ -6,71 +6,630 @@ This file contains all the Maya logic to generate Json file for selected Lights.
 
 """
 
-import os
+import re
 import sys
 import json
+import time
+import hashlib
 import maya.cmds as cmds
+import maya.api.OpenMaya as om
 
-# Current script path
-package_path = os.path.dirname(os.path.realpath(__file__))
+from logic.light_file import is_json_lines, is_binary, open_json_lines, write_json_lines_record, write_binary_file, \
+    frames_key, curves_key, temperatures_key, schema_key, world_matrix_key, animation_frames, compress_channels, \
+    with_temperatures, with_schema, schema_record, write_temperatures_record
+from logic.transform import transform_parms, rotate_parms, decompose_matrix
+from logic.color_temperature import kelvin_parm, temperature_color, light_temperatures, temperature_record
+from logic.progress import add_time
+from logic.light_conversion import light_data, exported_renderers
 
-# Json file path
-json_file_path = os.path.join(package_path, "maya_to_houdini_light_data.json")
-
-# Load maya_to_houdini_light_data Json for py2 or py3
-if sys.version[0] == "3":
-    with open(json_file_path, "r") as json_file:
-        light_data = json.load(json_file)
-else:
+if sys.version[0] != "3":
     from collections import OrderedDict
-    with open(json_file_path, "r") as json_file:
-        light_data = json.load(json_file, object_pairs_hook=OrderedDict)
 
+# Renderer Light Type rules for every Maya Light Type (Node Type, or aiTranslator value for aiAreaLight)
+# Maya Light Type: {Renderer: (Attributes, Suffix if all Attributes are 0, Suffix otherwise)}
+# Renderers without a rule use the Maya Light Type as it is.
+light_type_rules = {"pointLight": {"Mantra": (["aiRadius"], "P", "S")},
+                    "directionalLight": {"Mantra": (["aiAngle"], "D", "S")},
+                    "spotLight": {"Mantra": (["aiRadius"], "P", "S")},
+                    "areaLight": {},
+                    "quad": {},
+                    "disk": {},
+                    "cylinder": {"Mantra": (["scaleX", "scaleZ"], "L", "C")},
+                    "aiSkyDomeLight": {}}
+
+# Renderers whose Texture Maps are applied through a texture Material, with the texture node and its Color Space
+texture_material_renderers = ["Mantra"]
+
+# Maya Light Node Types exported, other Node Types inheriting from them are left out
+light_node_types = ["directionalLight", "pointLight", "spotLight", "areaLight", "aiAreaLight", "aiSkyDomeLight"]
+
+# Characters of Maya paths which are not allowed in Houdini Node names
+illegal_name_characters = re.compile(r"[^0-9A-Za-z_]")
+
+# Length of the path hash added to Light names given by several Maya paths
+name_suffix_size = 8
+
+# Number of Lights written between two flushes of a Json Lines Export
+flush_interval = 50
+
+# Post-processing steps applied on the Attribute values before saving them
+export_value_steps = {"aiAov": lambda values, matrix: "" if values["aiAov"] == "default" else values["aiAov"],
+                      world_matrix_key: lambda values, matrix: matrix}
+
+# Lights sampled by previous Exports, reused until one of their nodes changes
+# Light Transform: Sampled Light data
+export_cache = {}
+
+# Maya callbacks marking cached Lights as changed
+# Light Transform: [Callback ids]
+export_callbacks = {}
+
+# Maya callbacks clearing the whole cache on time or scene change
+scene_callbacks = []
+
+# Export settings of the cached Lights, the cache is cleared when they change
+export_cache_settings = {"kelvin": False}
+
+# Functions called with the Light Transform of every changed Light, or None when every Light may have changed
+light_change_listeners = []
+
+
+def light_name(light):
+    """
+    Houdini-legal name of a Light, its Transform full path with "|" and other characters converted to "_".
+    Different paths can give the same name, see light_names().
+    :param light: Light Transform full path
+    :return: Light name
+    """
+    return illegal_name_characters.sub("_", light[1:])
+
+
+def light_names(lights):
+    """
+    Unique exported names of Lights. Names given by several Transform paths, like "|a|b_c" and "|a_b|c",
+    all get a suffix from their own path, so they don't depend on the order of the Lights.
+    :param lights: Light Transform full paths
+    :return: List of Light names, in lights order
+    """
+    names = [light_name(light) for light in lights]
+
+    # Paths per name
+    paths = {}
+    for light, name in zip(lights, names):
+        paths.setdefault(name, set()).add(light)
 
-def lights_list():
+    used = set(name for name in names if len(paths[name]) == 1)
+    for index, (light, name) in enumerate(zip(lights, names)):
+        if len(paths[name]) == 1:
+            continue
+
+        # Longer suffixes if two suffixed names are still the same
+        digest = hashlib.sha1(light.encode("utf-8")).hexdigest()
+        size = name_suffix_size
+        while "{0}_{1}".format(name, digest[:size]) in used:
+            size += 1
+        names[index] = "{0}_{1}".format(name, digest[:size])
+        used.add(names[index])
+
+    return names
+
+
+def api_light_columns(recursive=False):
     """
-    List of selected Lights in Maya.
-    :return: Lights list
+    Selected Lights gathered in one pass through the Maya API selection and DAG iterators.
+    :param recursive: Also gather the Lights anywhere under selected groups
+    :return: Dictionary of Light columns without names, see lights_list()
     """
+    columns = {"transforms": [], "shapes": [], "types": []}
+    visited = set()
+
+    selection_iter = om.MItSelectionList(om.MGlobal.getActiveSelectionList(), om.MFn.kDagNode)
+    dag_iter = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kShape)
+    while not selection_iter.isDone():
+        root = selection_iter.getDagPath()
+        selection_iter.next()
+
+        # Shapes under the selected node, only its direct children if not recursive
+        shape_paths = []
+        if recursive:
+            dag_iter.reset(root, om.MItDag.kDepthFirst, om.MFn.kShape)
+            while not dag_iter.isDone():
+                shape_paths.append(dag_iter.getPath())
+                dag_iter.next()
+        else:
+            for index in range(root.childCount()):
+                shape_paths.append(om.MDagPath(root).push(root.child(index)))
+
+        root_name = root.fullPathName()
+        for shape_path in shape_paths:
+            shape = shape_path.fullPathName()
+            if shape == root_name or shape in visited:
+                continue
+
+            # Exact Node Types, volumeLight inherits from pointLight and is left out
+            shape_node = om.MFnDagNode(shape_path)
+            node_type = shape_node.typeName
+            if node_type not in light_node_types:
+                continue
+            visited.add(shape)
+
+            # Area Lights are split by their Arnold Translator
+            if node_type == "aiAreaLight":
+                node_type = shape_node.findPlug("aiTranslator", False).asString()
+
+            transform = shape_path.pop().fullPathName()
+            columns["transforms"].append(transform)
+            columns["shapes"].append(shape)
+            columns["types"].append(node_type)
+
+    return columns
+
+
+def cmds_light_columns(recursive=False):
+    """
+    Selected Lights gathered with a few batched maya.cmds calls.
+    :param recursive: Also gather the Lights anywhere under selected groups
+    :return: Dictionary of Light columns without names, see lights_list()
+    """
+    columns = {"transforms": [], "shapes": [], "types": []}
 
-    # Viewport Selection
     selection = cmds.ls(selection=True, long=True)
+    shapes = cmds.listRelatives(selection, fullPath=True, allDescendents=recursive, type=light_node_types)
+    if not shapes:
+        return columns
 
-    # Lights list
-    lights = cmds.listRelatives(selection, fullPath=True,
-                                type=["directionalLight", "pointLight", "spotLight", "areaLight", "aiAreaLight",
-                                      "aiSkyDomeLight"])
+    # Node Types of every Shape in one call, each Transform is the parent in the Shape full path,
+    # listRelatives would only list a Transform once for several Shapes
+    typed_shapes = cmds.ls(shapes, showType=True, long=True)
+
+    visited = set()
+    for shape, node_type in zip(typed_shapes[0::2], typed_shapes[1::2]):
+        # Exact Node Types, volumeLight inherits from pointLight and is left out
+        if node_type not in light_node_types or shape in visited:
+            continue
+        visited.add(shape)
 
-    all_lights = []
+        # Area Lights are split by their Arnold Translator
+        if node_type == "aiAreaLight":
+            node_type = cmds.getAttr("{0}.aiTranslator".format(shape))
 
-    # Removing volumeLight from the list if exists
-    if lights:
-        for light in lights:
-            if cmds.nodeType(light) != "volumeLight":
-                all_lights.append(light)
+        columns["transforms"].append(shape.rsplit("|", 1)[0])
+        columns["shapes"].append(shape)
+        columns["types"].append(node_type)
 
-    # Light Transform node
-    lights_transform = cmds.listRelatives(all_lights, parent=True, fullPath=True)
+    return columns
 
-    # convert "|" with "_"
-    lights_transform_name = []
-    for slash in lights_transform:
-        lights_transform_name.append(slash.replace("|", "_")[1:])
 
-    return lights_transform, all_lights, lights_transform_name
+def lights_list(recursive=False, use_api=False):
+    """
+    List of selected Lights in Maya, as columns of the same length.
+    :param recursive: Also list the Lights anywhere under selected groups, otherwise only the Shapes of selected nodes
+    :param use_api: Gather the Lights through the Maya API iterators, otherwise through batched maya.cmds calls,
+        which are faster
+    :return: Dictionary of Light columns
+        transforms: Light Transform full paths
+        shapes: Light Shape full paths
+        names: Exported Light names
+        types: Maya Light Types, Node Type or aiTranslator value for aiAreaLight
+    """
+    if use_api:
+        columns = api_light_columns(recursive)
+    else:
+        columns = cmds_light_columns(recursive)
+    columns["names"] = light_names(columns["transforms"])
 
+    return columns
 
-def export_json_file(path):
+
+def read_attributes(node, attributes, snapshot=None):
     """
-    Export selected Lights from Viewport to Json file.
-    :param path: Json file path
+    Read Attributes of a Node, each Attribute is read only once.
+    :param node: Maya Node name
+    :param attributes: Attribute names to read
+    :param snapshot: Dictionary of already read Attribute values
+    :return: Dictionary of Attribute values
+    """
+    if snapshot is None:
+        snapshot = {}
+
+    for attribute in attributes:
+        if attribute not in snapshot:
+            snapshot[attribute] = cmds.getAttr("{0}.{1}".format(node, attribute))
+
+    return snapshot
+
+
+def build_export_plan(kelvin=False):
+    """
+    Compile light_data into an Export Plan, so every Light only looks up its own Light Type.
+    :param kelvin: Export Color Temperatures in Kelvin, resolved by the importer, instead of RGB
+    :return: Dictionary of Maya Light Type to its plan
+        attributes: Attributes to read once per Light
+        renderers: (Renderer, Rule Attributes, Suffix if 0, Suffix otherwise) for every Renderer
+        steps: {Renderer: {Renderer Light Type: [(Parameter, Post-processing step or None)]}}
+        decompose: Rule Attributes are Transform Attributes, taken from the World Matrix
+        kelvin: Color Temperatures are exported in Kelvin
+    """
+    export_plan = {}
+
+    for light_type in light_type_rules:
+        attributes = []
+        renderers = []
+        steps = {}
+
+        for renderer in exported_renderers:
+            rule = light_type_rules[light_type].get(renderer, ([], "", ""))
+            renderers.append((renderer, rule[0], rule[1], rule[2]))
+
+            # Attributes used by the rule
+            for attribute in rule[0]:
+                if attribute not in attributes and attribute not in transform_parms:
+                    attributes.append(attribute)
+
+            steps[renderer] = {}
+            for suffix in [rule[1]] if rule[1] == rule[2] else [rule[1], rule[2]]:
+                renderer_light_type = light_type + suffix
+                steps[renderer][renderer_light_type] = []
+                light_steps = steps[renderer][renderer_light_type]
+                for parm in light_data[renderer][renderer_light_type]["light_parms"]:
+                    # World Matrix replaces the Transform Attributes, where the first one was
+                    if parm in transform_parms:
+                        if world_matrix_key not in [step[0] for step in light_steps]:
+                            light_steps.append((world_matrix_key, export_value_steps[world_matrix_key]))
+
+                        # Maya rotation, the Import decomposes the World Matrix to the same Euler angles
+                        if parm in rotate_parms:
+                            light_steps.append((parm, None))
+                            if parm not in attributes:
+                                attributes.append(parm)
+                        continue
+
+                    light_steps.append((parm, export_value_steps.get(parm)))
+                    if parm not in attributes:
+                        attributes.append(parm)
+
+        # Color Temperature switch
+        attributes.append("aiUseColorTemperature")
+
+        # Rules on Transform Attributes
+        decompose = bool([attribute for renderer in renderers for attribute in renderer[1]
+                          if attribute in transform_parms])
+
+        export_plan[light_type] = {"attributes": attributes, "renderers": renderers, "steps": steps,
+                                   "decompose": decompose, "kelvin": kelvin}
+
+    return export_plan
+
+
+def world_matrices(lights):
+    """
+    World Matrices of Light Transforms, read in one pass through the Maya API.
+    :param lights: Light Transform nodes
+    :return: Dictionary of Light Transform to World Matrix, 16 floats
+    """
+    selection = om.MSelectionList()
+    for light in lights:
+        selection.add(light)
+
+    matrices = {}
+    for index in range(len(lights)):
+        matrices[lights[index]] = list(selection.getDagPath(index).inclusiveMatrix())
+
+    return matrices
+
+
+def sample_light(light, light_shape, export_plan, matrix=None, light_type=None):
+    """
+    Sample one Light for every Renderer.
+    :param light: Light Transform node
+    :param light_shape: Light Shape node
+    :param export_plan: Export Plan from build_export_plan()
+    :param matrix: World Matrix of the Light from world_matrices(), read from Maya if None
+    :param light_type: Maya Light Type from lights_list(), read from Maya if None
+    :return: Dictionary of Renderer to Light Parameters
+    """
+    if light_type is None:
+        # Node Type of the Light
+        light_type = cmds.nodeType(light_shape)
+
+        # Area Lights are split by their Arnold Translator
+        if light_type == "aiAreaLight":
+            light_type = cmds.getAttr("{0}.aiTranslator".format(light_shape))
+    light_plan = export_plan[light_type]
+
+    # Read every Attribute needed by all Renderers once
+    values = read_attributes(light, light_plan["attributes"])
+
+    # Get Light World Matrix
+    if matrix is None:
+        matrix = cmds.xform(light, q=True, matrix=True, worldSpace=True)
+
+    # Rules on Transform Attributes use the World Transform, the Maya rotation read for the Import is kept
+    if light_plan["decompose"]:
+        for parm, value in decompose_matrix(matrix).items():
+            values.setdefault(parm, value)
+
+    # Loop through Renderers, dictionary of Renderer to Light Parameters py2 or py3
+    if sys.version[0] == "3":
+        renderer_parms = {}
+    else:
+        renderer_parms = OrderedDict()
+    for renderer, rule_attributes, zero_suffix, suffix in light_plan["renderers"]:
+        # Dictionary to store data py2 or py3
+        if sys.version[0] == "3":
+            parms_dict = {}
+        else:
+            parms_dict = OrderedDict()
+
+        # Save nodeType in dictionary
+        if [attribute for attribute in rule_attributes if values[attribute] != 0]:
+            parms_dict["nodeType"] = light_type + suffix
+        else:
+            parms_dict["nodeType"] = light_type + zero_suffix
+
+        # Save all Parameters in dictionary
+        for parm, step in light_plan["steps"][renderer][parms_dict["nodeType"]]:
+            if step:
+                parms_dict[parm] = step(values, matrix)
+            else:
+                parms_dict[parm] = values[parm]
+
+        renderer_parms[renderer] = parms_dict
+
+    # Get Color or Color Temperature or Texture plug data
+    file_node = cmds.connectionInfo("{0}.color".format(light), sourceFromDestination=True)
+    if bool(file_node):
+        # If Color Temeprature is On, then skip Texture plug in the Light
+        if values["aiUseColorTemperature"]:
+            kelvin_temp = read_attributes(light, ["aiColorTemperature"], values)["aiColorTemperature"]
+            color_temp = temperature_color(kelvin_temp, cmds.arnoldTemperatureToColor)
+            for parms_dict in renderer_parms.values():
+                for parm, value in zip(light_data["color_light_params"], color_temp):
+                    parms_dict[parm] = value
+                parms_dict["texture_map"] = ""
+
+        # Get Texture path and save it in dictionary
+        split = file_node.split(".")
+        node_type = cmds.nodeType(split[0])
+        texture_colorspace = None
+        if node_type == "file":
+            texture_path = cmds.getAttr("{0}.fileTextureName".format(split[0]))
+            texture_colorspace = cmds.getAttr("{0}.colorSpace".format(split[0]))
+        elif node_type == "aiImage":
+            texture_path = cmds.getAttr("{0}.filename".format(split[0]))
+            texture_colorspace = cmds.getAttr("{0}.colorSpace".format(split[0]))
+        else:
+            texture_path = ""
+        for renderer, parms_dict in renderer_parms.items():
+            for color in light_data["color_light_params"]:
+                parms_dict[color] = 1
+            if renderer in texture_material_renderers:
+                parms_dict["texture_node"] = split[0]
+            parms_dict["texture_map"] = texture_path
+
+            # Color Space of the texture Material shared by the Lights using the same texture
+            if texture_colorspace is not None and renderer in texture_material_renderers:
+                parms_dict["texture_colorspace"] = texture_colorspace
+    else:
+        # Convert Color Temperature to RGB and store it in dictionary
+        if values["aiUseColorTemperature"] and not light_plan["kelvin"]:
+            kelvin_temp = read_attributes(light, ["aiColorTemperature"], values)["aiColorTemperature"]
+            color_temp = temperature_color(kelvin_temp, cmds.arnoldTemperatureToColor)
+            for parms_dict in renderer_parms.values():
+                for parm, value in zip(light_data["color_light_params"], color_temp):
+                    parms_dict[parm] = value
+        else:
+            for parms_dict in renderer_parms.values():
+                for color in light_data["color_light_params"]:
+                    parms_dict[color] = values[color]
+
+        # Color Temperature in Kelvin replaces the Color on Import, its exact Color is saved with the file
+        if values["aiUseColorTemperature"] and light_plan["kelvin"]:
+            kelvin_temp = read_attributes(light, ["aiColorTemperature"], values)["aiColorTemperature"]
+            temperature_color(kelvin_temp, cmds.arnoldTemperatureToColor)
+            for parms_dict in renderer_parms.values():
+                parms_dict[kelvin_parm] = kelvin_temp
+
+    # Maya DAG path of the Light, the importer finds the Light Nodes of previous Imports with it
+    for parms_dict in renderer_parms.values():
+        parms_dict["dag_path"] = light
+
+    return renderer_parms
+
+
+def light_changed(light):
+    """
+    Drop a Light from the Export cache, it is sampled again on the next Export.
+    :param light: Light Transform node
     :return: None
     """
+    export_cache.pop(light, None)
+    for listener in light_change_listeners:
+        listener(light)
+
+
+def attribute_changed(message, plug, other_plug, light):
+    """
+    Maya Attribute changed callback, evaluation of the Attribute doesn't change its value.
+    Attributes driven by connections, expressions or animation are caught by the Node dirty Plug callback instead.
+    :param message: Attribute Message
+    :param plug: Changed Plug
+    :param other_plug: Other Plug of a connection
+    :param light: Light Transform node
+    :return: None
+    """
+    if not message & om.MNodeMessage.kAttributeEval:
+        light_changed(light)
+
+
+def clear_export_cache(*args):
+    """
+    Drop every cached Light and remove their Maya callbacks.
+    Used on time change, since animated Attributes change without any Attribute being set, and on scene change.
+    :return: None
+    """
+    export_cache.clear()
+    for callback_ids in export_callbacks.values():
+        om.MMessage.removeCallbacks(callback_ids)
+    export_callbacks.clear()
+    for listener in light_change_listeners:
+        listener(None)
+
+
+def remove_callbacks():
+    """
+    Remove every Maya callback added by the Export cache, before this module is loaded again.
+    :return: None
+    """
+    clear_export_cache()
+    if scene_callbacks:
+        om.MMessage.removeCallbacks(scene_callbacks)
+    del scene_callbacks[:]
+
+
+def watch_light(light, light_shape, light_export):
+    """
+    Add Maya callbacks which drop the Light from the Export cache when its Transform, Shape or Texture changes,
+    or when one of their Attributes gets dirty from an upstream connection.
+    :param light: Light Transform node
+    :param light_shape: Light Shape node
+    :param light_export: Sampled Light data
+    :return: None
+    """
+    if not scene_callbacks:
+        scene_callbacks.append(om.MDGMessage.addTimeChangeCallback(clear_export_cache))
+        scene_callbacks.append(om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeNew, clear_export_cache))
+        scene_callbacks.append(om.MSceneMessage.addCallback(om.MSceneMessage.kBeforeOpen, clear_export_cache))
+
+    if light in export_callbacks:
+        return
+
+    # Texture node connected to the Light Color
+    nodes = [light, light_shape]
+    texture_node = light_export["Mantra"].get("texture_node")
+    if texture_node:
+        nodes.append(texture_node)
+
+    selection = om.MSelectionList()
+    for node in nodes:
+        selection.add(node)
+
+    callback_ids = []
+    for index in range(len(nodes)):
+        callback_ids.append(om.MNodeMessage.addAttributeChangedCallback(selection.getDependNode(index),
+                                                                        attribute_changed, light))
+
+        # Attributes driven by connections, expressions or animation only get dirty, they are never set
+        callback_ids.append(om.MNodeMessage.addNodeDirtyPlugCallback(selection.getDependNode(index),
+                                                                     lambda *args: light_changed(light)))
+
+    # Parent Transforms move the Light too
+    callback_ids.append(om.MDagMessage.addWorldMatrixModifiedCallback(selection.getDagPath(0),
+                                                                      lambda *args: light_changed(light)))
+
+    # Renamed Lights are exported under their new name
+    callback_ids.append(om.MNodeMessage.addNameChangedCallback(selection.getDependNode(0),
+                                                               lambda *args: light_changed(light)))
+
+    export_callbacks[light] = callback_ids
+
+
+def cached_sample_light(light, light_shape, export_plan, matrix=None, light_type=None):
+    """
+    Sample one Light, or reuse its data from a previous Export if nothing changed since.
+    :param light: Light Transform node
+    :param light_shape: Light Shape node
+    :param export_plan: Export Plan from build_export_plan()
+    :param matrix: World Matrix of the Light from world_matrices(), read from Maya if None
+    :param light_type: Maya Light Type from lights_list(), read from Maya if None
+    :return: Dictionary of Renderer to Light Parameters
+    """
+    if light in export_cache:
+        return export_cache[light]
+
+    light_export = sample_light(light, light_shape, export_plan, matrix, light_type)
+    watch_light(light, light_shape, light_export)
+    export_cache[light] = light_export
+
+    return light_export
+
+
+def export_json_file(path, resume=False, use_cache=True, kelvin=False, recursive=False, progress_callback=None,
+                     timings=None):
+    """
+    Export selected Lights from Viewport to Json file.
+    Json Lines (.jsonl) files are written one Light at a time, and can resume an interrupted Export.
+    Binary Light Rig (.mhl) files are compact compressed records.
+    Lights which didn't change since the previous Export are taken from the Export cache.
+    Every Color Temperature is converted by Arnold once per session.
+    :param path: Json, Json Lines or Binary Light Rig file path
+    :param resume: Keep the Lights already in the Json Lines file and only export the remaining ones
+    :param use_cache: Reuse Lights sampled by previous Exports, otherwise sample every Light again
+    :param kelvin: Export Color Temperatures in Kelvin with their exact Colors, resolved by the importer
+    :param recursive: Also export the Lights anywhere under selected groups
+    :param progress_callback: Called after every Light with (Number of Lights exported, Fraction of the Lights
+        exported), returns True to cancel the Export. A cancelled Json Lines Export keeps the Lights written so far
+        and can be resumed, other files are not written.
+    :param timings: Dictionary of phase name to seconds, from progress.new_timings(), filled with the time per phase
+    :return: True if exported, False if cancelled
+    """
     # Lights list
-    lights = lights_list()
-    light_list = lights[0]
-    light_shape_list = lights[1]
-    light_list_name = lights[2]
+    started = time.time()
+    lights = lights_list(recursive)
+    light_list = lights["transforms"]
+    light_shape_list = lights["shapes"]
+    light_list_name = lights["names"]
+    light_type_list = lights["types"]
+
+    # Compile light_data once per Export
+    export_plan = build_export_plan(kelvin)
+    started = add_time(timings, "list", started)
+
+    # Sample every Light again, also when the Lights were cached with other settings
+    if not use_cache or export_cache_settings["kelvin"] != kelvin:
+        clear_export_cache()
+        export_cache_settings["kelvin"] = kelvin
+
+    # Stream every Light to the Json Lines file as soon as it is sampled
+    if is_json_lines(path):
+        json_lines_file, exported = open_json_lines(path, resume)
+        temperatures = set()
+        try:
+            # Light schema version first, a resumed file already has it
+            if schema_key not in exported:
+                write_json_lines_record(json_lines_file, schema_key, schema_record())
+
+            # World Matrices of the Lights to sample
+            matrices = world_matrices([light_list[light] for light in range(len(light_list))
+                                       if light_list_name[light] not in exported
+                                       and light_list[light] not in export_cache])
+            started = add_time(timings, "matrices", started)
+
+            for light in range(len(light_list)):
+                if light_list_name[light] in exported:
+                    continue
+
+                light_export = cached_sample_light(light_list[light], light_shape_list[light], export_plan,
+                                                   matrices.get(light_list[light]), light_type_list[light])
+                write_temperatures_record(json_lines_file, {light_list_name[light]: light_export}, temperatures)
+                write_json_lines_record(json_lines_file, light_list_name[light], light_export)
+                exported.add(light_list_name[light])
+
+                # Keep the file up to date in case the Export is interrupted
+                if len(exported) % flush_interval == 0:
+                    json_lines_file.flush()
+
+                # Report progress, the Lights written so far stay in the file if cancelled
+                if progress_callback and progress_callback(light + 1, (light + 1.0) / len(light_list)):
+                    sys.stdout.write("Export cancelled, {0} Lights in {1}\n".format(len(exported), path))
+                    return False
+        finally:
+            json_lines_file.close()
+            add_time(timings, "sample and write", started)
+
+        # Show Message on Status Bar
+        sys.stdout.write("Lights exported to {0}\n".format(path))
+        return True
 
     # Dictionary to save Lights Data py2 or py3
     if sys.version[0] == "3":
@@ -78,162 +637,185 @@ def export_json_file(path):
     else:
         light_export_data = OrderedDict()
 
+    # World Matrices of the Lights to sample
+    matrices = world_matrices([light for light in light_list if light not in export_cache])
+    started = add_time(timings, "matrices", started)
+
     # Loop through Lights
     for light in range(len(light_list)):
-        # Dictionaries to store data py2 or py3
+        light_export_data[light_list_name[light]] = cached_sample_light(light_list[light],
+                                                                        light_shape_list[light], export_plan,
+                                                                        matrices.get(light_list[light]),
+                                                                        light_type_list[light])
+
+        # Report progress, nothing is written if cancelled
+        if progress_callback and progress_callback(light + 1, (light + 1.0) / len(light_list)):
+            sys.stdout.write("Export cancelled, {0} not written\n".format(path))
+            return False
+    started = add_time(timings, "sample", started)
+
+    # Light schema version and exact Colors of the Color Temperatures exported in Kelvin are written before the Lights
+    light_export_data = with_schema(with_temperatures(light_export_data))
+
+    # Export Binary Light Rig or Json file
+    if is_binary(path):
+        write_binary_file(path, light_export_data)
+    else:
+        with open(path, "w") as json_maya_file:
+            json.dump(light_export_data, json_maya_file, indent=4, ensure_ascii=False)
+    add_time(timings, "write", started)
+
+    # Show Message on Status Bar
+    sys.stdout.write("Lights exported to {0}\n".format(path))
+    return True
+
+
+def animation_channels(samples):
+    """
+    Per-channel arrays of one Light sampled over several frames, constant channels are stored once.
+    The Light Type and text values of the first frame are kept for the whole range.
+    World Matrix elements are channels of their own.
+    :param samples: Sampled Light data of every frame
+    :return: Dictionary of Renderer to Light Parameters, animated Parameters hold one value per frame
+    """
+    def channel(values):
+        # Single value if constant
+        if values.count(values[0]) == len(values):
+            return values[0]
+        return values
+
+    # Dictionary to store channels py2 or py3
+    if sys.version[0] == "3":
+        channels = {}
+    else:
+        channels = OrderedDict()
+
+    for renderer, first_parms in samples[0].items():
         if sys.version[0] == "3":
-            mantra_parms_dict = {}
-            arnold_parms_dict = {}
-            mantra_dict = {}
-            arnold_dict = {}
+            renderer_channels = {}
         else:
-            mantra_parms_dict = OrderedDict()
-            arnold_parms_dict = OrderedDict()
-            mantra_dict = OrderedDict()
-            arnold_dict = OrderedDict()
+            renderer_channels = OrderedDict()
 
-        # Node Type of the Light
-        node_type = cmds.nodeType(light_shape_list[light])
-
-        # Get Light World Position
-        translate = cmds.xform(light_list[light], q=True, translation=True, worldSpace=True)
-
-        # Loop through Renderers
-        for renderer in light_data:
-            # Arnold specific changes
-            if renderer == "Arnold":
-                # Save nodeType in dictionary
-                arnold_parms_dict["nodeType"] = node_type
-
-                if node_type == "aiAreaLight":
-                    light_type = cmds.getAttr("{0}.aiTranslator".format(light_shape_list[light]))
-                    if light_type == "quad":
-                        arnold_parms_dict["nodeType"] = "{0}".format(light_type)
-                    elif light_type == "disk":
-                        arnold_parms_dict["nodeType"] = "{0}".format(light_type)
-                    elif light_type == "cylinder":
-                        arnold_parms_dict["nodeType"] = "{0}".format(light_type)
-
-                # Save all Parameters in dictionary
-                for parm in light_data[renderer][arnold_parms_dict["nodeType"]]["light_parms"]:
-                    # Get Parameter Value
-                    value = cmds.getAttr("{0}.{1}".format(light_list[light], parm))
-
-                    if parm == "aiAov" and value == "default":
-                        arnold_parms_dict[parm] = ""
-                    elif parm == "aiAov" and value != "default":
-                        arnold_parms_dict[parm] = value
-                    elif parm == "translateX":
-                        arnold_parms_dict[parm] = translate[0]
-                    elif parm == "translateY":
-                        arnold_parms_dict[parm] = translate[1]
-                    elif parm == "translateZ":
-                        arnold_parms_dict[parm] = translate[2]
-                    else:
-                        arnold_parms_dict[parm] = value
-
-            # Mantra specific changes
-            elif renderer == "Mantra":
-                # Save nodeType in dictionary
-                if node_type == "pointLight":
-                    if not cmds.getAttr("{0}.aiRadius".format(light_shape_list[light])):
-                        mantra_parms_dict["nodeType"] = "{0}P".format(node_type)
-                    else:
-                        mantra_parms_dict["nodeType"] = "{0}S".format(node_type)
-                elif node_type == "directionalLight":
-                    if not cmds.getAttr("{0}.aiAngle".format(light_shape_list[light])):
-                        mantra_parms_dict["nodeType"] = "{0}D".format(node_type)
-                    else:
-                        mantra_parms_dict["nodeType"] = "{0}S".format(node_type)
-                elif node_type == "spotLight":
-                    if not cmds.getAttr("{0}.aiRadius".format(light_shape_list[light])):
-                        mantra_parms_dict["nodeType"] = "{0}P".format(node_type)
-                    else:
-                        mantra_parms_dict["nodeType"] = "{0}S".format(node_type)
-                elif node_type == "areaLight":
-                    mantra_parms_dict["nodeType"] = "{0}".format(node_type)
-                elif node_type == "aiAreaLight":
-                    light_type = cmds.getAttr("{0}.aiTranslator".format(light_shape_list[light]))
-                    if light_type == "quad":
-                        mantra_parms_dict["nodeType"] = "{0}".format(light_type)
-                    elif light_type == "disk":
-                        mantra_parms_dict["nodeType"] = "{0}".format(light_type)
-                    elif light_type == "cylinder":
-                        if cmds.getAttr("{0}.scaleX".format(light_list[light])) == 0 and cmds.getAttr("{0}.scaleZ".format(light_list[light])) == 0:
-                            mantra_parms_dict["nodeType"] = "{0}L".format(light_type)
-                        else:
-                            mantra_parms_dict["nodeType"] = "{0}C".format(light_type)
-                elif node_type == "aiSkyDomeLight":
-                    mantra_parms_dict["nodeType"] = "{0}".format(node_type)
-
-                # Save all Parameters in dictionary
-                for parm in light_data[renderer][mantra_parms_dict["nodeType"]]["light_parms"]:
-                    value = cmds.getAttr("{0}.{1}".format(light_list[light], parm))
-                    if parm == "aiAov" and value == "default":
-                        mantra_parms_dict[parm] = ""
-                    elif parm == "aiAov" and value != "default":
-                        mantra_parms_dict[parm] = value
-                    elif parm == "translateX":
-                        mantra_parms_dict[parm] = translate[0]
-                    elif parm == "translateY":
-                        mantra_parms_dict[parm] = translate[1]
-                    elif parm == "translateZ":
-                        mantra_parms_dict[parm] = translate[2]
-                    else:
-                        mantra_parms_dict[parm] = value
-
-        # Get Color or Color Temperature or Texture plug data
-        if bool(cmds.connectionInfo("{0}.color".format(light_list[light]), sourceFromDestination=True)):
-            # If Color Temeprature is On, then skip Texture plug in the Light
-            if cmds.getAttr("{0}.aiUseColorTemperature".format(light_list[light])):
-                kelvin_temp = cmds.getAttr("{0}.aiColorTemperature".format(light_list[light]))
-                color_temp = cmds.arnoldTemperatureToColor(kelvin_temp)
-                for parm, value in zip(light_data["color_light_params"], color_temp):
-                    mantra_parms_dict[parm] = value
-                    arnold_parms_dict[parm] = value
-                mantra_parms_dict["texture_map"] = ""
-                arnold_parms_dict["texture_map"] = ""
-
-            # Get Texture path and save it in dictionary
-            file_node = cmds.connectionInfo("{0}.color".format(light_list[light]), sourceFromDestination=True)
-            split = file_node.split(".")
-            node_type = cmds.nodeType(split[0])
-            if node_type == "file":
-                texture_path = cmds.getAttr("{0}.fileTextureName".format(split[0]))
-            elif node_type == "aiImage":
-                texture_path = cmds.getAttr("{0}.filename".format(split[0]))
-            else:
-                texture_path = ""
-            for color in light_data["color_light_params"]:
-                mantra_parms_dict[color] = 1
-                arnold_parms_dict[color] = 1
-            mantra_parms_dict["texture_node"] = split[0]
-            mantra_parms_dict["texture_map"] = texture_path
-            arnold_parms_dict["texture_map"] = texture_path
-        else:
-            # Convert Color Temperature to RGB and store it in dictionary
-            if cmds.getAttr("{0}.aiUseColorTemperature".format(light_list[light])):
-                kelvin_temp = cmds.getAttr("{0}.aiColorTemperature".format(light_list[light]))
-                color_temp = cmds.arnoldTemperatureToColor(kelvin_temp)
-                for parm, value in zip(light_data["color_light_params"], color_temp):
-                    mantra_parms_dict[parm] = value
-                    arnold_parms_dict[parm] = value
-            else:
-                for color in light_data["color_light_params"]:
-                    value = cmds.getAttr("{0}.{1}".format(light_list[light], color))
-                    mantra_parms_dict[color] = value
-                    arnold_parms_dict[color] = value
+        for parm, value in first_parms.items():
+            if parm == world_matrix_key:
+                renderer_channels[parm] = [channel([sample[renderer][parm][index] for sample in samples])
+                                           for index in range(len(value))]
+                continue
+
+            # Only numeric channels are animated
+            if parm == "nodeType" or not isinstance(value, (int, float)):
+                renderer_channels[parm] = value
+                continue
 
-        # Compile dictionaries
-        mantra_dict["Mantra"] = mantra_parms_dict
-        arnold_dict["Arnold"] = arnold_parms_dict
+            renderer_channels[parm] = channel([sample[renderer].get(parm, value) for sample in samples])
 
-        light_export_data[light_list_name[light]] = mantra_dict
-        light_export_data[light_list_name[light]].update(arnold_dict)
+        channels[renderer] = renderer_channels
 
-    # Export Json file
-    with open(path, "w") as json_maya_file:
-        json.dump(light_export_data, json_maya_file, indent=4, ensure_ascii=False)
+    return channels
+
+
+def export_animation_file(path, start_frame=None, end_frame=None, step=1, deduplicate=True, tolerance=None,
+                          kelvin=False, recursive=False, progress_callback=None, timings=None):
+    """
+    Export selected Lights over a frame range to a Json or Json Lines file.
+    Every frame is visited once for all Lights, and constant channels are stored as a single value.
+    Curves shared by several channels are stored once, and curves can be reduced to fewer keys.
+    :param path: Json or Json Lines file path
+    :param start_frame: First frame, playback start if None
+    :param end_frame: Last frame, playback end if None
+    :param step: Frame step
+    :param deduplicate: Store identical curves once
+    :param tolerance: Keyframe reduction tolerance, every frame is kept if None
+    :param kelvin: Export Color Temperatures in Kelvin with their exact Colors, resolved by the importer
+    :param recursive: Also export the Lights anywhere under selected groups
+    :param progress_callback: Called after every frame with (Number of frames sampled, Fraction of the frames
+        sampled), returns True to cancel the Export, nothing is written if cancelled
+    :param timings: Dictionary of phase name to seconds, from progress.new_timings(), filled with the time per phase
+    :return: True if exported, False if cancelled
+    """
+    if is_binary(path):
+        raise ValueError("Animated Lights can't be saved as Binary Light Rig, use Json or Json Lines.")
+
+    # Lights list
+    started = time.time()
+    lights = lights_list(recursive)
+    light_list = lights["transforms"]
+    light_shape_list = lights["shapes"]
+    light_list_name = lights["names"]
+    light_type_list = lights["types"]
+
+    # Compile light_data once per Export
+    export_plan = build_export_plan(kelvin)
+
+    # Frame range, playback range by default
+    if start_frame is None:
+        start_frame = cmds.playbackOptions(query=True, minTime=True)
+    if end_frame is None:
+        end_frame = cmds.playbackOptions(query=True, maxTime=True)
+    frame_range = [start_frame, end_frame, step]
+    frames = animation_frames(frame_range)
+    started = add_time(timings, "list", started)
+
+    # Sample all Lights once per frame, without redrawing the Viewport
+    samples = [[] for light in light_list]
+    current_frame = cmds.currentTime(query=True)
+    cmds.refresh(suspend=True)
+    try:
+        for index, frame in enumerate(frames):
+            cmds.currentTime(frame, update=True)
+            matrices = world_matrices(light_list)
+            for light in range(len(light_list)):
+                samples[light].append(sample_light(light_list[light], light_shape_list[light], export_plan,
+                                                   matrices[light_list[light]], light_type_list[light]))
+
+            # Report progress, nothing is written if cancelled
+            if progress_callback and progress_callback(index + 1, (index + 1.0) / len(frames)):
+                sys.stdout.write("Export cancelled, {0} not written\n".format(path))
+                return False
+    finally:
+        cmds.currentTime(current_frame, update=True)
+        cmds.refresh(suspend=False)
+    started = add_time(timings, "sample", started)
+
+    # Dictionary to save Lights Data py2 or py3
+    if sys.version[0] == "3":
+        light_export_data = {}
+    else:
+        light_export_data = OrderedDict()
+
+    for light in range(len(light_list)):
+        light_export = animation_channels(samples[light])
+        if sys.version[0] == "3":
+            light_export_data[light_list_name[light]] = {frames_key: frame_range}
+        else:
+            light_export_data[light_list_name[light]] = OrderedDict([(frames_key, frame_range)])
+        light_export_data[light_list_name[light]].update(light_export)
+
+    # Exact Colors of every sampled Color Temperature, before the channels are compressed
+    temperatures = temperature_record(light_temperatures(light_export_data))
+
+    # Light schema version, shared curves and Color Temperatures are written before the Lights
+    curves = compress_channels(light_export_data, deduplicate, tolerance)
+    records = [(key, record) for key, record in [(schema_key, schema_record()), (curves_key, curves),
+                                                 (temperatures_key, temperatures)] if record]
+    if sys.version[0] == "3":
+        light_export_data = dict(records + list(light_export_data.items()))
+    else:
+        light_export_data = OrderedDict(records + list(light_export_data.items()))
+
+    # Export Json Lines or Json file
+    if is_json_lines(path):
+        json_lines_file, exported = open_json_lines(path, False)
+        try:
+            for light, light_export in light_export_data.items():
+                write_json_lines_record(json_lines_file, light, light_export)
+        finally:
+            json_lines_file.close()
+    else:
+        with open(path, "w") as json_maya_file:
+            json.dump(light_export_data, json_maya_file, indent=4, ensure_ascii=False)
+    add_time(timings, "compress and write", started)
 
     # Show Message on Status Bar
-    sys.stdout.write("Lights exported to {0}\n".format(path))
+    sys.stdout.write("Animated Lights exported to {0}\n".format(path))
+    return True
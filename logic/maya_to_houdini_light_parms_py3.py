@@ -4,11 +4,15 @@ maya_to_houdini_light_parms_py3.py
 
 Only works in Python 3, due to Ordered Dictionary.
 
-Generates Json file "maya_to_houdini_light_data.json"
+Generates the compiled Light schema module "light_schema.py", loaded by Maya and Houdini logic without any parsing:
+    python logic/maya_to_houdini_light_parms_py3.py [--output logic/light_schema.py]
 
 """
 
+import os
 import json
+import hashlib
+import argparse
 
 # Translate Parameters Dictionary
 translate_parms = {"translateX": "tx",
@@ -402,8 +406,182 @@ light_data_dict["Arnold"] = arnold_light_data_dict
 light_data_dict["light_contribution_parms"] = mantra_light_contrib_parms
 light_data_dict["color_light_params"] = color_light_params
 
-# Json Export
-path = r"C:\Users\bhave\PycharmProjects\maya_to_houdini_light_transfer\logic\maya_to_houdini_light_data.json"
-
-with open(path, "w") as json_file:
-    json.dump(light_data_dict, json_file, indent=4, ensure_ascii=False)
+# Generated schema module, next to this script
+schema_module_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "light_schema.py")
+
+# Line width of the generated module
+line_width = 120
+
+
+def light_schema_version(light_data):
+    """
+    Version of the Light schema, changes with any Light Type, Parameter or order change.
+    :param light_data: Light data Dictionary
+    :return: First 12 characters of the SHA-1 of the Light data
+    """
+    text = json.dumps(light_data, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def name_index(names, name):
+    """
+    Index of a name in a list of unique names, added if new.
+    :param names: List of names
+    :param name: Name
+    :return: Index
+    """
+    if name not in names:
+        names.append(name)
+    return names.index(name)
+
+
+def schema_tables(light_data):
+    """
+    Light data as frozen tuples, with Parameters and Node Types given by index.
+    :param light_data: Light data Dictionary
+    :return: Dictionary of table name to tuple
+    """
+    maya_parms = []
+    houdini_parms = []
+    node_types = []
+    light_types = []
+
+    for renderer in ["Mantra", "Arnold"]:
+        for light_type, data in light_data[renderer].items():
+            parms = []
+            for parm, names in data["light_parms"].items():
+                if isinstance(names, list):
+                    houdini_index = tuple(name_index(houdini_parms, name) for name in names)
+                else:
+                    houdini_index = name_index(houdini_parms, names)
+                parms.append((name_index(maya_parms, parm), houdini_index))
+
+            node_type = None
+            if "light_node_type" in data:
+                node_type = name_index(node_types, data["light_node_type"])
+            light_types.append((renderer, light_type, node_type, data["light_node_sub_type"],
+                                data.get("num_of_light_contrib"), tuple(parms)))
+
+    return {"maya_parms": tuple(maya_parms),
+            "houdini_parms": tuple(houdini_parms),
+            "node_types": tuple(node_types),
+            "light_types": tuple(light_types),
+            "light_contribution_parms": tuple(light_data["light_contribution_parms"].items()),
+            "color_light_params": tuple(light_data["color_light_params"].items())}
+
+
+def literal(value):
+    """
+    Python source of a schema value, strings in double quotes.
+    :param value: String, number, None or tuple of them
+    :return: Source text
+    """
+    if isinstance(value, tuple):
+        return "({0}{1})".format(", ".join(literal(item) for item in value), "," if len(value) == 1 else "")
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def packed_lines(first, texts, indent):
+    """
+    Source texts joined by commas and wrapped to line_width.
+    :param first: Start of the first line
+    :param texts: Source texts
+    :param indent: Start of the following lines
+    :return: Source lines
+    """
+    lines = []
+    line = first
+    for index, text in enumerate(texts):
+        text += "," if index < len(texts) - 1 else ""
+        if line.strip() and line != first and len(line) + len(text) + 1 > line_width:
+            lines.append(line.rstrip())
+            line = indent
+        line += text + " "
+    lines.append(line.rstrip())
+    return lines
+
+
+def tuple_source(name, items):
+    """
+    Python source of a tuple assignment.
+    :param name: Variable name
+    :param items: Tuple
+    :return: Source lines
+    """
+    first = "{0} = (".format(name)
+    texts = [literal(item) for item in items]
+    texts[-1] += ",)" if len(items) == 1 else ")"
+    return packed_lines(first, texts, " " * len(first))
+
+
+def light_types_source(light_types):
+    """
+    Python source of the Light Types, one Light Type per block.
+    :param light_types: Light Types tuple
+    :return: Source lines
+    """
+    lines = ["light_types = ("]
+    for index, light_type in enumerate(light_types):
+        lines.append("    ({0},".format(", ".join(literal(item) for item in light_type[:5])))
+        texts = [literal(parm) for parm in light_type[5]]
+        texts[-1] += "))" + ("," if index < len(light_types) - 1 else ")")
+        lines += packed_lines("     (", texts, "      ")
+    return lines
+
+
+def schema_source(light_data):
+    """
+    Python source of the compiled Light schema module.
+    :param light_data: Light data Dictionary
+    :return: Source text
+    """
+    tables = schema_tables(light_data)
+    comments = [("maya_parms", "Maya Parameter names, by index"),
+                ("houdini_parms", "Houdini Parameter names, by index"),
+                ("node_types", "Houdini Light Node Types, by index"),
+                ("light_types", "Light Types: (Renderer, Maya Light Type, Houdini Node Type index or None, "
+                                "Light Type menu value,\n#     Number of Light Contributions or None, "
+                                "((Maya Parameter index, Houdini Parameter index or indices), ...))"),
+                ("light_contribution_parms", "Mantra Light Contributions: (Contribution name, Houdini Parameter)"),
+                ("color_light_params", "Color Parameters: (Maya Parameter, Houdini Parameter)")]
+
+    lines = ['"""',
+             "",
+             "light_schema.py",
+             "",
+             "Generated by maya_to_houdini_light_parms_py3.py, do not edit.",
+             "",
+             "Compiled Maya to Houdini Light schema, see light_conversion.schema_light_data().",
+             "",
+             '"""',
+             "",
+             "# Version of the schema, saved in every exported Light file",
+             "schema_version = {0}".format(literal(light_schema_version(light_data)))]
+    for name, comment in comments:
+        lines += ["", "# {0}".format(comment)]
+        if name == "light_types":
+            lines += light_types_source(tables[name])
+        else:
+            lines += tuple_source(name, tables[name])
+
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    """
+    Command line schema module generator.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Generate the compiled Maya to Houdini Light schema module.")
+    parser.add_argument("--output", default=schema_module_path, help="Schema module path")
+    args = parser.parse_args()
+
+    with open(args.output, "w") as schema_file:
+        schema_file.write(schema_source(light_data_dict))
+    print("Light schema {0} written to {1}".format(light_schema_version(light_data_dict), args.output))
+
+
+if __name__ == "__main__":
+    main()
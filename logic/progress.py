@@ -0,0 +1,88 @@
+"""
+
+progress.py
+
+This file contains the progress reports of long Imports and Exports, shared by Maya and Houdini logic and UI:
+time spent per phase, and the remaining time estimated from the work done so far.
+
+"""
+
+import sys
+import time
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+# Work done before the remaining time is estimated, earlier estimates are not reliable
+estimate_min_fraction = 0.02
+
+
+def new_timings():
+    """
+    Empty time per phase, phases keep the order they are first timed in.
+    :return: Dictionary of phase name to seconds
+    """
+    if sys.version[0] == "3":
+        return {}
+    return OrderedDict()
+
+
+def add_time(timings, phase, started):
+    """
+    Add the time since started to a phase.
+    :param timings: Dictionary of phase name to seconds from new_timings(), nothing is timed if None
+    :param phase: Phase name
+    :param started: time.time() at the start of the work
+    :return: time.time() now, the start of the next work
+    """
+    now = time.time()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + now - started
+    return now
+
+
+def remaining_time(fraction, started):
+    """
+    Remaining time of a work, assuming the rest goes as fast as the work done so far.
+    :param fraction: Fraction of the work done
+    :param started: time.time() at the start of the work
+    :return: Seconds, None if too little is done to tell
+    """
+    if fraction < estimate_min_fraction:
+        return None
+    return (time.time() - started) * (1.0 - fraction) / fraction
+
+
+def format_duration(seconds):
+    """
+    Duration as minutes and seconds.
+    :param seconds: Seconds
+    :return: Text, e.g. "1:05"
+    """
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return "{0}:{1:02d}".format(minutes, seconds)
+
+
+def progress_message(label, count, fraction, started):
+    """
+    Progress of a work with its remaining time.
+    :param label: Work name, e.g. "Importing Lights"
+    :param count: Number of Lights done
+    :param fraction: Fraction of the work done
+    :param started: time.time() at the start of the work
+    :return: Text, e.g. "Importing Lights: 1200 (35%), 0:12 left"
+    """
+    message = "{0}: {1} ({2:.0%})".format(label, count, fraction)
+    remaining = remaining_time(fraction, started)
+    if remaining is not None:
+        message += ", {0} left".format(format_duration(remaining))
+    return message
+
+
+def timings_message(timings):
+    """
+    Time spent per phase.
+    :param timings: Dictionary of phase name to seconds
+    :return: Text, e.g. "read and convert 0.52s, create 1.30s"
+    """
+    return ", ".join("{0} {1:.2f}s".format(phase, seconds) for phase, seconds in timings.items())
@@ -0,0 +1,100 @@
+"""
+
+renderer_backends.py
+
+This file contains the registry of Renderer backends, without any Houdini dependency.
+
+Every Houdini Renderer the Lights are imported for is a backend, a dictionary of:
+    name: Renderer name, also the key of its resolved Light Nodes
+    source: Key of the exported Light data it converts, several Renderers can be created from one exported record
+    light_types: Type mapping, Maya Light Type: {"light_node_type", "light_node_sub_type", "light_parms", ...}
+    converters: Converter per Maya Parameter, see light_conversion.py, other Parameters use convert_value
+    column_converters: Column Converter per Converter of this backend, see conversion_kernel.py
+    node_type: Houdini Node Type of one exported Light, node_type(light)
+    node_name_prefix: Houdini Light Node name prefix
+    network: Houdini network path the Light Nodes are created in
+    create_node: Houdini Light Node creation, create_node(network, node_type, name), network.createNode if None
+    ordered_parms: Houdini Parameters set before the others, the other Parameters depend on them
+
+Mantra and Arnold are registered by light_conversion.py, and get their Column Converters from conversion_kernel.py.
+Other Renderers are plugins: modules calling register_backend() when imported, listed in the MAYA_TO_HOUDINI_RENDERERS
+environment variable. conversion_kernel.py loads them once the Column Converters they can use exist.
+
+"""
+
+import os
+import sys
+
+if sys.version[0] != "3":
+    from collections import OrderedDict
+
+# Environment variable listing the Renderer plugin modules, separated like PATH
+plugins_variable = "MAYA_TO_HOUDINI_RENDERERS"
+
+# Registered Renderer backends in registration order py2 or py3
+if sys.version[0] == "3":
+    renderer_backends = {}
+else:
+    renderer_backends = OrderedDict()
+
+
+def register_backend(name, source, light_types, converters, node_type, node_name_prefix, network="/obj",
+                     column_converters=None, create_node=None, ordered_parms=()):
+    """
+    Register the backend of a Renderer, or replace the one registered with the same name.
+    :param name: Renderer name
+    :param source: Key of the exported Light data the backend converts
+    :param light_types: Dictionary of Maya Light Type to its Houdini Light Type and Parameter names
+    :param converters: Dictionary of Maya Parameter to Converter
+    :param node_type: Function of the exported Light Parameters, returning the Houdini Node Type name
+    :param node_name_prefix: Houdini Light Node name prefix, unique per Renderer
+    :param network: Houdini network path of the Light Nodes
+    :param column_converters: Dictionary of Converter to Column Converter, for the Converters of this backend
+    :param create_node: Function creating a Light Node, network.createNode(node_type, name) if None
+    :param ordered_parms: Houdini Parameters set before the others
+    :return: Backend dictionary
+    """
+    backend = {"name": name, "source": source, "light_types": light_types, "converters": converters,
+               "column_converters": dict(column_converters or {}), "node_type": node_type,
+               "node_name_prefix": node_name_prefix, "network": network, "create_node": create_node,
+               "ordered_parms": list(ordered_parms)}
+    renderer_backends[name] = backend
+    return backend
+
+
+def add_column_converters(name, column_converters):
+    """
+    Add Column Converters to a registered backend, for backends registered before their Column Converters exist.
+    :param name: Renderer name
+    :param column_converters: Dictionary of Converter to Column Converter
+    :return: None
+    """
+    renderer_backends[name]["column_converters"].update(column_converters)
+
+
+def selected_backends(renderers):
+    """
+    Backends of the selected Renderers, in registration order.
+    :param renderers: Renderer names
+    :return: List of backend dictionaries
+    """
+    unknown = [renderer for renderer in renderers if renderer not in renderer_backends]
+    if unknown:
+        raise ValueError("Unknown Renderer {0}, registered: {1}.".format(", ".join(unknown),
+                                                                         ", ".join(renderer_backends)))
+    return [backend for name, backend in renderer_backends.items() if name in renderers]
+
+
+def load_plugins(modules=None):
+    """
+    Import the Renderer plugin modules, which register their backends.
+    :param modules: Module names, from the MAYA_TO_HOUDINI_RENDERERS environment variable if None
+    :return: List of the imported module names
+    """
+    if modules is None:
+        modules = [module for module in os.environ.get(plugins_variable, "").split(os.pathsep) if module.strip()]
+
+    for module in modules:
+        __import__(module.strip())
+
+    return [module.strip() for module in modules]
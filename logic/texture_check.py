@@ -0,0 +1,460 @@
+"""
+
+texture_check.py
+
+Pre-flight check of the texture maps used by exported Light files, without Maya or Houdini.
+
+Every texture path is checked once: the file is stat'ed and only its image header is read, on a pool of threads.
+Results are cached by path, modification time and size, optionally in a Json cache file between runs.
+Missing files, formats other than EXR and resolutions are reported.
+
+Usage (from the script folder):
+    python -m logic.texture_check shots/*.json --jobs 32 --cache texture_cache.json
+
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import struct
+import argparse
+import threading
+from multiprocessing.pool import ThreadPool
+
+from logic.light_file import read_light_file
+
+# Bytes read at once from the start of a texture, enough for most image headers
+header_chunk_size = 1 << 16
+
+# Largest header read, EXR headers with a lot of metadata are read in several chunks
+header_max_size = 1 << 22
+
+# Image formats by magic number at the start of the file
+image_magics = [(b"\x76\x2f\x31\x01", "exr"),
+                (b"\x89PNG\r\n\x1a\n", "png"),
+                (b"\xff\xd8\xff", "jpeg"),
+                (b"II*\x00", "tiff"),
+                (b"MM\x00*", "tiff"),
+                (b"#?RADIANCE", "hdr"),
+                (b"#?RGBE", "hdr"),
+                (b"RAT", "rat")]
+
+# Texture formats which are linear by convention
+linear_formats = ["exr"]
+
+# UDIM tokens of Maya texture paths, and the tiles they stand for
+udim_tokens = ["<UDIM>", "<udim>"]
+udim_tiles = [str(tile) for tile in range(1001, 2000)]
+
+# Checked textures, shared by every check of the session
+# File path: {"mtime": Modification time, "size": File size, "result": Texture result}
+header_cache = {}
+header_cache_lock = threading.Lock()
+
+
+def texture_paths(light_json):
+    """
+    Texture paths used by one exported or resolved Light.
+    :param light_json: Exported Light data
+    :return: List of texture paths
+    """
+    paths = []
+    for renderer_parms in light_json.values():
+        if not isinstance(renderer_parms, dict):
+            continue
+
+        # Resolved Light Nodes hold the texture in their Houdini Parameters
+        parms = renderer_parms.get("parms", renderer_parms)
+        for value in [renderer_parms.get("texture_map"), parms.get("env_map"), parms.get("ar_light_color_texture")]:
+            if value and isinstance(value, (str, type(u""))) and value not in paths:
+                paths.append(value)
+
+    return paths
+
+
+def collect_textures(sources):
+    """
+    Every texture path of exported Light files with the Lights using it.
+    :param sources: Json, Json Lines or Binary Light Rig file paths
+    :return: Dictionary of texture path to list of Light names
+    """
+    # Dictionary of texture path to Lights py2 or py3
+    if sys.version[0] == "3":
+        textures = {}
+    else:
+        from collections import OrderedDict
+        textures = OrderedDict()
+
+    for source in sources:
+        for light, light_json, file_progress in read_light_file(source):
+            for path in texture_paths(light_json):
+                textures.setdefault(path, []).append(light)
+
+    return textures
+
+
+def exr_header(read, path):
+    """
+    Resolution and channels of an OpenEXR file, from the attributes of its first header.
+    :param read: Function returning the first bytes of the file, at least the given size
+    :param path: Texture path, for error messages
+    :return: Dictionary of width, height and channels
+    """
+    size = header_chunk_size
+    data = read(size)
+    offset = 8
+    result = {}
+    while True:
+        # Attribute name, type, size and value, the header ends with an empty name
+        name_end = data.find(b"\x00", offset)
+        type_end = data.find(b"\x00", name_end + 1) if name_end > offset else name_end
+        if name_end < 0 or type_end < 0 or type_end + 5 > len(data):
+            if len(data) < size or size >= header_max_size:
+                raise ValueError("Truncated EXR header in {0}".format(path))
+            size *= 4
+            data = read(size)
+            continue
+        if name_end == offset:
+            break
+
+        name = data[offset:name_end].decode("latin-1")
+        value_size = struct.unpack_from("<i", data, type_end + 1)[0]
+        value_start = type_end + 5
+        if value_start + value_size > len(data):
+            if len(data) < size or size >= header_max_size:
+                raise ValueError("Truncated EXR header in {0}".format(path))
+            size *= 4
+            data = read(size)
+            continue
+
+        if name == "dataWindow":
+            x_min, y_min, x_max, y_max = struct.unpack_from("<iiii", data, value_start)
+            result["width"] = x_max - x_min + 1
+            result["height"] = y_max - y_min + 1
+        elif name == "channels":
+            # Channel name, then pixel type, linear flag and sampling in 16 bytes, the list ends with an empty name
+            result["channels"] = []
+            position = value_start
+            value_end = value_start + value_size
+            while position < value_end and data[position:position + 1] != b"\x00":
+                channel_end = data.find(b"\x00", position, value_end)
+                if channel_end < 0:
+                    raise ValueError("Malformed EXR channels in {0}".format(path))
+                result["channels"].append(data[position:channel_end].decode("latin-1"))
+                position = channel_end + 17
+        offset = value_start + value_size
+
+    return result
+
+
+def png_header(data):
+    """
+    Resolution of a PNG file, from its IHDR chunk.
+    :param data: First bytes of the file
+    :return: Dictionary of width and height
+    """
+    width, height = struct.unpack_from(">II", data, 16)
+    return {"width": width, "height": height}
+
+
+def jpeg_header(data):
+    """
+    Resolution of a JPEG file, from its first Start Of Frame segment.
+    :param data: First bytes of the file
+    :return: Dictionary of width and height, empty if the segment isn't in the first bytes
+    """
+    offset = 2
+    while offset + 9 < len(data):
+        if data[offset:offset + 1] != b"\xff":
+            break
+        marker = ord(data[offset + 1:offset + 2])
+        segment_size = struct.unpack_from(">H", data, offset + 2)[0]
+        if 0xc0 <= marker <= 0xcf and marker not in [0xc4, 0xc8, 0xcc]:
+            height, width = struct.unpack_from(">HH", data, offset + 5)
+            return {"width": width, "height": height}
+        offset += 2 + segment_size
+
+    return {}
+
+
+def hdr_header(data):
+    """
+    Resolution of a Radiance HDR file, from its resolution line.
+    :param data: First bytes of the file
+    :return: Dictionary of width and height, empty if the line isn't in the first bytes
+    """
+    for line in data.split(b"\n")[1:64]:
+        parts = line.split()
+        if len(parts) == 4 and parts[0] in [b"-Y", b"+Y"] and parts[2] in [b"+X", b"-X"]:
+            return {"width": int(parts[3]), "height": int(parts[1])}
+
+    return {}
+
+
+def read_texture_header(path):
+    """
+    Format and resolution of a texture file, only its header is read.
+    :param path: Texture file path
+    :return: Dictionary of format, width, height and channels when known
+    """
+    with open(path, "rb") as texture_file:
+        data = texture_file.read(header_chunk_size)
+
+        def read(size):
+            # Start of the file again, for long headers
+            if size <= header_chunk_size:
+                return data
+            texture_file.seek(0)
+            return texture_file.read(size)
+
+        for magic, image_format in image_magics:
+            if data.startswith(magic):
+                break
+        else:
+            return {"format": os.path.splitext(path)[1].lstrip(".").lower() or "unknown"}
+
+        result = {"format": image_format}
+        if image_format == "exr":
+            result.update(exr_header(read, path))
+        elif image_format == "png":
+            result.update(png_header(data))
+        elif image_format == "jpeg":
+            result.update(jpeg_header(data))
+        elif image_format == "hdr":
+            result.update(hdr_header(data))
+
+    return result
+
+
+def texture_files(path, listings):
+    """
+    Files of a texture path, every tile of a UDIM texture.
+    :param path: Texture path, with environment variables
+    :param listings: Dictionary of folder to its file names, every folder is listed once per check
+    :return: List of file paths
+    """
+    path = os.path.expanduser(os.path.expandvars(path))
+    for token in udim_tokens:
+        if token in path:
+            directory, name = os.path.split(path)
+            if directory not in listings:
+                try:
+                    listings[directory] = set(os.listdir(directory or "."))
+                except OSError:
+                    listings[directory] = set()
+            names = listings[directory]
+            return [os.path.join(directory, name.replace(token, tile)) for tile in udim_tiles
+                    if name.replace(token, tile) in names]
+
+    return [path]
+
+
+def check_file(path):
+    """
+    Check one texture file, results are cached by path, modification time and size.
+    :param path: Texture file path
+    :return: Dictionary of the texture result
+        path: File path
+        exists: File found
+        format, width, height, channels: Image header, when known
+        error: Error message, if the header can't be read
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {"path": path, "exists": False}
+
+    with header_cache_lock:
+        cached = header_cache.get(path)
+    if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+        return cached["result"]
+
+    result = {"path": path, "exists": True}
+    try:
+        result.update(read_texture_header(path))
+    except (IOError, OSError, ValueError, struct.error) as error:
+        result["error"] = "{0}: {1}".format(type(error).__name__, error)
+
+    with header_cache_lock:
+        header_cache[path] = {"mtime": stat.st_mtime, "size": stat.st_size, "result": result}
+
+    return result
+
+
+def check_texture(path, listings):
+    """
+    Check every file of a texture path.
+    :param path: Texture path from the exported Light file
+    :param listings: Dictionary of folder to its file names, shared by the whole check
+    :return: (Texture path, List of file results), a UDIM texture without tiles has one missing result
+    """
+    files = texture_files(path, listings)
+    if not files:
+        return path, [{"path": path, "exists": False}]
+
+    return path, [check_file(file_path) for file_path in files]
+
+
+def check_textures(paths, jobs=None):
+    """
+    Check texture paths in parallel.
+    :param paths: Texture paths
+    :param jobs: Number of threads, 32 if None
+    :return: Dictionary of texture path to list of file results
+    """
+    paths = list(paths)
+    if not paths:
+        return {}
+
+    # Folders of UDIM textures, listed once
+    listings = {}
+
+    # Threads mostly wait on the file system
+    pool = ThreadPool(max(1, min(jobs or 32, len(paths))))
+    try:
+        return dict(pool.map(lambda path: check_texture(path, listings), paths, chunksize=1))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def texture_problems(textures, results):
+    """
+    Problems found by a texture check.
+    :param textures: Dictionary of texture path to list of Light names
+    :param results: Dictionary of texture path to list of file results
+    :return: Dictionary of problem
+        missing: Texture paths without any file
+        unreadable: Texture paths with a header which can't be read
+        not_linear: Texture paths which aren't EXR
+    """
+    problems = {"missing": [], "unreadable": [], "not_linear": []}
+    for path in textures:
+        files = results[path]
+        if not all(result["exists"] for result in files):
+            problems["missing"].append(path)
+        elif [result for result in files if "error" in result]:
+            problems["unreadable"].append(path)
+        elif [result for result in files if result.get("format") not in linear_formats]:
+            problems["not_linear"].append(path)
+
+    return problems
+
+
+def texture_summary(textures, results):
+    """
+    Text report of a texture check, one line per texture.
+    :param textures: Dictionary of texture path to list of Light names
+    :param results: Dictionary of texture path to list of file results
+    :return: Report lines
+    """
+    problems = texture_problems(textures, results)
+    lines = []
+    for path, lights in textures.items():
+        files = results[path]
+        if path in problems["missing"]:
+            status = "MISSING"
+        elif path in problems["unreadable"]:
+            status = "UNREADABLE {0}".format([result["error"] for result in files if "error" in result][0])
+        else:
+            formats = sorted(set(result["format"] for result in files))
+            sizes = sorted(set("{0}x{1}".format(result["width"], result["height"]) for result in files
+                               if "width" in result))
+            status = "{0} {1}".format("/".join(formats), ", ".join(sizes) or "unknown resolution")
+            if path in problems["not_linear"]:
+                status = "NOT EXR " + status
+        tiles = " ({0} tiles)".format(len(files)) if len(files) > 1 else ""
+        lines.append("{0}{1}: {2}, {3} Lights".format(path, tiles, status, len(lights)))
+
+    lines.append("{0} textures, {1} missing, {2} unreadable, {3} not EXR".format(
+        len(textures), len(problems["missing"]), len(problems["unreadable"]), len(problems["not_linear"])))
+
+    return lines
+
+
+def load_header_cache(path):
+    """
+    Add the texture results of a Json cache file to the session cache.
+    :param path: Json cache file path
+    :return: None
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r") as cache_file:
+        cache = json.load(cache_file)
+    with header_cache_lock:
+        for file_path, cached in cache.items():
+            header_cache.setdefault(file_path, cached)
+
+
+def save_header_cache(path):
+    """
+    Save the session cache to a Json cache file.
+    :param path: Json cache file path
+    :return: None
+    """
+    with header_cache_lock:
+        cache = dict(header_cache)
+    with open(path, "w") as cache_file:
+        json.dump(cache, cache_file, ensure_ascii=False, sort_keys=True)
+
+
+def check_light_files(sources, jobs=None, cache_path=None):
+    """
+    Pre-flight check of every texture of exported Light files.
+    :param sources: Json, Json Lines or Binary Light Rig file paths
+    :param jobs: Number of threads, 32 if None
+    :param cache_path: Json cache file kept between runs, None to only use the session cache
+    :return: Dictionary of texture path to list of Light names, Dictionary of texture path to list of file results
+    """
+    if cache_path:
+        load_header_cache(cache_path)
+
+    textures = collect_textures(sources)
+    results = check_textures(textures, jobs)
+
+    if cache_path:
+        save_header_cache(cache_path)
+
+    return textures, results
+
+
+def main():
+    """
+    Command line texture check.
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Check the texture maps of exported Light files: missing files, "
+                                                 "formats other than EXR and resolutions.")
+    parser.add_argument("sources", nargs="+", help="Exported Light files or glob patterns")
+    parser.add_argument("--jobs", type=int, default=None, help="Number of threads (default 32)")
+    parser.add_argument("--cache", default=None, help="Json file caching the texture headers between runs")
+    parser.add_argument("--json", action="store_true", help="Print the results as Json")
+    args = parser.parse_args()
+
+    # Expand glob patterns, the Windows shell doesn't
+    sources = []
+    for pattern in args.sources:
+        sources.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    start = time.time()
+    textures, results = check_light_files(sources, args.jobs, args.cache)
+
+    if args.json:
+        json.dump({"textures": textures, "results": results, "problems": texture_problems(textures, results)},
+                  sys.stdout, indent=4, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        for line in texture_summary(textures, results):
+            sys.stdout.write(line + "\n")
+        sys.stdout.write("Checked in {0:.3f}s\n".format(time.time() - start))
+
+    if texture_problems(textures, results)["missing"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
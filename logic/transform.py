@@ -0,0 +1,144 @@
+"""
+
+transform.py
+
+This file contains the decomposition of Maya World Matrices, without any Maya or Houdini dependency.
+
+Maya World Matrices are 16 floats, row major, for row vectors, with the translation on the last row:
+    World Matrix = Scale * Rotate X * Rotate Y * Rotate Z * Translate
+
+"""
+
+import math
+
+# Maya Transform Parameters given by a World Matrix
+transform_parms = ["translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY",
+                   "scaleZ"]
+
+# Maya Rotate Parameters, exported with the World Matrix as the rotation its decomposition is closest to
+rotate_parms = ["rotateX", "rotateY", "rotateZ"]
+
+# Scale treated as 0, its axis is rebuilt from the other ones
+zero_scale = 1e-12
+
+
+def cross(a, b):
+    """
+    Cross product of two vectors.
+    :param a: Vector
+    :param b: Vector
+    :return: Vector
+    """
+    return [a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]]
+
+
+def length(vector):
+    """
+    Length of a vector.
+    :param vector: Vector
+    :return: Length
+    """
+    return math.sqrt(vector[0] * vector[0] + vector[1] * vector[1] + vector[2] * vector[2])
+
+
+def rotation_rows(rotate):
+    """
+    Axis rows of a Maya rotation in XYZ order.
+    :param rotate: [Rotate X, Rotate Y, Rotate Z] in degrees
+    :return: X, Y and Z unit axes
+    """
+    sin_x, sin_y, sin_z = [math.sin(math.radians(angle)) for angle in rotate]
+    cos_x, cos_y, cos_z = [math.cos(math.radians(angle)) for angle in rotate]
+    return [[cos_y * cos_z, cos_y * sin_z, -sin_y],
+            [sin_x * sin_y * cos_z - cos_x * sin_z, sin_x * sin_y * sin_z + cos_x * cos_z, sin_x * cos_y],
+            [cos_x * sin_y * cos_z + sin_x * sin_z, cos_x * sin_y * sin_z - sin_x * cos_z, cos_x * cos_y]]
+
+
+def rotation_axes(rows, scales, rotate=None):
+    """
+    Unit rotation axes of the scaled axis rows, axes with a zero Scale are rebuilt perpendicular to the others.
+    :param rows: X, Y and Z axis rows of the World Matrix
+    :param scales: Length of every row
+    :param rotate: Maya rotation the rebuilt axes are taken from, any perpendicular axes if None
+    :return: X, Y and Z unit axes
+    """
+    axes = [[value / scale for value in row] if scale > zero_scale else None for row, scale in zip(rows, scales)]
+    hint_axes = rotation_rows(rotate) if rotate is not None else None
+
+    # A zero Scale axis is perpendicular to the two others
+    missing = [index for index in range(3) if axes[index] is None]
+    if len(missing) == 3:
+        return hint_axes or [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    if len(missing) == 2:
+        # Axis of the Maya rotation made perpendicular to the remaining one, or any perpendicular axis
+        known = axes[3 - missing[0] - missing[1]]
+        other = None
+        if hint_axes is not None:
+            hint = hint_axes[missing[0]]
+            dot = sum(a * b for a, b in zip(hint, known))
+            other = [a - dot * b for a, b in zip(hint, known)]
+        if other is None or length(other) < 1e-6:
+            helper = [1.0, 0.0, 0.0] if abs(known[0]) < 0.9 else [0.0, 1.0, 0.0]
+            other = cross(known, helper)
+        other_length = length(other)
+        axes[missing[0]] = [value / other_length for value in other]
+        missing = missing[1:]
+    if len(missing) == 1:
+        index = missing[0]
+        axis = cross(axes[(index + 1) % 3], axes[(index + 2) % 3])
+        axis_length = length(axis)
+        axes[index] = [value / axis_length for value in axis]
+
+    return axes
+
+
+def closest_angle(angle, previous):
+    """
+    Same angle turned by full turns to be the closest to the previous angle.
+    :param angle: Angle in degrees
+    :param previous: Previous angle in degrees
+    :return: Angle in degrees
+    """
+    return angle + 360.0 * round((previous - angle) / 360.0)
+
+
+def decompose_matrix(matrix, previous_rotate=None):
+    """
+    Translate, Rotate and Scale of a Maya World Matrix, shear is ignored.
+    Rotations are in degrees, in XYZ order, and the closest to the previous rotation when given,
+    which keeps animated rotations continuous. Axes with a zero Scale are taken from the previous rotation.
+    :param matrix: World Matrix, 16 floats
+    :param previous_rotate: Previous [Rotate X, Rotate Y, Rotate Z], or None
+    :return: Dictionary of Maya Transform Parameter to value
+    """
+    rows = [list(matrix[0:3]), list(matrix[4:7]), list(matrix[8:11])]
+    scales = [length(row) for row in rows]
+    axes = rotation_axes(rows, scales, previous_rotate)
+
+    # Mirrored Matrix, the mirror goes to Scale X
+    if sum(a * b for a, b in zip(cross(axes[0], axes[1]), axes[2])) < 0:
+        scales[0] = -scales[0]
+        axes[0] = [-value for value in axes[0]]
+
+    # Rotate X * Rotate Y * Rotate Z
+    sin_y = max(-1.0, min(1.0, -axes[0][2]))
+    rotate_y = math.asin(sin_y)
+    if math.cos(rotate_y) > 1e-9:
+        rotate_x = math.atan2(axes[1][2], axes[2][2])
+        rotate_z = math.atan2(axes[0][1], axes[0][0])
+    else:
+        # Gimbal lock, only Rotate X - sin(Rotate Y) * Rotate Z is known, Rotate Z is kept from the previous rotation
+        rotate_z = math.radians(previous_rotate[2]) if previous_rotate is not None else 0.0
+        rotate_x = math.atan2(sin_y * axes[1][0], axes[1][1]) + sin_y * rotate_z
+    rotate = [math.degrees(rotate_x), math.degrees(rotate_y), math.degrees(rotate_z)]
+
+    # Closest of the two equivalent rotations
+    if previous_rotate is not None:
+        candidates = []
+        for candidate in [rotate, [rotate[0] + 180.0, 180.0 - rotate[1], rotate[2] + 180.0]]:
+            candidate = [closest_angle(angle, previous) for angle, previous in zip(candidate, previous_rotate)]
+            candidates.append((sum(abs(angle - previous) for angle, previous in zip(candidate, previous_rotate)),
+                               candidate))
+        rotate = min(candidates)[1]
+
+    return dict(zip(transform_parms, list(matrix[12:15]) + rotate + scales))
@@ -6,9 +6,16 @@ Loads UI inside Houdini
 
 """
 
+import time
+
 from PySide2 import QtCore, QtWidgets, QtGui
 
 from logic.houdini_logic import *
+from logic import houdini_live_link
+from logic.progress import new_timings, progress_message
+
+# Seconds between two progress updates, the UI is redrawn on every update
+progress_interval = 0.1
 
 
 def hou_main_window():
@@ -23,13 +30,15 @@ class HoudiniUI(QtWidgets.QWidget):
     """
     Houdini UI Class
     """
-    def __init__(self, title, version, parent=hou_main_window()):
+    def __init__(self, title, version, parent=None):
         """
         Houdini UI Init
         :param title: Tool Name
         :param version: Tool Version
-        :param parent: Parent Window
+        :param parent: Parent Window, the Houdini Main Window if None
         """
+        if parent is None:
+            parent = hou_main_window()
         super(HoudiniUI, self).__init__(parent)
 
         self.title = title
@@ -38,7 +47,7 @@ class HoudiniUI(QtWidgets.QWidget):
         self.setWindowTitle("{0} v{1}".format(self.title, self.version))
 
         self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.Window)
-        self.setFixedSize(600, 160)
+        self.setFixedSize(600, 185)
 
         self.create_widgets()
         self.create_layouts()
@@ -67,6 +76,10 @@ class HoudiniUI(QtWidgets.QWidget):
 
         self.arnold_check = QtWidgets.QCheckBox("Arnold")
 
+        # Renderer plugins, see logic/renderer_backends.py
+        self.plugin_checks = [QtWidgets.QCheckBox(renderer) for renderer in renderer_backends
+                              if renderer not in ["Mantra", "Arnold"]]
+
         self.scale_label = QtWidgets.QLabel("Scale:")
         self.scale_label.setAlignment(QtCore.Qt.AlignRight)
 
@@ -76,8 +89,27 @@ class HoudiniUI(QtWidgets.QWidget):
         self.scale_double_spin.setDecimals(3)
         self.scale_double_spin.setRange(0.001, 1000)
 
+        self.options_label = QtWidgets.QLabel("Options:")
+        self.options_label.setAlignment(QtCore.Qt.AlignRight)
+
+        self.update_check = QtWidgets.QCheckBox("Update Existing")
+        self.update_check.setToolTip("Only set Parameters which differ from the file on existing Lights "
+                                     "and only create new Lights.")
+
+        self.remove_missing_check = QtWidgets.QCheckBox("Remove Missing")
+        self.remove_missing_check.setToolTip("Delete Lights previously imported from this file "
+                                             "which are not in it anymore.")
+
+        self.texture_check = QtWidgets.QCheckBox("Check Textures")
+        self.texture_check.setToolTip("Check for missing textures and formats other than EXR before importing.")
+
         self.import_btn = QtWidgets.QPushButton("Import Lights")
 
+        self.live_link_btn = QtWidgets.QPushButton("Stop Live Link" if houdini_live_link.is_subscribed()
+                                                   else "Live Link")
+        self.live_link_btn.setToolTip("Update the Lights published by Maya while they are edited, "
+                                      "with the Renderer and Scale options")
+
         self.vertical_spacer = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum,
                                                      QtWidgets.QSizePolicy.Expanding)
 
@@ -102,6 +134,8 @@ class HoudiniUI(QtWidgets.QWidget):
         self.scale_layout = QtWidgets.QHBoxLayout()
         self.scale_layout.addWidget(self.mantra_check, 1)
         self.scale_layout.addWidget(self.arnold_check, 1)
+        for plugin_check in self.plugin_checks:
+            self.scale_layout.addWidget(plugin_check, 1)
         self.scale_layout.addWidget(self.scale_label, 1)
         self.scale_layout.addWidget(self.scale_double_spin, 1)
 
@@ -109,6 +143,16 @@ class HoudiniUI(QtWidgets.QWidget):
         self.grid_layout.addLayout(self.scale_layout, 1, 1)
         self.grid_layout.addWidget(self.import_btn, 1, 2)
 
+        self.options_layout = QtWidgets.QHBoxLayout()
+        self.options_layout.addWidget(self.update_check, 1)
+        self.options_layout.addWidget(self.remove_missing_check, 1)
+        self.options_layout.addWidget(self.texture_check, 1)
+        self.options_layout.addStretch(1)
+
+        self.grid_layout.addWidget(self.options_label, 2, 0)
+        self.grid_layout.addLayout(self.options_layout, 2, 1)
+        self.grid_layout.addWidget(self.live_link_btn, 2, 2)
+
         self.grid_layout.setColumnStretch(0, 1)
         self.grid_layout.setColumnStretch(1, 6)
         self.grid_layout.setColumnStretch(2, 1)
@@ -132,6 +176,7 @@ class HoudiniUI(QtWidgets.QWidget):
         """
         self.import_open.clicked.connect(self.import_json_file_path)
         self.import_btn.clicked.connect(self.import_lights)
+        self.live_link_btn.clicked.connect(self.toggle_live_link)
 
     def import_json_file_path(self):
         """
@@ -139,15 +184,82 @@ class HoudiniUI(QtWidgets.QWidget):
         :return: None
         """
         current_directory = hou.homeHoudiniDirectory()
-        save_file, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open", current_directory, "JSON Files (*.json)")
+        save_file, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open", current_directory,
+                                                             "Light Files (*.json *.jsonl *.mhl)")
         self.import_line.setText(save_file)
 
+    def checked_renderers(self):
+        """
+        Renderers of the checked Renderer Checkboxes, plugins included
+        :return: List of Renderer names
+        """
+        checks = [self.mantra_check, self.arnold_check] + self.plugin_checks
+        return [check.text() for check in checks if check.isChecked()]
+
     def import_lights(self):
         """
-        Import Lights from Json file
+        Import Lights from Json file, with a progress bar and a Cancel button
         :return: None
         """
-        import_json_file(self.import_line.text(), self.scale_double_spin.value(),
-                         self.mantra_check.isChecked(), self.arnold_check.isChecked())
+        self.progress_dialog = QtWidgets.QProgressDialog("Importing Lights", "Cancel", 0, 100, self)
+        self.progress_dialog.setWindowTitle(self.title)
+        self.progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_started = time.time()
+        self.progress_updated = 0.0
+
+        timings = new_timings()
+        try:
+            registry = import_json_file(self.import_line.text(), self.scale_double_spin.value(),
+                                        self.mantra_check.isChecked(), self.arnold_check.isChecked(),
+                                        self.import_progress, self.update_check.isChecked(),
+                                        self.remove_missing_check.isChecked(), self.texture_check.isChecked(),
+                                        timings, self.checked_renderers())
+        finally:
+            self.progress_dialog.close()
+
+        # Keep the UI open if cancelled
+        if registry is None:
+            return
+
+        # import_json_file() shows the timings on the Status Bar, with its warnings and texture report
         self.close()
         self.deleteLater()
+
+    def import_progress(self, light_count, file_progress):
+        """
+        Show Import progress and remaining time on the progress bar and Status Bar
+        :param light_count: Number of Lights imported
+        :param file_progress: Fraction of the Json file read
+        :return: True if the Import is cancelled
+        """
+        # Redraw at most every progress_interval seconds
+        now = time.time()
+        if now - self.progress_updated < progress_interval and file_progress < 1.0:
+            return False
+        self.progress_updated = now
+
+        message = progress_message("Importing Lights", light_count, file_progress, self.progress_started)
+        self.progress_dialog.setLabelText(message)
+        self.progress_dialog.setValue(int(file_progress * 100))
+        hou.ui.setStatusMessage(message)
+        return self.progress_dialog.wasCanceled()
+
+    def toggle_live_link(self):
+        """
+        Start or stop updating the Lights published by Maya, the UI stays open
+        :return: None
+        """
+        if houdini_live_link.is_subscribed():
+            houdini_live_link.stop_subscriber()
+            self.live_link_btn.setText("Live Link")
+            return
+
+        try:
+            houdini_live_link.start_subscriber(self.scale_double_spin.value(), self.mantra_check.isChecked(),
+                                               self.arnold_check.isChecked(), renderers=self.checked_renderers())
+        except (OSError, IOError) as error:
+            hou.ui.setStatusMessage("Live Link: Maya is not publishing Lights ({0}).".format(error),
+                                    severity=hou.severityType.Warning)
+            return
+        self.live_link_btn.setText("Stop Live Link")
@@ -0,0 +1,181 @@
+"""
+
+launcher.py
+
+Shows the Maya or Houdini UI from the shelf script "ui_launcher.py".
+
+The host is detected from the modules it has already loaded, and only its UI and logic modules are imported.
+Modules and the UI window are kept between shelf clicks, and only loaded again when a source file of the tool changes.
+
+"""
+
+import os
+import sys
+
+# Host: (UI module, UI class name)
+host_ui_modules = {"maya": ("ui.maya_ui", "MayaUI"),
+                   "houdini": ("ui.houdini_ui", "HoudiniUI")}
+
+# Host: Module loaded by the host at startup, Environment variable set by the host
+host_markers = [("maya", "maya.cmds", "MAYA_LOCATION"),
+                ("houdini", "hou", "HFS")]
+
+# Tool packages, modules of these packages are loaded again when their source file changes
+tool_packages = ["ui", "logic"]
+
+# Launcher state between shelf clicks
+# mtimes: Module name: Source file modification time when loaded
+# window: UI window of the last click
+launcher_state = {"mtimes": {}, "window": None}
+
+
+def host_dcc():
+    """
+    Host application, from the modules it has already loaded, or from its environment.
+    :return: "maya", "houdini" or None
+    """
+    for host, module, variable in host_markers:
+        if module in sys.modules:
+            return host
+    for host, module, variable in host_markers:
+        if variable in os.environ:
+            return host
+    return None
+
+
+def tool_modules():
+    """
+    Loaded modules of the tool, except this launcher which keeps the state.
+    :return: Dictionary of Module name to Module
+    """
+    return dict((name, module) for name, module in list(sys.modules.items())
+                if module is not None and name != __name__
+                and any(name == package or name.startswith(package + ".") for package in tool_packages))
+
+
+def source_mtime(module):
+    """
+    Modification time of the source file of a module.
+    :param module: Module
+    :return: Modification time, None if the module has no source file
+    """
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    if path.endswith(".pyc") and os.path.exists(path[:-1]):
+        path = path[:-1]
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def changed_modules():
+    """
+    Loaded tool modules whose source file changed since they were loaded.
+    :return: List of Module names
+    """
+    mtimes = launcher_state["mtimes"]
+    return [name for name, module in tool_modules().items()
+            if name in mtimes and source_mtime(module) != mtimes[name]]
+
+
+def close_window():
+    """
+    Close the UI window of the last click, if it still exists.
+    :return: None
+    """
+    window = launcher_state["window"]
+    launcher_state["window"] = None
+    if window is None:
+        return
+    try:
+        window.close()
+        window.deleteLater()
+    except RuntimeError:
+        pass
+
+
+def unload_tool_modules():
+    """
+    Remove the tool modules, so the next import loads them from their source files.
+    Live Links and Maya callbacks of the removed modules are stopped first, they would call into unloaded code.
+    :return: None
+    """
+    maya_live_link = sys.modules.get("logic.maya_live_link")
+    if maya_live_link is not None:
+        maya_live_link.stop_publisher()
+    houdini_live_link = sys.modules.get("logic.houdini_live_link")
+    if houdini_live_link is not None:
+        houdini_live_link.stop_subscriber()
+    maya_logic = sys.modules.get("logic.maya_logic")
+    if maya_logic is not None:
+        maya_logic.remove_callbacks()
+
+    for name in tool_modules():
+        del sys.modules[name]
+    launcher_state["mtimes"].clear()
+
+
+def load_ui_class(host):
+    """
+    UI class of a host, its modules are imported only once and again when their source files change.
+    :param host: "maya" or "houdini"
+    :return: UI class
+    """
+    module_name, class_name = host_ui_modules[host]
+    if changed_modules():
+        close_window()
+        unload_tool_modules()
+
+    __import__(module_name)
+    module = sys.modules[module_name]
+
+    # Modification times of the modules just loaded
+    mtimes = launcher_state["mtimes"]
+    for name, tool_module in tool_modules().items():
+        if name not in mtimes:
+            mtimes[name] = source_mtime(tool_module)
+
+    return getattr(module, class_name)
+
+
+def existing_window(ui_class):
+    """
+    UI window of the last click, if it still exists and comes from the current UI class.
+    :param ui_class: UI class
+    :return: UI window or None
+    """
+    window = launcher_state["window"]
+    if window is None or type(window) is not ui_class:
+        return None
+    try:
+        window.isVisible()
+    except RuntimeError:
+        # Deleted by the UI after an Export or Import
+        return None
+    return window
+
+
+def launch(title, version):
+    """
+    Show the UI of the host, keeping the window of the last click if it is still open.
+    :param title: Tool Name
+    :param version: Tool Version
+    :return: UI window, None outside of Maya and Houdini
+    """
+    host = host_dcc()
+    if host is None:
+        sys.stdout.write("Please run the script in Maya or Houdini!\n")
+        return None
+
+    ui_class = load_ui_class(host)
+    window = existing_window(ui_class)
+    if window is None:
+        window = ui_class(title, version)
+        launcher_state["window"] = window
+
+    window.show()
+    window.raise_()
+    window.activateWindow()
+    return window
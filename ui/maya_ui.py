@@ -6,11 +6,20 @@ Loads UI inside Maya
 
 """
 
+import os
+import sys
+import time
+
 from PySide2 import QtWidgets, QtCore, QtGui
 from shiboken2 import wrapInstance
 import maya.OpenMayaUI as omui
 
 from logic.maya_logic import *
+from logic import maya_live_link
+from logic.progress import new_timings, progress_message, timings_message
+
+# Seconds between two progress updates, the UI is redrawn on every update
+progress_interval = 0.1
 
 
 def maya_main_window():
@@ -26,13 +35,15 @@ class MayaUI(QtWidgets.QWidget):
     """
     Maya UI Class
     """
-    def __init__(self, title, version, parent=maya_main_window()):
+    def __init__(self, title, version, parent=None):
         """
         Maya UI Init
         :param title: Tool Name
         :param version: Tool Version
-        :param parent: Parent Window
+        :param parent: Parent Window, the Maya Main Window if None
         """
+        if parent is None:
+            parent = maya_main_window()
         super(MayaUI, self).__init__(parent)
 
         self.title = title
@@ -41,7 +52,7 @@ class MayaUI(QtWidgets.QWidget):
         self.setWindowTitle("{0} v{1}".format(self.title, self.version))
 
         self.setWindowFlags(self.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.Window)
-        self.setFixedSize(550, 110)
+        self.setFixedSize(740, 110)
 
         self.create_widgets()
         self.create_layouts()
@@ -62,8 +73,25 @@ class MayaUI(QtWidgets.QWidget):
 
         self.export_open = QtWidgets.QPushButton("Browse")
 
+        self.resume_check = QtWidgets.QCheckBox("Resume")
+        self.resume_check.setToolTip("Json Lines only: keep the Lights already exported and export the remaining ones")
+
+        self.animation_check = QtWidgets.QCheckBox("Animation")
+        self.animation_check.setToolTip("Json and Json Lines only: export every frame of the playback range")
+
+        self.groups_check = QtWidgets.QCheckBox("Groups")
+        self.groups_check.setToolTip("Also export the Lights anywhere under selected groups")
+
+        self.kelvin_check = QtWidgets.QCheckBox("Kelvin")
+        self.kelvin_check.setToolTip("Export Color Temperatures in Kelvin, Houdini resolves them to Colors")
+
         self.export_btn = QtWidgets.QPushButton("Export Lights")
 
+        self.live_link_btn = QtWidgets.QPushButton("Stop Live Link" if maya_live_link.is_publishing()
+                                                   else "Start Live Link")
+        self.live_link_btn.setToolTip("Publish the selected Lights to Houdini while they are edited, "
+                                      "with the Groups and Kelvin options")
+
         self.vertical_spacer = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum,
                                                      QtWidgets.QSizePolicy.Expanding)
 
@@ -84,7 +112,12 @@ class MayaUI(QtWidgets.QWidget):
         self.export_layout.addWidget(self.export_label)
         self.export_layout.addWidget(self.export_line)
         self.export_layout.addWidget(self.export_open)
+        self.export_layout.addWidget(self.resume_check)
+        self.export_layout.addWidget(self.animation_check)
+        self.export_layout.addWidget(self.groups_check)
+        self.export_layout.addWidget(self.kelvin_check)
         self.export_layout.addWidget(self.export_btn)
+        self.export_layout.addWidget(self.live_link_btn)
 
         self.info_layout = QtWidgets.QHBoxLayout()
         self.info_layout.addWidget(self.author_label)
@@ -105,6 +138,7 @@ class MayaUI(QtWidgets.QWidget):
         """
         self.export_open.clicked.connect(self.get_json_file_path)
         self.export_btn.clicked.connect(self.export_json_file)
+        self.live_link_btn.clicked.connect(self.toggle_live_link)
 
     def get_json_file_path(self):
         """
@@ -115,14 +149,78 @@ class MayaUI(QtWidgets.QWidget):
         data_folder = os.path.join(current_directory, "data")
         if os.path.exists(data_folder):
             current_directory = data_folder
-        save_file, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save", current_directory, "JSON Files (*.json)")
+        save_file, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save", current_directory,
+                                                             "JSON Files (*.json);;JSON Lines Files (*.jsonl);;"
+                                                             "Binary Light Rig Files (*.mhl)")
         self.export_line.setText(save_file)
 
     def export_json_file(self):
         """
-        Export Lights to Json file
+        Export Lights to Json file, with a progress bar and a Cancel button
         :return: None
         """
-        export_json_file(self.export_line.text())
+        self.progress_label = "Exporting Frames" if self.animation_check.isChecked() else "Exporting Lights"
+        self.progress_dialog = QtWidgets.QProgressDialog(self.progress_label, "Cancel", 0, 100, self)
+        self.progress_dialog.setWindowTitle(self.title)
+        self.progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_started = time.time()
+        self.progress_updated = 0.0
+
+        timings = new_timings()
+        try:
+            if self.animation_check.isChecked():
+                exported = export_animation_file(self.export_line.text(), kelvin=self.kelvin_check.isChecked(),
+                                                 recursive=self.groups_check.isChecked(),
+                                                 progress_callback=self.export_progress, timings=timings)
+            else:
+                exported = export_json_file(self.export_line.text(), self.resume_check.isChecked(),
+                                            kelvin=self.kelvin_check.isChecked(),
+                                            recursive=self.groups_check.isChecked(),
+                                            progress_callback=self.export_progress, timings=timings)
+        finally:
+            self.progress_dialog.close()
+
+        # Keep the UI open if cancelled
+        if not exported:
+            return
+
+        sys.stdout.write("Export timings: {0}\n".format(timings_message(timings)))
         self.close()
         self.deleteLater()
+
+    def export_progress(self, count, fraction):
+        """
+        Show Export progress and remaining time on the progress bar
+        :param count: Number of Lights or frames exported
+        :param fraction: Fraction of the Export done
+        :return: True if the Export is cancelled
+        """
+        # Redraw at most every progress_interval seconds
+        now = time.time()
+        if now - self.progress_updated < progress_interval and fraction < 1.0:
+            return False
+        self.progress_updated = now
+
+        self.progress_dialog.setLabelText(progress_message(self.progress_label, count, fraction,
+                                                           self.progress_started))
+        self.progress_dialog.setValue(int(fraction * 100))
+        return self.progress_dialog.wasCanceled()
+
+    def toggle_live_link(self):
+        """
+        Start or stop publishing the selected Lights to Houdini, the UI stays open
+        :return: None
+        """
+        if maya_live_link.is_publishing():
+            maya_live_link.stop_publisher()
+            self.live_link_btn.setText("Start Live Link")
+            return
+
+        try:
+            maya_live_link.start_publisher(kelvin=self.kelvin_check.isChecked(),
+                                           recursive=self.groups_check.isChecked())
+        except ValueError as error:
+            cmds.warning(str(error))
+            return
+        self.live_link_btn.setText("Stop Live Link")
@@ -49,33 +49,9 @@ version = str(1.0)
 
 
 def main():
-    if sys.version[0] == "3":
-        import importlib
-        try:
-            from ui import maya_ui
-            importlib.reload(maya_ui)
-            maya_main_ui = maya_ui.MayaUI(title, version)
-            maya_main_ui.show()
-        except ModuleNotFoundError:
-            from ui import houdini_ui
-            importlib.reload(houdini_ui)
-            houdini_main_ui = houdini_ui.HoudiniUI(title, version)
-            houdini_main_ui.show()
-        except ModuleNotFoundError:
-            sys.stdout.write("Please run the script in Maya or Houdini!\n")
-    else:
-        try:
-            from ui import maya_ui
-            reload(maya_ui)
-            maya_main_ui = maya_ui.MayaUI(title, version)
-            maya_main_ui.show()
-        except ImportError:
-            from ui import houdini_ui
-            reload(houdini_ui)
-            houdini_main_ui = houdini_ui.HoudiniUI(title, version)
-            houdini_main_ui.show()
-        except ImportError:
-            sys.stdout.write("Please run the script in Maya or Houdini!\n")
+    # Modules and the UI window are kept between clicks, see ui/launcher.py
+    from ui import launcher
+    launcher.launch(title, version)
 
 
 main()